@@ -0,0 +1,89 @@
+"""
+This script compares the time to restore an authenticated session between the per-cookie `add_cookie` loop
+of `auth_utils.apply_cookies` (first visit, one command per cookie, storage script and `refresh()`) and the
+bulk `auth_utils.restore_session` (one `Network.setCookies` call and a single navigation), against the
+cookie-checking `/session` page of the local fixture server.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_cookie_restore --samples 10 --cookies 20
+"""
+
+# Import all the necessary libraries form Selenium
+from selenium.webdriver.common.by import By
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer, SESSION_COOKIE, SESSION_PATH
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.auth_utils import LOGGED_IN_INDICATOR, apply_cookies, restore_session
+from src.utils.log_utils import configure_logging
+import argparse
+import statistics
+import time
+
+# Define function to build a synthetic session
+def build_session(cookies: int) -> tuple:
+    """
+    Build a session with one valid session cookie, `cookies - 1` filler cookies and a few storage items.
+
+    Returns:
+        tuple: (cookies, local_storage, session_storage)
+    """
+    expiry = int(time.time()) + 3600
+    session_cookies = [{"name": SESSION_COOKIE, "value": "valid-token", "domain": "127.0.0.1", "path": "/",
+                        "secure": False, "httpOnly": True, "expiry": expiry}]
+    session_cookies += [{"name": f"filler_{index}", "value": "x" * 32, "domain": "127.0.0.1", "path": "/",
+                         "secure": False, "httpOnly": False, "expiry": expiry} for index in range(cookies - 1)]
+    return session_cookies, {"session-token": "token", "locale": "es"}, {"tab-id": "1"}
+
+# Define function to restore the session with the per-cookie loop
+def restore_with_add_cookie(driver, url: str, cookies: list, local_storage: dict, session_storage: dict) -> None:
+    apply_cookies(driver, cookies, url)
+    driver.execute_script(
+        "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);"
+        "for (const [k, v] of Object.entries(arguments[1])) sessionStorage.setItem(k, v);",
+        local_storage, session_storage)
+    driver.refresh()
+
+# Define function to restore the session with the bulk CDP path
+def restore_with_cdp(driver, url: str, cookies: list, local_storage: dict, session_storage: dict) -> None:
+    restore_session(driver, cookies, url, local_storage, session_storage)
+
+# Define function to measure a restore function
+def measure(driver, server: FixtureServer, restore_function, session: tuple, samples: int) -> list:
+    """
+    Restore the session from a clean browser `samples` times and check the page sees it.
+
+    Returns:
+        list: The restore times in milliseconds.
+    """
+    url = server.url(SESSION_PATH)
+    timings = []
+    for _ in range(samples):
+        # Start every sample from a browser without cookies nor storage
+        driver.get("about:blank")
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": server.base_url, "storageTypes": "local_storage"})
+        start_time = time.perf_counter()
+        restore_function(driver, url, *session)
+        timings.append((time.perf_counter() - start_time) * 1000)
+        assert driver.find_elements(*LOGGED_IN_INDICATOR), "The page did not see the session cookie."
+        assert driver.execute_script("return window.__storageRestored;"), "The page did not see the storage."
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type = int, default = 10)
+    parser.add_argument("--cookies", type = int, default = 20)
+    arguments = parser.parse_args()
+    configure_logging()
+
+    session = build_session(arguments.cookies)
+    with FixtureServer() as server:
+        driver = create_chrome_driver(headless = True)
+        try:
+            print(f"{'path':>12}{'cookies':>10}{'p50 (ms)':>12}{'mean (ms)':>12}")
+            for name, restore_function in (("add_cookie", restore_with_add_cookie), ("cdp", restore_with_cdp)):
+                timings = measure(driver, server, restore_function, session, arguments.samples)
+                print(f"{name:>12}{arguments.cookies:>10}{statistics.median(timings):>12.1f}{statistics.mean(timings):>12.1f}")
+        finally:
+            close_driver(driver)
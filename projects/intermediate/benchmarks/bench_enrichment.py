@@ -0,0 +1,42 @@
+"""
+This script measures the artists/minute of the parallel enrichment runner for different worker counts
+(one browser per worker process) and tab counts (one browser, several tabs), against the local artist
+fixture pages.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_enrichment --artists 24 --workers 1 2 4 --tabs 1 2 4
+"""
+
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.enrichment_utils import enrich_artists, enrich_artists_in_tabs
+from src.utils.log_utils import configure_logging
+import argparse
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artists", type = int, default = 24)
+    parser.add_argument("--workers", type = int, nargs = "+", default = [1, 2, 4])
+    parser.add_argument("--tabs", type = int, nargs = "+", default = [1, 2, 4])
+    arguments = parser.parse_args()
+    configure_logging()
+
+    artists = [f"Artist {index}" for index in range(arguments.artists)]
+    reports = []
+    with FixtureServer() as server:
+        lookup_kwargs = {"artist_url_template": server.url("artist.html?name={artist}")}
+        for workers in arguments.workers:
+            reports.append(("processes", enrich_artists(artists, workers = workers, timeout = 30, lookup_kwargs = lookup_kwargs)))
+        driver = create_chrome_driver(headless = True, profile = "scrape")
+        try:
+            for tabs in arguments.tabs:
+                reports.append(("tabs", enrich_artists_in_tabs(driver, artists, tabs = tabs, timeout = 30, lookup_kwargs = lookup_kwargs)))
+        finally:
+            close_driver(driver)
+
+    print(f"{'mode':<10}{'count':>6}{'artists':>10}{'failed':>8}{'elapsed (s)':>14}{'artists/min':>14}")
+    for mode, report in reports:
+        print(f"{mode:<10}{report.workers:>6}{report.succeeded:>10}{len(report.errors):>8}{report.elapsed:>14.1f}{report.artists_per_minute:>14.1f}")
+    assert all(report.results == reports[0][1].results for _, report in reports), "Every run must return the same ordered results."
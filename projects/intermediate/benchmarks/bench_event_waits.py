@@ -0,0 +1,60 @@
+"""
+This script compares the time-to-detect of elements that appear with a delay, between the polling
+`WebDriverWait` used by `element_utils` and the MutationObserver wait of `wait_utils`, against a local fixture.
+The reported latency is the time between the element being inserted and the wait returning.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_event_waits --samples 20 --delays 100 750 2000
+"""
+
+# Import all the necessary libraries form Selenium
+from selenium.webdriver.common.by import By
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.wait_utils import poll_for_locator, wait_for_locator
+from src.utils.log_utils import configure_logging
+import argparse
+import statistics
+import time
+
+# Define function to measure the detection latency of a wait function
+def measure(driver, wait_function, delay_ms: int, samples: int) -> list:
+    """
+    Insert an element after `delay_ms` and measure how long after the insertion the wait returns.
+
+    Returns:
+        list: The detection latencies in milliseconds.
+    """
+    latencies = []
+    for sample in range(samples):
+        element_id = f"delayed-{delay_ms}-{sample}"
+        driver.execute_script("window.clearInserted();")
+        start_time = time.perf_counter()
+        driver.execute_script("window.scheduleInsert(arguments[0], arguments[1]);", element_id, delay_ms)
+        element = wait_function(driver, (By.CSS_SELECTOR, f"[data-testid='{element_id}']"), 10)
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        assert element is not None, f"Element {element_id} not detected."
+        latencies.append(max(0.0, elapsed_ms - delay_ms))
+    return latencies
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type = int, default = 20)
+    parser.add_argument("--delays", type = int, nargs = "+", default = [100, 750, 2000])
+    arguments = parser.parse_args()
+    configure_logging()
+
+    with FixtureServer() as server:
+        driver = create_chrome_driver(headless = True)
+        try:
+            driver.get(server.url("delayed.html"))
+            print(f"{'delay (ms)':>10}{'wait':>10}{'p50 (ms)':>12}{'p95 (ms)':>12}{'mean (ms)':>12}")
+            for delay_ms in arguments.delays:
+                for name, wait_function in (("polling", poll_for_locator), ("observer", wait_for_locator)):
+                    latencies = sorted(measure(driver, wait_function, delay_ms, arguments.samples))
+                    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                    print(f"{delay_ms:>10}{name:>10}{statistics.median(latencies):>12.1f}{p95:>12.1f}{statistics.mean(latencies):>12.1f}")
+        finally:
+            close_driver(driver)
@@ -0,0 +1,48 @@
+"""
+This script compares the artists/minute of the local backend with a Selenium Grid backend, against the local
+artist fixture pages, and prints the throughput of each Grid node. Start a standalone Grid first, e.g.:
+    docker run -d -p 4444:4444 --shm-size 2g -e SE_NODE_MAX_SESSIONS=4 selenium/standalone-chrome
+
+The browsers of the Grid must reach the fixture server, so it listens on every interface and the pages are
+requested through `--fixture-host` (e.g., "host.docker.internal" for a Grid running in Docker).
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_grid --grid http://localhost:4444 --artists 24 --local-slots 2
+"""
+
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer
+from src.utils.enrichment_utils import enrich_artists_on_grid
+from src.utils.grid_utils import DEFAULT_GRID_URL, GridBackend, LocalBackend
+from src.utils.log_utils import configure_logging
+from urllib.parse import urlparse
+import argparse
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--grid", default = DEFAULT_GRID_URL)
+    parser.add_argument("--artists", type = int, default = 24)
+    parser.add_argument("--local-slots", type = int, default = 2)
+    parser.add_argument("--fixture-host", default = "host.docker.internal")
+    arguments = parser.parse_args()
+    configure_logging()
+
+    artists = [f"Artist {index}" for index in range(arguments.artists)]
+    driver_kwargs = {"headless": True, "profile": "scrape"}
+    reports = []
+    with FixtureServer(host = "0.0.0.0") as server:
+        port = urlparse(server.base_url).port
+        for name, backend, fixture_host in (("local", LocalBackend(arguments.local_slots, **driver_kwargs), "127.0.0.1"),
+                                             ("grid", GridBackend(arguments.grid, **driver_kwargs), arguments.fixture_host)):
+            lookup_kwargs = {"artist_url_template": f"http://{fixture_host}:{port}/artist.html?name={{artist}}"}
+            reports.append((name, enrich_artists_on_grid(artists, backend, timeout = 30, lookup_kwargs = lookup_kwargs)))
+
+    print(f"{'backend':<10}{'slots':>6}{'artists':>10}{'failed':>8}{'elapsed (s)':>14}{'artists/min':>14}")
+    for name, report in reports:
+        print(f"{name:<10}{report.workers:>6}{report.succeeded:>10}{len(report.errors):>8}{report.elapsed:>14.1f}{report.artists_per_minute:>14.1f}")
+    print(f"\n{'node':<40}{'artists':>10}{'lost':>6}{'artists/min':>14}")
+    for name, report in reports:
+        for node, node_report in report.nodes.items():
+            throughput = node_report.jobs / report.elapsed * 60 if report.elapsed else 0.0
+            print(f"{node:<40}{node_report.jobs:>10}{node_report.lost_sessions:>6}{throughput:>14.1f}")
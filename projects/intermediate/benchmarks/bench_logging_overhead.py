@@ -0,0 +1,84 @@
+"""
+This script measures the overhead of the logging calls of the element helpers, without a browser: the helpers
+run against an in-memory element, so the time measured is the helper itself plus its logging. It compares
+logging off, logging on (DEBUG to a file) and logging on through the queue handler, and the cost of building
+an f-string message that is then discarded.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_logging_overhead --calls 100000
+"""
+
+# Import the necessary libraries for the project
+from src.utils import element_utils
+from src.utils.log_utils import configure_logging, stop_logging
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+# Class with the element interface used by the helpers
+class InMemoryElement:
+    text = "Bohemian Rhapsody"
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return "<InMemoryElement>"
+
+# Define function to time the helpers
+def time_helpers(calls: int) -> float:
+    """
+    Call `get_element_text` and `click_element` `calls` times each.
+
+    Returns:
+        float: Microseconds per helper call.
+    """
+    element = InMemoryElement()
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        element_utils.get_element_text(element)
+        element_utils.click_element(None, element)
+    return (time.perf_counter() - start_time) / (calls * 2) * 1_000_000
+
+# Define function to time a discarded message built with an f-string and with lazy arguments
+def time_discarded_messages(calls: int) -> tuple:
+    logger = logging.getLogger("benchmarks.discarded")
+    text = InMemoryElement.text
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        logger.debug(f"Extracted text: {text}")
+    eager = (time.perf_counter() - start_time) / calls * 1_000_000
+    start_time = time.perf_counter()
+    for _ in range(calls):
+        logger.debug("Extracted text: %s", text)
+    lazy = (time.perf_counter() - start_time) / calls * 1_000_000
+    return eager, lazy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type = int, default = 100_000)
+    arguments = parser.parse_args()
+
+    log_path = os.path.join(tempfile.mkdtemp(prefix = "logging_overhead_"), "helpers.log")
+    results = []
+    for name, level, use_queue in (("off", logging.WARNING, False), ("on (DEBUG, file)", logging.DEBUG, False),
+                                   ("on (DEBUG, queue)", logging.DEBUG, True)):
+        configure_logging(level = level, use_queue = use_queue, handler = logging.FileHandler(log_path))
+        results.append((name, time_helpers(arguments.calls)))
+        stop_logging()
+
+    configure_logging(level = logging.WARNING)
+    eager, lazy = time_discarded_messages(arguments.calls)
+    print(f"{'logging':<20}{'us/helper call':>16}")
+    for name, microseconds in results:
+        print(f"{name:<20}{microseconds:>16.2f}")
+    print(f"\nDiscarded DEBUG message: f-string {eager:.3f} us, lazy %-args {lazy:.3f} us")
@@ -0,0 +1,75 @@
+"""
+This script measures the negative paths of the authentication flows against the local fixture server:
+a logged-out check, a logout and a rejected login. The single-indicator wait used before the probe is
+measured once on the logged-out check, since it always takes its whole timeout.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_login_probe --samples 5
+"""
+
+# Import all the necessary libraries form Selenium
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer, SESSION_PATH
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.auth_utils import LOGGED_IN_INDICATOR, is_logged_in, login_with_credentials, logout
+from src.utils.log_utils import configure_logging
+import argparse
+import statistics
+import time
+
+# Define function to run the check used before the probe: a wait for the logged-in indicator only
+def single_indicator_check(driver, timeout: float) -> bool:
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(LOGGED_IN_INDICATOR))
+        return True
+    except TimeoutException:
+        return False
+
+# Define function to time a function
+def timed(function, *args, **kwargs) -> tuple:
+    start_time = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, (time.perf_counter() - start_time) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type = int, default = 5)
+    parser.add_argument("--legacy-timeout", type = float, default = 5.0)
+    arguments = parser.parse_args()
+    configure_logging()
+
+    with FixtureServer() as server:
+        driver = create_chrome_driver(headless = True)
+        timings = {"logged-out check (single indicator)": [], "logged-out check (probe)": [],
+                   "logout": [], "rejected login": []}
+        try:
+            driver.get(server.url(SESSION_PATH))
+            result, elapsed = timed(single_indicator_check, driver, arguments.legacy_timeout)
+            assert result is False
+            timings["logged-out check (single indicator)"].append(elapsed)
+
+            for _ in range(arguments.samples):
+                driver.delete_all_cookies()
+                driver.get(server.url(SESSION_PATH))
+                result, elapsed = timed(is_logged_in, driver)
+                assert result is False
+                timings["logged-out check (probe)"].append(elapsed)
+
+                result, elapsed = timed(login_with_credentials, driver, "user", "wrong", server.url("login.html"))
+                assert result is False
+                timings["rejected login"].append(elapsed)
+
+                assert login_with_credentials(driver, "user", "secret", server.url("login.html"))
+                result, elapsed = timed(logout, driver)
+                assert result is True
+                timings["logout"].append(elapsed)
+
+            print(f"{'path':>38}{'samples':>10}{'p50 (ms)':>12}{'max (ms)':>12}")
+            for name, values in timings.items():
+                print(f"{name:>38}{len(values):>10}{statistics.median(values):>12.1f}{max(values):>12.1f}")
+        finally:
+            close_driver(driver)
@@ -0,0 +1,72 @@
+"""
+This script measures the memory per track and the cost of an aggregation for the record shapes of the scrapers,
+without a browser: the positional tuples of `test_02.py`, the dicts of `extract_utils.iter_list_items`, the
+`record_utils.Track` records and their columns from `record_utils.to_columns`. The string shapes re-parse
+the play counts on every aggregation, the typed shapes parse them once.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_records --tracks 100000
+"""
+
+# Import the necessary libraries for the project
+from src.utils.record_utils import MISSING, Track, parse_count, parse_duration, to_columns
+from src.utils.log_utils import configure_logging
+import argparse
+import gc
+import time
+import tracemalloc
+
+# Define function to build the text rows of a synthetic playlist
+def build_rows(tracks: int) -> list:
+    return [(str(index + 1), f"Song {index}", [f"Artist {index % 97}", f"Artist {index % 89}"],
+             f"{1_000_000 + index * 7919:,}".replace(",", "."), f"Album {index % 211}", f"{2 + index % 4}:{index % 60:02d}")
+            for index in range(tracks)]
+
+# Define function to measure the memory of the records built by a function
+def measure(build) -> tuple:
+    """
+    Measure the memory still allocated once the records are built, strings included.
+
+    Returns:
+        tuple: (records, bytes allocated)
+    """
+    gc.collect()
+    tracemalloc.start()
+    records = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return records, allocated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tracks", type = int, default = 100_000)
+    arguments = parser.parse_args()
+    configure_logging()
+
+    tracks = arguments.tracks
+    fields = ("position", "name", "artists", "reproductions", "album", "duration")
+    # Every shape is built from freshly scraped text, so the strings it keeps are measured too
+    shapes = {
+        "tuples": (lambda: build_rows(tracks),
+                   lambda records: sum(int(record[3].replace(".", "")) for record in records)),
+        "dicts": (lambda: [dict(zip(fields, row)) for row in build_rows(tracks)],
+                  lambda records: sum(parse_count(record["reproductions"]) for record in records)),
+        "Track": (lambda: [Track.from_record(dict(zip(fields, row))) for row in build_rows(tracks)],
+                  lambda records: sum(record.reproductions for record in records)),
+        "columns": (lambda: to_columns([Track.from_record(dict(zip(fields, row))) for row in build_rows(tracks)]),
+                    lambda columns: sum(value for value in columns["reproductions"] if value != MISSING)),
+    }
+
+    print(f"{'shape':<10}{'bytes/track':>14}{'sum plays (ms)':>16}")
+    totals = set()
+    for name, (build, aggregate) in shapes.items():
+        records, allocated = measure(build)
+        start_time = time.perf_counter()
+        totals.add(aggregate(records))
+        elapsed = (time.perf_counter() - start_time) * 1000
+        print(f"{name:<10}{allocated / tracks:>14.0f}{elapsed:>16.1f}")
+        del records
+    assert len(totals) == 1, f"Every shape must give the same total, got {totals}."
+    durations = sum(parse_duration(row[5]) for row in build_rows(tracks))
+    print(f"\nTotal plays: {totals.pop():,}, total duration: {durations / 3600:.1f} h")
@@ -0,0 +1,79 @@
+"""
+This script compares the page load time and the downloaded resources of the default and the scrape
+Chrome profiles against a local fixture page with images, fonts, media and a tracking script.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_scrape_profile --iterations 10
+"""
+
+# Import all the necessary libraries form Selenium
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.log_utils import configure_logging
+import argparse
+import statistics
+import time
+
+# Constants values for the benchmark
+FIXTURE_PAGE = "scrape_profile.html"
+ROWS_LOCATOR = (By.CSS_SELECTOR, "[data-testid='fixture-rows'] .row")
+# The local tracker does not live on a tracking domain, so it is blocked explicitly
+FIXTURE_BLOCKED_URL_PATTERNS = ["*/assets/tracker*"]
+RESOURCES_SCRIPT = """
+const entries = performance.getEntriesByType('resource');
+return [entries.length, entries.reduce((total, entry) => total + (entry.transferSize || 0), 0)];
+"""
+
+# Define function to measure a single profile
+def measure_profile(url: str, profile: str, iterations: int) -> dict:
+    """
+    Load the fixture page several times with the given profile and measure the time until the rows are present.
+
+    Args:
+        url (str): The fixture page URL.
+        profile (str): The profile name passed to `create_chrome_driver`.
+        iterations (int): Number of page loads to measure.
+
+    Returns:
+        dict: The median and mean load time in seconds, and the resources requested per load.
+    """
+    blocked = FIXTURE_BLOCKED_URL_PATTERNS if profile == "scrape" else None
+    driver = create_chrome_driver(headless = True, profile = profile, blocked_url_patterns = blocked)
+    try:
+        timings, resources, transferred = [], 0, 0
+        for _ in range(iterations):
+            driver.get("about:blank")
+            start_time = time.perf_counter()
+            driver.get(url)
+            WebDriverWait(driver, 30).until(EC.presence_of_all_elements_located(ROWS_LOCATOR))
+            timings.append(time.perf_counter() - start_time)
+            resources, transferred = driver.execute_script(RESOURCES_SCRIPT)
+        return {
+            "profile": profile,
+            "median_s": statistics.median(timings),
+            "mean_s": statistics.mean(timings),
+            "resources": resources,
+            "transferred_bytes": transferred,
+        }
+    finally:
+        close_driver(driver)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type = int, default = 10)
+    arguments = parser.parse_args()
+    configure_logging()
+
+    with FixtureServer() as server:
+        results = [measure_profile(server.url(FIXTURE_PAGE), profile, arguments.iterations) for profile in ("default", "scrape")]
+
+    print(f"{'profile':<10}{'median (s)':>12}{'mean (s)':>12}{'resources':>12}{'bytes':>14}")
+    for result in results:
+        print(f"{result['profile']:<10}{result['median_s']:>12.3f}{result['mean_s']:>12.3f}{result['resources']:>12}{result['transferred_bytes']:>14}")
+    speedup = results[0]["median_s"] / results[1]["median_s"] if results[1]["median_s"] else float("inf")
+    print(f"Scrape profile speedup (median): {speedup:.2f}x")
@@ -0,0 +1,76 @@
+"""
+This script compares the per-element extraction of the tracklist rows used in `test_02.py`
+(six `find_element` calls and six `.text` reads per row) with the single `execute_script`
+extractor of `extract_utils`, against a local fixture tracklist.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.bench_tracklist_extractor --rows 200 --iterations 5
+"""
+
+# Import all the necessary libraries form Selenium
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.extract_utils import TRACKLIST_ROW_LOCATOR, TRACKLIST_FIELDS, extract_tracklist_rows
+from src.utils.log_utils import configure_logging
+import argparse
+import statistics
+import time
+
+# Define function with the per-element path of test_02.py
+def extract_per_element(driver) -> list:
+    """
+    Extract the tracklist rows with one `find_element` and one `.text` read per field.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+
+    Returns:
+        list: One dict per track with the same keys as `extract_tracklist_rows`.
+    """
+    rows = []
+    for song in driver.find_elements(*TRACKLIST_ROW_LOCATOR):
+        record = {}
+        for name, field in TRACKLIST_FIELDS.items():
+            text = song.find_element(*field.locator).text.strip()
+            record[name] = [part.strip() for part in text.split(field.split) if part.strip()] if field.split else text
+        rows.append(record)
+    return rows
+
+# Define function to time an extraction function
+def time_extraction(driver, extract, iterations: int) -> tuple:
+    timings, rows = [], []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        rows = extract(driver)
+        timings.append(time.perf_counter() - start_time)
+    return statistics.median(timings), rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type = int, default = 200)
+    parser.add_argument("--iterations", type = int, default = 5)
+    arguments = parser.parse_args()
+    configure_logging()
+
+    with FixtureServer() as server:
+        driver = create_chrome_driver(headless = True)
+        try:
+            driver.get(server.url(f"tracklist.html?rows={arguments.rows}"))
+            WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, TRACKLIST_ROW_LOCATOR[1])))
+            per_element_s, per_element_rows = time_extraction(driver, extract_per_element, arguments.iterations)
+            batch_s, batch_rows = time_extraction(driver, extract_tracklist_rows, arguments.iterations)
+        finally:
+            close_driver(driver)
+
+    assert per_element_rows == batch_rows, "Both extraction paths must return the same rows."
+    commands_per_element = 1 + len(per_element_rows) * len(TRACKLIST_FIELDS) * 2
+    print(f"Rows extracted: {len(batch_rows)}")
+    print(f"{'path':<14}{'median (s)':>12}{'rows/s':>12}{'commands':>12}")
+    print(f"{'per-element':<14}{per_element_s:>12.3f}{len(per_element_rows) / per_element_s:>12.0f}{commands_per_element:>12}")
+    print(f"{'batch':<14}{batch_s:>12.3f}{len(batch_rows) / batch_s:>12.0f}{1:>12}")
+    print(f"Speedup: {per_element_s / batch_s:.1f}x")
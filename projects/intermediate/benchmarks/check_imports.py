@@ -0,0 +1,53 @@
+"""
+This script checks that every utils module and every benchmark script can be imported with the installed
+dependencies (see the root `requirements.txt`). Each module is imported in a fresh interpreter, so a module
+that only works because another one was imported first is reported too.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.check_imports
+"""
+
+# Import the necessary libraries for the project
+import argparse
+import glob
+import os
+import subprocess
+import sys
+
+# Constants values for the check
+PACKAGES = ("src.utils", "benchmarks")
+
+# Define function to list the modules of a package
+def list_modules(package: str) -> list:
+    directory = package.replace(".", os.sep)
+    return sorted(f"{package}.{os.path.splitext(os.path.basename(path))[0]}"
+                  for path in glob.glob(os.path.join(directory, "*.py")) if not path.endswith("__init__.py"))
+
+# Define function to import a module in a fresh interpreter
+def check_module(module: str) -> str:
+    """
+    Import a module in a new Python process.
+
+    Returns:
+        str: The last line of the error, empty if the import worked.
+    """
+    process = subprocess.run([sys.executable, "-c", f"import {module}"], capture_output = True, text = True)
+    if process.returncode == 0:
+        return ""
+    lines = process.stderr.strip().splitlines()
+    return lines[-1] if lines else f"exit code {process.returncode}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    failures = 0
+    for package in PACKAGES:
+        for module in list_modules(package):
+            error = check_module(module)
+            failures += bool(error)
+            print(f"{'FAIL' if error else 'ok':<6}{module}{'  ' + error if error else ''}")
+    if failures:
+        sys.exit(f"{failures} modules failed to import.")
+    print("\nEvery module imports.")
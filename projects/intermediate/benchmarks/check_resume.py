@@ -0,0 +1,91 @@
+"""
+This script checks that a scrape killed halfway and resumed from its checkpoint produces the same
+output file as an uninterrupted scrape, against the local virtualized tracklist fixture.
+
+The crash is simulated by raising from inside the sink without flushing or aborting it, so the
+records still buffered are lost exactly as they would be if the process was killed.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.check_resume --rows 500 --crash-after 230
+"""
+
+# Import all the necessary libraries form Selenium
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer
+from src.utils.checkpoint_utils import CheckpointStore
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.extract_utils import TRACKLIST_ROW_LOCATOR
+from src.utils.scrape_utils import scrape_list, scrape_list_to_file, open_resumable_sink
+from src.utils.log_utils import configure_logging
+import argparse
+import filecmp
+import os
+import tempfile
+
+# Class used to simulate the process being killed
+class SimulatedCrash(Exception):
+    pass
+
+# Define function to open the fixture playlist in a new driver
+def open_playlist(url: str):
+    driver = create_chrome_driver(headless = True, profile = "scrape")
+    driver.get(url)
+    WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located((By.XPATH, TRACKLIST_ROW_LOCATOR[1])))
+    return driver
+
+# Define function to scrape until the sink received a number of records, then crash
+def scrape_and_crash(url: str, path: str, target: str, checkpoint: CheckpointStore, crash_after: int) -> None:
+    driver = open_playlist(url)
+    sink = open_resumable_sink(path, target, checkpoint, buffer_size = 20)
+    original_write = sink.write
+
+    def crashing_write(record: dict) -> None:
+        if sink.records_written + len(sink._buffer) >= crash_after:
+            raise SimulatedCrash()
+        original_write(record)
+
+    sink.write = crashing_write
+    try:
+        scrape_list(driver, sink, target, checkpoint, checkpoint_every = 25)
+    except SimulatedCrash:
+        print(f"Crashed after {crash_after} records, checkpoint: {checkpoint.get_progress(target)}")
+    finally:
+        close_driver(driver)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type = int, default = 500)
+    parser.add_argument("--crash-after", type = int, default = 230)
+    parser.add_argument("--lazy-ms", type = int, default = 100)
+    arguments = parser.parse_args()
+    configure_logging()
+
+    output_dir = tempfile.mkdtemp(prefix = "resume_check_")
+    full_path = os.path.join(output_dir, "full.json")
+    resumed_path = os.path.join(output_dir, "resumed.json")
+    target = f"fixture-playlist-{arguments.rows}"
+
+    with FixtureServer() as server, CheckpointStore(os.path.join(output_dir, "checkpoints.db")) as checkpoint:
+        url = server.url(f"tracklist.html?rows={arguments.rows}&virtual=1&lazy_ms={arguments.lazy_ms}")
+        # Uninterrupted run
+        driver = open_playlist(url)
+        try:
+            scrape_list_to_file(driver, full_path, "uninterrupted")
+        finally:
+            close_driver(driver)
+        # Killed and resumed run
+        scrape_and_crash(url, resumed_path, target, checkpoint, arguments.crash_after)
+        driver = open_playlist(url)
+        try:
+            written = scrape_list_to_file(driver, resumed_path, target, checkpoint)
+            print(f"Resumed run wrote {written} records.")
+        finally:
+            close_driver(driver)
+
+    identical = filecmp.cmp(full_path, resumed_path, shallow = False)
+    print(f"Outputs in {output_dir} are {'identical' if identical else 'DIFFERENT'}.")
+    raise SystemExit(0 if identical else 1)
@@ -0,0 +1,162 @@
+"""
+This script contains a local HTTP server that serves the HTML fixtures used by the benchmarks: Spotify-like
+pages with the same ids and `data-testid` attributes as the live site (`login.html`, `/session`, `search.html`,
+`tracklist.html` and `artist.html`), plus synthetic assets.
+"""
+
+# Import the necessary libraries for the project
+from http.cookies import SimpleCookie
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from functools import partial
+from typing import Optional
+import threading
+import time
+import os
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the fixture server
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+ASSETS_PREFIX = "/assets/"
+ASSET_CONTENT_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+    ".mp4": "video/mp4",
+    ".mp3": "audio/mpeg",
+    ".js": "application/javascript",
+    ".css": "text/css",
+}
+SESSION_PATH = "/session"
+SESSION_LOGOUT_PATH = "/session/logout"
+# Cookie checked by the session page, any value starting with "valid" is a logged-in session
+SESSION_COOKIE = "sp_dc"
+SESSION_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Session</title></head>
+<body>
+    %s
+    <script>
+        // Report whether the storage of the session was restored before the page scripts ran
+        window.__storageRestored = localStorage.getItem("session-token") !== null;
+    </script>
+</body>
+</html>
+"""
+LOGGED_IN_MARKUP = """<button data-testid="user-widget-link"
+        onclick="document.getElementById('menu').hidden = false">Profile</button>
+    <div id="menu" hidden>
+        <button data-testid="user-widget-dropdown-logout" onclick="location.assign('/session/logout')">Log out</button>
+    </div>"""
+LOGGED_OUT_MARKUP = '<button data-testid="login-button" id="login-button">Log in</button>'
+
+# Class to serve the fixture files and synthetic assets
+class FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serve the files of the fixtures directory. Paths under `/assets/` return a synthetic payload
+    of `size` bytes after `latency` seconds so heavy resources can be simulated without binary files.
+    `/session` renders a logged-in or logged-out page depending on the `sp_dc` cookie, and
+    `/session/logout` expires the cookie.
+    """
+
+    def do_GET(self) -> None:
+        parsed_url = urlparse(self.path)
+        if parsed_url.path.startswith(ASSETS_PREFIX):
+            self._send_asset(parsed_url.path, parse_qs(parsed_url.query))
+        elif parsed_url.path == SESSION_PATH:
+            self._send_session_page()
+        elif parsed_url.path == SESSION_LOGOUT_PATH:
+            self._send_logout()
+        else:
+            super().do_GET()
+
+    def _send_asset(self, path: str, query: dict) -> None:
+        extension = os.path.splitext(path)[1]
+        size = int(query.get("size", [self.server.asset_size])[0])
+        latency = float(query.get("latency", [self.server.asset_latency])[0])
+        time.sleep(latency)
+        body = b"" if extension in (".js", ".css") else b"\0" * size
+        self.send_response(200)
+        self.send_header("Content-Type", ASSET_CONTENT_TYPES.get(extension, "application/octet-stream"))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_session_page(self) -> None:
+        # Render the logged-in or logged-out page depending on the session cookie sent by the browser
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        logged_in = SESSION_COOKIE in cookies and cookies[SESSION_COOKIE].value.startswith("valid")
+        body = (SESSION_PAGE % (LOGGED_IN_MARKUP if logged_in else LOGGED_OUT_MARKUP)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_logout(self) -> None:
+        # Expire the session cookie and go back to the session page
+        self.send_response(302)
+        self.send_header("Set-Cookie", f"{SESSION_COOKIE}=; Path=/; Max-Age=0")
+        self.send_header("Location", SESSION_PATH)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format % args)
+
+
+# Class to run the fixture server in a background thread
+class FixtureServer:
+    """
+    Local HTTP server for the fixtures, usable as a context manager.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind, 0 picks a free port.
+        asset_latency (float): Default seconds to wait before answering a synthetic asset.
+        asset_size (int): Default size in bytes of a synthetic asset.
+        directory (str): Directory with the fixture files.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, asset_latency: float = 0.05,
+                 asset_size: int = 50_000, directory: str = FIXTURES_DIR) -> None:
+        handler = partial(FixtureRequestHandler, directory = directory)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._server.asset_latency = asset_latency
+        self._server.asset_size = asset_size
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        """Return the absolute URL of a fixture path."""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target = self._server.serve_forever, daemon = True)
+        self._thread.start()
+        logger.info("Fixture server listening on %s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+        logger.info("Fixture server stopped.")
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -0,0 +1,229 @@
+"""
+This script runs the scraping flows against the local Spotify-like fixture pages and reports their throughput:
+the login form (`test_01.py`), the virtualized tracklist extraction (`test_02.py`) and the search and artist
+dialog lookups (`test_03.py`). For each scenario it reports the items per second or minute, the WebDriver
+commands per item and the peak RSS of the process tree. Results can be saved as a named baseline, and later
+runs compared against it.
+
+Run it from `projects/intermediate`:
+    python -m benchmarks.run_suite --save-baseline main
+    python -m benchmarks.run_suite --compare main --tolerance 0.1
+"""
+
+# Import all the necessary libraries form Selenium
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+# Import the necessary libraries for the project
+from benchmarks.fixture_server import FixtureServer
+from src.utils.auth_utils import login_with_credentials
+from src.utils.artist_utils import scrape_artist_info
+from src.utils.driver_utils import create_chrome_driver, close_driver
+from src.utils.extract_utils import TRACKLIST_ROW_LOCATOR, iter_list_items
+from src.utils.profiler_utils import CommandProfiler
+from src.utils.log_utils import configure_logging
+from typing import Any, Dict, Optional
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Constants values for the benchmark suite
+BASELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+# Metrics compared against the baselines: +1 when higher is better, -1 when lower is better
+METRIC_DIRECTIONS = {
+    "tracks_per_s": 1,
+    "artists_per_min": 1,
+    "commands_per_item": -1,
+    "login_s": -1,
+    "peak_rss_mb": -1,
+}
+
+# Class to sample the peak RSS of this process and its children (chromedriver and Chrome)
+class PeakRssSampler:
+    """
+    Sample the RSS of the process tree in a background thread. Without psutil, only the peak RSS of the
+    Python process is reported from `resource`, which does not include the browser.
+
+    Args:
+        interval (float): Seconds between two samples.
+    """
+
+    def __init__(self, interval: float = 0.1) -> None:
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _tree_rss(self) -> int:
+        process = psutil.Process()
+        total = 0
+        for member in [process] + process.children(recursive = True):
+            try:
+                total += member.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return total
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, self._tree_rss())
+
+    def __enter__(self) -> "PeakRssSampler":
+        if psutil is not None:
+            self._thread = threading.Thread(target = self._run, daemon = True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    @property
+    def peak_mb(self) -> Optional[float]:
+        if psutil is not None:
+            return self.peak_bytes / 1024 ** 2
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+        return None
+
+# Define function to run the login scenario
+def run_login(driver, server: FixtureServer, profiler: CommandProfiler, samples: int) -> Dict[str, Any]:
+    profiler.reset()
+    start_time = time.perf_counter()
+    for _ in range(samples):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        if not login_with_credentials(driver, "fixture-user", "secret", server.url("login.html")):
+            raise RuntimeError("Fixture login failed.")
+    elapsed = time.perf_counter() - start_time
+    return {"items": samples, "elapsed_s": elapsed, "login_s": elapsed / samples,
+            "commands_per_item": profiler.stats()["total"]["count"] / samples}
+
+# Define function to run the tracklist scenario
+def run_tracklist(driver, server: FixtureServer, profiler: CommandProfiler, rows: int, lazy_ms: int) -> Dict[str, Any]:
+    driver.get(server.url(f"tracklist.html?rows={rows}&virtual=1&lazy_ms={lazy_ms}"))
+    WebDriverWait(driver, 10).until(EC.presence_of_all_elements_located(TRACKLIST_ROW_LOCATOR))
+    profiler.reset()
+    start_time = time.perf_counter()
+    tracks = list(iter_list_items(driver, TRACKLIST_ROW_LOCATOR))
+    elapsed = time.perf_counter() - start_time
+    if len(tracks) != rows:
+        raise RuntimeError(f"Expected {rows} tracks, got {len(tracks)}.")
+    return {"items": len(tracks), "elapsed_s": elapsed, "tracks_per_s": len(tracks) / elapsed,
+            "commands_per_item": profiler.stats()["total"]["count"] / len(tracks)}
+
+# Define function to run the artist scenario
+def run_artists(driver, server: FixtureServer, profiler: CommandProfiler, artists: int, sections: int) -> Dict[str, Any]:
+    profiler.reset()
+    base_url = server.url(f"search.html?sections={sections}")
+    start_time = time.perf_counter()
+    for index in range(artists):
+        info = scrape_artist_info(driver, f"Artist {index}", timeout = 15, base_url = base_url)
+        if len(info["TopCities"]) != 5:
+            raise RuntimeError(f"Incomplete info for Artist {index}: {info}")
+    elapsed = time.perf_counter() - start_time
+    return {"items": artists, "elapsed_s": elapsed, "artists_per_min": artists / elapsed * 60,
+            "commands_per_item": profiler.stats()["total"]["count"] / artists}
+
+# Define function to compare the results with a baseline
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> list:
+    """
+    Compare the metrics of every scenario with a baseline.
+
+    Returns:
+        list: (scenario, metric, baseline, current, change, regressed) for each compared metric.
+    """
+    rows = []
+    for scenario, metrics in results["scenarios"].items():
+        for metric, value in metrics.items():
+            direction = METRIC_DIRECTIONS.get(metric)
+            previous = baseline.get("scenarios", {}).get(scenario, {}).get(metric)
+            if direction is None or value is None or not previous:
+                continue
+            change = (value - previous) / previous
+            rows.append((scenario, metric, previous, value, change, change * direction < -tolerance))
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type = int, default = 500)
+    parser.add_argument("--lazy-ms", type = int, default = 100)
+    parser.add_argument("--artists", type = int, default = 10)
+    parser.add_argument("--sections", type = int, default = 3)
+    parser.add_argument("--logins", type = int, default = 3)
+    parser.add_argument("--save-baseline", metavar = "NAME")
+    parser.add_argument("--compare", metavar = "NAME")
+    parser.add_argument("--tolerance", type = float, default = 0.1, help = "Relative change tolerated before a regression.")
+    arguments = parser.parse_args()
+    configure_logging()
+
+    results = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+               "parameters": {key: value for key, value in vars(arguments).items()
+                              if key not in ("save_baseline", "compare", "tolerance")},
+               "scenarios": {}}
+    profiler = CommandProfiler(tag_modules = ("element_utils", "auth_utils", "extract_utils", "artist_utils"))
+    with FixtureServer() as server:
+        for scenario in ("login", "tracklist", "artists"):
+            # Each scenario gets its own browser, so the peak RSS is measured per scenario
+            with PeakRssSampler() as sampler:
+                try:
+                    driver = create_chrome_driver(headless = True, profile = "scrape")
+                except Exception as e_driver:
+                    # Exit code 2 tells a missing browser apart from a regression (1)
+                    print(f"Could not start Chrome for the {scenario} scenario: {type(e_driver).__name__}", file = sys.stderr)
+                    sys.exit(2)
+                try:
+                    with profiler.profile(driver):
+                        if scenario == "login":
+                            metrics = run_login(driver, server, profiler, arguments.logins)
+                        elif scenario == "tracklist":
+                            metrics = run_tracklist(driver, server, profiler, arguments.rows, arguments.lazy_ms)
+                        else:
+                            metrics = run_artists(driver, server, profiler, arguments.artists, arguments.sections)
+                finally:
+                    close_driver(driver)
+            metrics["peak_rss_mb"] = sampler.peak_mb
+            results["scenarios"][scenario] = metrics
+
+    print(f"{'scenario':<12}{'items':>8}{'elapsed (s)':>13}{'throughput':>22}{'commands/item':>15}{'peak RSS (MB)':>15}")
+    for scenario, metrics in results["scenarios"].items():
+        if "tracks_per_s" in metrics:
+            throughput = f"{metrics['tracks_per_s']:.1f} tracks/s"
+        elif "artists_per_min" in metrics:
+            throughput = f"{metrics['artists_per_min']:.1f} artists/min"
+        else:
+            throughput = f"{metrics['login_s']:.2f} s/login"
+        peak_rss = f"{metrics['peak_rss_mb']:.0f}" if metrics["peak_rss_mb"] is not None else "n/a"
+        print(f"{scenario:<12}{metrics['items']:>8}{metrics['elapsed_s']:>13.2f}{throughput:>22}"
+              f"{metrics['commands_per_item']:>15.2f}{peak_rss:>15}")
+
+    exit_code = 0
+    if arguments.compare:
+        with open(os.path.join(BASELINES_DIR, f"{arguments.compare}.json"), "r", encoding = "utf-8") as file:
+            baseline = json.load(file)
+        print(f"\nCompared with baseline '{arguments.compare}' ({baseline['created_at']}):")
+        for scenario, metric, previous, value, change, regressed in compare(results, baseline, arguments.tolerance):
+            print(f"{scenario:<12}{metric:<20}{previous:>12.2f}{value:>12.2f}{change:>+10.1%}{'  REGRESSION' if regressed else ''}")
+            exit_code = 1 if regressed else exit_code
+    if arguments.save_baseline:
+        os.makedirs(BASELINES_DIR, exist_ok = True)
+        baseline_path = os.path.join(BASELINES_DIR, f"{arguments.save_baseline}.json")
+        with open(baseline_path, "w", encoding = "utf-8") as file:
+            json.dump(results, file, indent = 4)
+        print(f"Baseline saved on: {baseline_path}")
+    sys.exit(exit_code)
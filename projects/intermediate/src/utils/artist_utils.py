@@ -0,0 +1,214 @@
+"""This page contains the modular functions to look up an artist and read the data of its info dialog."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+# Import the necessary libraries for the project
+from .locator_utils import REGISTRY
+from .record_utils import parse_count
+from .scroll_utils import scroll_condition
+from .screenshot_utils import ScreenshotService
+from typing import Any, Callable, Dict, Generator, List, Optional
+from urllib.parse import quote
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the artist lookups
+DEFAULT_TIMEOUT = 10
+SPOTIFY_URL = "https://open.spotify.com/"
+SEARCHBAR_LOCATOR = REGISTRY.locator("search.input")
+ARTISTS_BUTTON_LOCATOR = REGISTRY.locator("search.artists_button")
+WORLD_NUMBER_LOCATOR = REGISTRY.locator("artist.world_number")
+ARTIST_LOCATOR_NAMES = ("top_artist", "info_button", "dialog", "data_container", "numbers", "cities")
+# Maximum seconds scrolling to find the artist info button
+SCROLL_TIMEOUT = 10
+
+# Define function to build the locators that depend on the artist name
+def artist_locators(artist: str) -> Dict[str, tuple]:
+    """
+    Build the primary locators of the artist page and the artist info dialog from the `artist.*` templates
+    of the locator registry, which caches them per artist.
+
+    Args:
+        artist (str): The artist name.
+
+    Returns:
+        Dict[str, tuple]: The top_artist, info_button, dialog, data_container, numbers and cities locators.
+    """
+    return {name: REGISTRY.locator(f"artist.{name}", artist = artist) for name in ARTIST_LOCATOR_NAMES}
+
+# Define function to build the wait conditions that try the fallbacks of a registry locator
+def located(name: str, all: bool = False, **params: Any) -> Callable[[WebDriver], Any]:
+    """
+    Build a wait condition for a locator of the registry that tries its fallback chain in order, so the
+    flows keep working when the primary candidate breaks (e.g., the English "Artists" button).
+
+    Args:
+        name (str): The name of the locator in `locator_utils.REGISTRY`.
+        all (bool): Return every matching element instead of the first one if True.
+        **params: The values of the template placeholders (e.g., `artist`).
+
+    Returns:
+        Callable: Condition for `WebDriverWait.until` or the tab scheduler.
+    """
+    return REGISTRY.condition(name, all = all, **params)
+
+# Define function to start a navigation without waiting for the page load
+def navigate(driver: WebDriver, url: str) -> None:
+    """
+    Start the navigation of the current tab to a URL and return immediately, so other tabs can work while it loads.
+    A marker is left in the old document so `page_loaded` can tell when the new document replaced it.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        url (str): The URL to open.
+    """
+    driver.execute_script("window.__navigationPending = true; window.location.assign(arguments[0]);", url)
+
+# Define the condition met once the document opened by `navigate` is ready
+def page_loaded(driver: WebDriver) -> bool:
+    """
+    Wait condition met when the document opened by `navigate` replaced the previous one and is parsed.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+
+    Returns:
+        bool: True if the new document is ready.
+    """
+    return driver.execute_script("return window.__navigationPending === undefined && document.readyState !== 'loading';")
+
+# Define function to build a condition that scrolls the page until an element is visible
+def visible_or_scroll(locator: tuple, timeout: float = SCROLL_TIMEOUT) -> Callable[[WebDriver], Any]:
+    """
+    Build a wait condition that returns the element when it is visible, and otherwise scrolls the page one step.
+    The check and the scroll are a single command, and the condition gives up when the bottom of the page is
+    reached or after `timeout` seconds.
+
+    Args:
+        locator (tuple): The locator of the element.
+        timeout (float): Maximum seconds scrolling.
+
+    Returns:
+        Callable: Condition for `WebDriverWait.until` or the tab scheduler.
+    """
+    return scroll_condition(locator, timeout = timeout)
+
+# Define the steps to look up an artist and read its info dialog
+def artist_info_steps(driver: WebDriver, artist: str, base_url: str = SPOTIFY_URL, artist_url_template: Optional[str] = None,
+                      screenshots: Optional[ScreenshotService] = None) -> Generator[Callable[[WebDriver], Any], Any, Dict[str, Any]]:
+    """
+    Generator with the steps of the artist lookup. Each time the flow has to wait, it yields a wait
+    condition (a callable taking the driver) and receives the truthy value of the condition once it is met.
+    The steps are run in a blocking way by `run_steps`, or interleaved across tabs by `TabScheduler`.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        artist (str): The artist name.
+        base_url (str): The URL of the page with the search bar.
+        artist_url_template (str): URL with an `{artist}` placeholder to open the artist page directly, skipping the search.
+        screenshots (ScreenshotService): Service capturing the artist page and the info dialog, as `test_03.py` does.
+
+    Returns:
+        dict: Artist, Ranking, Followers, MonthlyListeners and TopCities, with the same keys as `test_03.py`.
+    """
+    # Open the artist page
+    if artist_url_template:
+        navigate(driver, artist_url_template.format(artist = quote(artist)))
+        yield page_loaded
+    else:
+        navigate(driver, base_url)
+        yield page_loaded
+        search_bar = yield located("search.input")
+        search_bar.send_keys(artist + Keys.RETURN)
+        (yield located("search.artists_button")).click()
+        top_artist = yield located("artist.top_artist", artist = artist)
+        logger.info("The top artist is: %s", top_artist.text)
+        top_artist.click()
+
+    # Scroll down until the artist info button is visible and open the dialog
+    info_button = yield visible_or_scroll(REGISTRY.locator("artist.info_button", artist = artist))
+    if screenshots:
+        screenshots.step(driver, f"artist_page_{artist}")
+    info_button.click()
+    yield located("artist.dialog", artist = artist)
+    data_container = yield located("artist.data_container", artist = artist)
+    yield lambda d: data_container.text != ""
+    if screenshots:
+        screenshots.step(driver, f"artist_info_page_{artist}")
+
+    # Read the data from the dialog
+    world_number = data_container.find_elements(*WORLD_NUMBER_LOCATOR)
+    world_number = parse_count(world_number[0].text) if world_number else None
+    numbers = yield located("artist.numbers", all = True, artist = artist)
+    cities: List[str] = [city.text for city in (yield located("artist.cities", all = True, artist = artist))]
+    if len(cities) < 5:
+        logger.warning("Less than 5 cities found for artist %s. Found: %s cities", artist, len(cities))
+    return {
+        "Artist": artist,
+        "Ranking": world_number,
+        "Followers": parse_count(numbers[0].text),
+        "MonthlyListeners": parse_count(numbers[1].text),
+        "TopCities": cities,
+    }
+
+# Define function to run the steps of a flow waiting for each condition
+def run_steps(driver: WebDriver, steps: Generator, timeout: float = DEFAULT_TIMEOUT) -> Any:
+    """
+    Run a steps generator in the current tab, blocking on each yielded condition with `WebDriverWait`.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        steps (Generator): The generator yielding wait conditions.
+        timeout (float): The maximum time to wait for each condition.
+
+    Returns:
+        Any: The return value of the generator.
+
+    Raises:
+        TimeoutException: If a condition is not met within the timeout.
+    """
+    wait = WebDriverWait(driver, timeout)
+    try:
+        condition = next(steps)
+        while True:
+            condition = steps.send(wait.until(condition))
+    except StopIteration as e_finished:
+        return e_finished.value
+
+# Define function to look up an artist and read its info
+def scrape_artist_info(driver: WebDriver, artist: str, timeout: float = DEFAULT_TIMEOUT, base_url: str = SPOTIFY_URL,
+                       artist_url_template: Optional[str] = None,
+                       screenshots: Optional[ScreenshotService] = None) -> Dict[str, Any]:
+    """
+    Open the page of an artist and read the data of its info dialog.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        artist (str): The artist name.
+        timeout (float): The maximum time to wait for each element.
+        base_url (str): The URL of the page with the search bar.
+        artist_url_template (str): URL with an `{artist}` placeholder to open the artist page directly.
+        screenshots (ScreenshotService): Service capturing the steps of the lookup, and the page when it fails.
+
+    Returns:
+        dict: Artist, Ranking, Followers, MonthlyListeners and TopCities. The numbers are ints, None when
+        the page does not show them (see `record_utils.Artist.from_info` for a typed record).
+
+    Raises:
+        TimeoutException: If an element of the flow is not found.
+    """
+    logger.info("Looking up artist: %s", artist)
+    start_time = time.perf_counter()
+    steps = artist_info_steps(driver, artist, base_url, artist_url_template, screenshots)
+    if screenshots:
+        with screenshots.on_error(driver, f"artist_error_{artist}"):
+            info = run_steps(driver, steps, timeout)
+    else:
+        info = run_steps(driver, steps, timeout)
+    logger.info("Artist info for %s read in %.2fs", artist, time.perf_counter() - start_time)
+    return info
@@ -0,0 +1,153 @@
+"""This page contains asyncio versions of the element_utils helpers to drive several sessions from one event loop."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+# Import the necessary libraries for the project
+from . import element_utils
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional
+import asyncio
+import threading
+import weakref
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the project
+DEFAULT_TIMEOUT = element_utils.DEFAULT_TIMEOUT
+DEFAULT_MAX_WORKERS = 32
+
+# Thread pool running the blocking WebDriver calls
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# A WebDriver session is not safe for concurrent commands, so the calls of each driver are serialized in the
+# event loop before they reach the pool, and a slow driver never holds a pool thread while others wait
+_driver_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, weakref.WeakKeyDictionary]" = weakref.WeakKeyDictionary()
+
+# Define function to set the thread pool used by the async helpers
+def set_executor(executor: Optional[ThreadPoolExecutor]) -> None:
+    """
+    Set the thread pool used to run the blocking WebDriver calls. Use a pool with at least one thread
+    per driver driven concurrently.
+
+    Args:
+        executor (ThreadPoolExecutor): The thread pool, None restores the default pool.
+    """
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers = DEFAULT_MAX_WORKERS, thread_name_prefix = "webdriver")
+        return _executor
+
+def _driver_lock(driver: WebDriver) -> Optional[asyncio.Lock]:
+    # The locks are created per event loop, an asyncio.Lock cannot be shared between loops
+    loop = asyncio.get_running_loop()
+    try:
+        with _executor_lock:
+            locks = _driver_locks.get(loop)
+            if locks is None:
+                locks = _driver_locks[loop] = weakref.WeakKeyDictionary()
+            lock = locks.get(driver)
+            if lock is None:
+                lock = locks[driver] = asyncio.Lock()
+            return lock
+    except TypeError:
+        return None
+
+# Define function to run any blocking helper of a driver without blocking the event loop
+async def arun(driver: WebDriver, function: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking function that uses the driver in the thread pool. Calls on the same driver run one at a time,
+    calls on different drivers run concurrently.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance used by the function.
+        function (Callable): The blocking function (e.g., `auth_utils.login_with_credentials`).
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Any: The return value of the function.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _driver_lock(driver)
+    if lock is None:
+        return await loop.run_in_executor(_get_executor(), partial(function, *args, **kwargs))
+    async with lock:
+        future = loop.run_in_executor(_get_executor(), partial(function, *args, **kwargs))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The call keeps running in its thread, the driver stays locked until it ends
+            await asyncio.wait([future])
+            raise
+
+# Define async function to find an element by its locator
+async def afind_element(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIMEOUT) -> Optional[WebElement]:
+    """
+    Async version of `element_utils.find_element`.
+
+    Returns:
+        WebElement: The web element if found, None otherwise.
+    """
+    return await arun(driver, element_utils.find_element, driver, locator, timeout)
+
+# Define async function to find multiple elements by their locator
+async def afind_elements(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIMEOUT) -> List[WebElement]:
+    """
+    Async version of `element_utils.find_elements`.
+
+    Returns:
+        List[WebElement]: A list of web elements if found, empty list otherwise.
+    """
+    return await arun(driver, element_utils.find_elements, driver, locator, timeout)
+
+# Define async function to click on an element
+async def aclick_element(driver: WebDriver, element: WebElement, timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """
+    Async version of `element_utils.click_element`.
+
+    Returns:
+        bool: True if the click was successful, False otherwise.
+    """
+    return await arun(driver, element_utils.click_element, driver, element, timeout)
+
+# Define async function to send keys to an element
+async def asend_keys_to_element(driver: WebDriver, element: WebElement, keys: str, clear_element: bool = True,
+                                timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """
+    Async version of `element_utils.send_keys_to_element`.
+
+    Returns:
+        bool: True if the keys were sent successfully, False otherwise.
+    """
+    return await arun(driver, element_utils.send_keys_to_element, driver, element, keys, clear_element, timeout)
+
+# Define async function to check if an element is visible
+async def ais_element_visible(driver: WebDriver, element: WebElement, timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """
+    Async version of `element_utils.is_element_visible`.
+
+    Returns:
+        bool: True if the element is visible, False otherwise.
+    """
+    return await arun(driver, element_utils.is_element_visible, driver, element, timeout)
+
+# Define async function to extract text from an element
+async def aget_element_text(driver: WebDriver, element: WebElement) -> Optional[str]:
+    """
+    Async version of `element_utils.get_element_text`. The driver is needed to serialize the call with
+    the other commands of the same session.
+
+    Returns:
+        str: The extracted text if successful, None otherwise.
+    """
+    return await arun(driver, element_utils.get_element_text, element)
@@ -8,79 +8,157 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 # Import the necessary libraries for the project 
+from .driver_utils import DriverPool, create_chrome_driver, close_driver
+from .session_utils import DEFAULT_EXPIRY_MARGIN, SessionStore, earliest_expiry
+from .locator_utils import REGISTRY
+from .retry_utils import RETRYABLE_EXCEPTIONS, RetryPolicy, call_with_policy
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
 import pickle
+import json
 import os
+import threading
+import time
 import logging
 
 # Set up logging configuration
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Constants values for the project
 DEFAULT_TIMEOUT = 10
 LOGIN_URL = "https://accounts.spotify.com/en/login?allow_password=1"
-USERNAME_INPUT = (By.ID, "login-username")
-PASSWORD_INPUT = (By.ID, "login-password")
-LOGIN_BUTTON = (By.ID, "login-button")
-LOGGED_IN_INDICATOR = (By.CSS_SELECTOR, "button[data-testid='user-widget-link']")
-LOGOUT_BUTTON = (By.CSS_SELECTOR, "button[data-testid='user-widget-dropdown-logout']")
+USERNAME_INPUT = REGISTRY.locator("login.username")
+PASSWORD_INPUT = REGISTRY.locator("login.password")
+LOGIN_BUTTON = REGISTRY.locator("login.button")
+LOGGED_IN_INDICATOR = REGISTRY.locator("account.logged_in")
+LOGOUT_BUTTON = REGISTRY.locator("account.logout")
+# Markers of a logged-out page and of a rejected login, raced against the logged-in indicator
+LOGGED_OUT_INDICATOR = REGISTRY.locator("account.logged_out")
+LOGIN_ERROR_INDICATOR = REGISTRY.locator("login.error")
+# Cookie holding the Spotify session
+SESSION_COOKIE = "sp_dc"
+PROBE_POLL_FREQUENCY = 0.1
 BASE_URL = "https://www.spotify.com/"
+# Seconds a validated session is trusted before it is checked again on the page
+DEFAULT_REVALIDATE_AFTER = 600
+# Retry policy of the login and logout flows, a slow form is worth a second attempt before giving up
+AUTH_RETRY_POLICY = RetryPolicy(attempts = 2, backoff = 1.0, retry_on = RETRYABLE_EXCEPTIONS + (TimeoutException,))
 # Define functtion to log in to Spotify using username and password
-def login_with_credentials(driver: WebDriver, username: str, password: str) -> bool:
+def login_with_credentials(driver: WebDriver, username: str, password: str, login_url: str = LOGIN_URL,
+                           policy: RetryPolicy = AUTH_RETRY_POLICY) -> bool:
     """
     Log in to Sptofy using the provided username and password.
+    A form that times out or changes under the helper is loaded and filled again, as the policy declares.
+    A rejected login is not retried.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
         username (str): The Spotify username.
         password (str): The Spotify password.
+        login_url (str): The URL of the login form.
+        policy (RetryPolicy): The retry policy of the whole login flow.
 
     Returns:
         bool: True if login was successful, False otherwise.
     """
     logger.info("Logging in to Spotify...")
     try:
-        driver.get(LOGIN_URL)
-        wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
-        # Wait for the username input field to be present and enter the username
-        username_input = wait.until(EC.presence_of_element_located(USERNAME_INPUT))
-        username_input.clear()
-        username_input.send_keys(username)
-        logger.info("Username entered.")
-        # Wait for the password input field to be present and enter the password
-        password_input = wait.until(EC.presence_of_element_located(PASSWORD_INPUT))
-        password_input.clear()
-        password_input.send_keys(password)
-        logger.info("Password entered.")
-        # Wait for the login button to be present and click it
-        login_button = wait.until(EC.element_to_be_clickable(LOGIN_BUTTON))
-        login_button.click()
-        logger.info("Login button clicked.")
-        # Verify the loging
-        if is_logged_in(driver, timeout = 15):
-            logger.info("Login successful.")
-            return True
-        else:
-            logger.error("Validation failed: User is not logged in.")
-            return False
-
+        return call_with_policy(driver, lambda: _submit_login(driver, username, password, login_url), policy = policy)
     except TimeoutException as e_timeout:
-        logger.error(f"Timeout while waiting for login elements: {e_timeout}", exc_info = True)
+        logger.error("Timeout while waiting for login elements: %s", e_timeout, exc_info = True)
         return False
     except NoSuchElementException as e_no_element:
-        logger.error(f"Element not found during login: {e_no_element}", exc_info = True)
+        logger.error("Element not found during login: %s", e_no_element, exc_info = True)
         return False
     except WebDriverException as e_webdriver:
-        logger.error(f"WebDriver error during login: {e_webdriver}", exc_info = True)
+        logger.error("WebDriver error during login: %s", e_webdriver, exc_info = True)
         return False
     except Exception as e_unexpected:
-        logger.error(f"Unexpected error during login: {e_unexpected}", exc_info = True)
+        logger.error("Unexpected error during login: %s", e_unexpected, exc_info = True)
+        return False
+
+# Define function to fill and submit the login form once
+def _submit_login(driver: WebDriver, username: str, password: str, login_url: str) -> bool:
+    driver.get(login_url)
+    wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+    # Wait for the username input field to be present and enter the username
+    username_input = wait.until(EC.presence_of_element_located(USERNAME_INPUT))
+    username_input.clear()
+    username_input.send_keys(username)
+    logger.info("Username entered.")
+    # Wait for the password input field to be present and enter the password
+    password_input = wait.until(EC.presence_of_element_located(PASSWORD_INPUT))
+    password_input.clear()
+    password_input.send_keys(password)
+    logger.info("Password entered.")
+    # Wait for the login button to be present and click it
+    login_button = wait.until(EC.element_to_be_clickable(LOGIN_BUTTON))
+    login_button.click()
+    logger.info("Login button clicked.")
+    # Verify the loging, a rejected login is detected as soon as the error banner shows up
+    if probe_login_state(driver, timeout = 15, logged_out_indicators = (LOGIN_ERROR_INDICATOR,)):
+        logger.info("Login successful.")
+        return True
+    else:
+        logger.error("Validation failed: User is not logged in.")
         return False
 
+# Define function to race the logged-in indicator against the logged-out markers
+def probe_login_state(driver: WebDriver, timeout: float = DEFAULT_TIMEOUT,
+                      logged_out_indicators: tuple = (LOGGED_OUT_INDICATOR,)) -> Optional[bool]:
+    """
+    Wait for the logged-in indicator or any logged-out marker, whichever appears first, so the negative
+    answer comes as soon as the page shows it instead of after the whole timeout.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        timeout (float): The maximum time to wait for any of the markers.
+        logged_out_indicators (tuple): Locators that mean the user is not logged in.
+
+    Returns:
+        bool: True if logged in, False if a logged-out marker appeared first, None if neither appeared in time.
+    """
+    def login_state(driver: WebDriver) -> Optional[str]:
+        if driver.find_elements(*LOGGED_IN_INDICATOR):
+            return "logged_in"
+        if any(driver.find_elements(*locator) for locator in logged_out_indicators):
+            return "logged_out"
+        return None
+
+    try:
+        state = WebDriverWait(driver, timeout, poll_frequency = PROBE_POLL_FREQUENCY).until(login_state)
+        return state == "logged_in"
+    except TimeoutException:
+        return None
+
+# Define function to check the session cookie without waiting for the page
+def has_session_cookie(driver: WebDriver, cookie_name: str = SESSION_COOKIE) -> bool:
+    """
+    Check if the browser holds a session cookie that has not expired. It is one WebDriver command and
+    no DOM wait, but it does not prove the server still accepts the session.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        cookie_name (str): The name of the session cookie.
+
+    Returns:
+        bool: True if the cookie exists and has not expired.
+    """
+    try:
+        cookie = driver.get_cookie(cookie_name)
+    except WebDriverException as e_webdriver:
+        logger.error("WebDriver error while reading the session cookie: %s", e_webdriver, exc_info = True)
+        return False
+    return bool(cookie and cookie.get("value")) and (not cookie.get("expiry") or cookie["expiry"] > time.time())
+
 # Define function to check if the user is logged in to Spotify
 def is_logged_in(driver: WebDriver, timeout: int = DEFAULT_TIMEOUT) -> bool:
     """
     Check if the user is logged in to Spotify.
+    The logged-out marker is raced against the logged-in indicator, so a negative check returns as soon as
+    the page shows the login button.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
@@ -91,17 +169,39 @@ def is_logged_in(driver: WebDriver, timeout: int = DEFAULT_TIMEOUT) -> bool:
     """
     logger.info("Checking if user is logged in...")
     try:
-        wait = WebDriverWait(driver, timeout)
-        # Wait for the logged-in indicator to be present
-        wait.until(EC.presence_of_element_located(LOGGED_IN_INDICATOR))
-        logger.info("User is logged in.")
-        return True
-    
-    except (TimeoutException, NoSuchElementException) as e_failed_loging:
-        logger.error(f"User is not logged in: {e_failed_loging}", exc_info = True)
+        state = probe_login_state(driver, timeout)
+        if state:
+            logger.info("User is logged in.")
+            return True
+        logger.error("User is not logged in: %s.", 'logged-out marker found' if state is False else 'no marker found')
+        return False
+
+    except WebDriverException as e_webdriver:
+        logger.error("WebDriver error while checking login status: %s", e_webdriver, exc_info = True)
         return False
     except Exception as e_unexpected:
-        logger.error(f"Unexpected error while checking login status: {e_unexpected}", exc_info = True)
+        logger.error("Unexpected error while checking login status: %s", e_unexpected, exc_info = True)
+        return False
+
+# Define function to wait until the page shows the user is logged out
+def wait_for_logged_out(driver: WebDriver, timeout: float = DEFAULT_TIMEOUT) -> bool:
+    """
+    Wait until the logged-out marker appears or the logged-in indicator goes away.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        timeout (float): The maximum time to wait.
+
+    Returns:
+        bool: True if the page shows the user is logged out.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency = PROBE_POLL_FREQUENCY).until(EC.any_of(
+            EC.presence_of_element_located(LOGGED_OUT_INDICATOR),
+            EC.invisibility_of_element_located(LOGGED_IN_INDICATOR),
+        ))
+        return True
+    except TimeoutException:
         return False
 
 # Define function to save cookies to a file    
@@ -113,7 +213,7 @@ def save_cookies(driver: WebDriver, filename_path: str) -> None:
         driver (WebDriver): The Selenium WebDriver instance.
         filename_path (str): The path to the file where cookies will be saved.
     """
-    logger.info(f"Saving cookies on: {filename_path} ...")
+    logger.info("Saving cookies on: %s ...", filename_path)
     try:
         # Verify the directory exists, if not create it
         os.makedirs(os.path.dirname(filename_path), exist_ok=True)
@@ -124,11 +224,40 @@ def save_cookies(driver: WebDriver, filename_path: str) -> None:
         logger.info("Cookies saved successfully.")
 
     except FileNotFoundError as e_file:
-        logger.error(f"File not found: {e_file}", exc_info = True)
+        logger.error("File not found: %s", e_file, exc_info = True)
     except WebDriverException as e_webdriver:
-        logger.error(f"WebDriver error while saving cookies: {e_webdriver}", exc_info = True)
+        logger.error("WebDriver error while saving cookies: %s", e_webdriver, exc_info = True)
     except Exception as e_unexpected:
-        logger.error(f"Unexpected error while saving cookies: {e_unexpected}", exc_info = True)
+        logger.error("Unexpected error while saving cookies: %s", e_unexpected, exc_info = True)
+
+# Define function to add a list of cookies to the browser
+def apply_cookies(driver: WebDriver, cookies: List[dict], url: str = BASE_URL) -> bool:
+    """
+    Add a list of cookies to the current session, one WebDriver command per cookie.
+    The driver navigates to the URL before adding the cookies and refreshes the page afterwards.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        cookies (List[dict]): The cookies, as returned by `driver.get_cookies()`.
+        url (str): The URL of the cookies domain.
+
+    Returns:
+        bool: True if the cookies were added successfully.
+    """
+    # Go to the base URL before adding cookies
+    logger.info("Navigating to base URL %s before loading cookies...", url)
+    driver.get(url)
+    logger.info("Adding cookies to the browser...")
+
+    # Add each cookie to the current session
+    for cookie in cookies:
+        driver.add_cookie(cookie)
+
+    logger.info("Cookies added successfully.")
+    # Refresh the page to apply the cookies
+    driver.refresh()
+    logger.info("Page refreshed after loading cookies.")
+    return True
 
 # Define function to load cookies from a file
 def load_cookies(driver: WebDriver, filename_path: str) -> bool:
@@ -144,41 +273,127 @@ def load_cookies(driver: WebDriver, filename_path: str) -> bool:
     Returns:
         bool: True if cookies were loaded successfully, False otherwise.
     """
-    logger.info(f"Loading cookies from: {filename_path} ...")
+    logger.info("Loading cookies from: %s ...", filename_path)
     try:
         # Open the file and load the cookies
         with open(filename_path, "rb") as file:
             cookies = pickle.load(file)
 
-        # Go to the base URL before adding cookies
-        logger.info(f"Navigating to base URL {BASE_URL} before loading cookies...")
-        driver.get(BASE_URL)
-        logger.info("Adding cookies to the browser...")
+        return apply_cookies(driver, cookies)
 
-        # Add each cookie to the current session
-        for cookie in cookies:
-            driver.add_cookie(cookie)
+    except FileNotFoundError as e_file:
+        logger.error("File not found: %s", e_file, exc_info = True)
+    except WebDriverException as e_webdriver:
+        logger.error("WebDriver error while loading cookies: %s", e_webdriver, exc_info = True)
+    except Exception as e_unexpected:
+        logger.error("Unexpected error while loading cookies: %s", e_unexpected, exc_info = True)
+
+# Define function to convert a Selenium cookie to the CDP format
+def _to_cdp_cookie(cookie: dict, url: str) -> Dict[str, Any]:
+    cdp_cookie = {"name": cookie["name"], "value": cookie["value"], "path": cookie.get("path", "/"),
+                  "secure": cookie.get("secure", False), "httpOnly": cookie.get("httpOnly", False)}
+    if cookie.get("domain"):
+        cdp_cookie["domain"] = cookie["domain"]
+    else:
+        cdp_cookie["url"] = url
+    if cookie.get("sameSite"):
+        cdp_cookie["sameSite"] = cookie["sameSite"]
+    if cookie.get("expiry"):
+        cdp_cookie["expires"] = cookie["expiry"]
+    return cdp_cookie
+
+# Define function to read the localStorage and sessionStorage of the current page
+def capture_storage(driver: WebDriver) -> Dict[str, Dict[str, str]]:
+    """
+    Read the localStorage and sessionStorage of the current page, to restore them with `restore_session`.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
 
-        logger.info("Cookies added successfully.")
-        # Refresh the page to apply the cookies
-        driver.refresh()
-        logger.info("Page refreshed after loading cookies.")
+    Returns:
+        dict: "local_storage" and "session_storage" with the items of each storage, empty on failure.
+    """
+    try:
+        return driver.execute_script(
+            "return {local_storage: Object.assign({}, window.localStorage), "
+            "session_storage: Object.assign({}, window.sessionStorage)};")
+    except WebDriverException as e_webdriver:
+        logger.error("WebDriver error while reading the storage: %s", e_webdriver, exc_info = True)
+        return {"local_storage": {}, "session_storage": {}}
+
+# Define function to check whether two URLs share the same origin
+def _same_origin(url: str, other_url: str) -> bool:
+    parsed_url, parsed_other = urlparse(url), urlparse(other_url)
+    return (parsed_url.scheme, parsed_url.netloc) == (parsed_other.scheme, parsed_other.netloc)
+
+# Define function to restore a session in bulk before the first navigation
+def restore_session(driver: WebDriver, cookies: List[dict], url: str = BASE_URL,
+                    local_storage: Optional[Dict[str, str]] = None,
+                    session_storage: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Restore the cookies and the storage of a session and open the URL once, already authenticated.
+
+    All the cookies are set with a single `Network.setCookies` call before the first navigation, and the
+    storage items are written by a script that runs before the scripts of the page, so neither a first
+    visit to the domain nor a `refresh()` is needed. Drivers without CDP (e.g., Firefox) fall back to
+    `apply_cookies`.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        cookies (List[dict]): The cookies, as returned by `driver.get_cookies()`.
+        url (str): The URL to open once the session is restored.
+        local_storage (Dict[str, str]): The localStorage items of the URL origin.
+        session_storage (Dict[str, str]): The sessionStorage items of the URL origin.
+
+    Returns:
+        bool: True if the session was restored successfully, False otherwise.
+    """
+    logger.info("Restoring %s cookies before opening %s ...", len(cookies), url)
+    try:
+        if not hasattr(driver, "execute_cdp_cmd"):
+            applied = apply_cookies(driver, cookies, url)
+            if local_storage or session_storage:
+                driver.execute_script(
+                    "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);"
+                    "for (const [k, v] of Object.entries(arguments[1])) sessionStorage.setItem(k, v);",
+                    local_storage or {}, session_storage or {})
+                driver.refresh()
+            return applied
+
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp_cookie(cookie, url) for cookie in cookies]})
+        script_id = None
+        if local_storage or session_storage:
+            # Write the storage of the URL origin before the page scripts read it
+            parsed_url = urlparse(url)
+            script = ("if (location.origin === %s) {"
+                      "for (const [k, v] of Object.entries(%s)) localStorage.setItem(k, v);"
+                      "for (const [k, v] of Object.entries(%s)) sessionStorage.setItem(k, v);}"
+                      % (json.dumps(f"{parsed_url.scheme}://{parsed_url.netloc}"),
+                         json.dumps(local_storage or {}), json.dumps(session_storage or {})))
+            script_id = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})["identifier"]
+        try:
+            driver.get(url)
+        finally:
+            if script_id is not None:
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+        logger.info("Session restored successfully.")
         return True
 
-    except FileNotFoundError as e_file:
-        logger.error(f"File not found: {e_file}", exc_info = True)
     except WebDriverException as e_webdriver:
-        logger.error(f"WebDriver error while loading cookies: {e_webdriver}", exc_info = True)
+        logger.error("WebDriver error while restoring the session: %s", e_webdriver, exc_info = True)
+        return False
     except Exception as e_unexpected:
-        logger.error(f"Unexpected error while loading cookies: {e_unexpected}", exc_info = True)
+        logger.error("Unexpected error while restoring the session: %s", e_unexpected, exc_info = True)
+        return False
 
 # Define function to log out from Spotify
-def logout(driver: WebDriver) -> bool:
+def logout(driver: WebDriver, policy: RetryPolicy = AUTH_RETRY_POLICY) -> bool:
     """
-    Log out from Spotify.
+    Log out from Spotify. A menu that times out or changes under the helper is opened again, as the policy declares.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
+        policy (RetryPolicy): The retry policy of the logout flow.
 
     Returns:
         bool: True if logout was successful, False otherwise.
@@ -189,34 +404,232 @@ def logout(driver: WebDriver) -> bool:
         logger.warning("User is not logged in, cannot log out.")
         return False
     try:
-        wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
-        # Click the logged-in indicator to open the dropdown menu
-        logged_in_indicator = wait.until(EC.element_to_be_clickable(LOGGED_IN_INDICATOR))
-        logged_in_indicator.click()
-        # Click the logout button in the dropdown menu
-        logger.info("Clicking the logout button...")
-        logout_button = wait.until(EC.element_to_be_clickable(LOGOUT_BUTTON))
-        logout_button.click()
-        logger.info("Logout button clicked.")
-
-        # Verify the logout by checking if the login indicator is no longer present
-        if not is_logged_in(driver, timeout = 5):
-
-            logger.info("Logout successful.")
-            return True
-        else:
-            logger.error("Logout failed: User is still logged in.")
-            return False        
-
+        return call_with_policy(driver, lambda: _submit_logout(driver), policy = policy)
     except TimeoutException as e_timeout:
-        logger.error(f"Timeout while waiting for logout elements: {e_timeout}", exc_info = True)
+        logger.error("Timeout while waiting for logout elements: %s", e_timeout, exc_info = True)
         return False
     except NoSuchElementException as e_no_element:
-        logger.error(f"Element not found during logout: {e_no_element}", exc_info = True)
+        logger.error("Element not found during logout: %s", e_no_element, exc_info = True)
         return False
     except WebDriverException as e_webdriver:
-        logger.error(f"WebDriver error during logout: {e_webdriver}", exc_info = True)
+        logger.error("WebDriver error during logout: %s", e_webdriver, exc_info = True)
         return False
     except Exception as e_unexpected:
-        logger.error(f"Unexpected error during logout: {e_unexpected}", exc_info = True)
-        return False    
\ No newline at end of file
+        logger.error("Unexpected error during logout: %s", e_unexpected, exc_info = True)
+        return False
+
+# Define function to open the account menu and click the logout button once
+def _submit_logout(driver: WebDriver) -> bool:
+    wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+    # Click the logged-in indicator to open the dropdown menu, unless a previous attempt left it open
+    if not any(button.is_displayed() for button in driver.find_elements(*LOGOUT_BUTTON)):
+        logged_in_indicator = wait.until(EC.element_to_be_clickable(LOGGED_IN_INDICATOR))
+        logged_in_indicator.click()
+    # Click the logout button in the dropdown menu
+    logger.info("Clicking the logout button...")
+    logout_button = wait.until(EC.element_to_be_clickable(LOGOUT_BUTTON))
+    logout_button.click()
+    logger.info("Logout button clicked.")
+
+    # Verify the logout by checking if the login indicator is no longer present
+    if wait_for_logged_out(driver, timeout = 5):
+        logger.info("Logout successful.")
+        return True
+    else:
+        logger.error("Logout failed: User is still logged in.")
+        return False
+
+@dataclass
+class AccountSession:
+    """Validated cookie set of an account."""
+    username: str
+    cookies: List[dict]
+    expires_at: Optional[float]
+    validated_at: float = field(default_factory = time.time)
+    local_storage: Dict[str, str] = field(default_factory = dict)
+    session_storage: Dict[str, str] = field(default_factory = dict)
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        return self.expires_at is not None and now >= self.expires_at - DEFAULT_EXPIRY_MARGIN
+
+
+# Class to keep one authenticated session per account and hand authenticated drivers to the jobs
+class SessionManager:
+    """
+    Keep, for each username, a validated cookie set with its expiry, and hand already-authenticated drivers to jobs.
+
+    A job asks for `authenticated_driver(username)`: the cookies of the account are restored in a driver of
+    the pool, the session is only checked on the page when it was validated more than `revalidate_after`
+    seconds ago, and the UI login runs only when there are no cookies, they expired or the check failed.
+    The login cost is paid once per account instead of once per job. With a `SessionStore`, the sessions
+    are shared with the other workers and survive the process.
+
+    Args:
+        credentials (Callable): Function returning the password of a username.
+        pool (DriverPool): Pool providing the drivers, None creates and closes a driver per job.
+        revalidate_after (float): Seconds a validated session is trusted without checking it on the page.
+        store (SessionStore): Store to load the sessions missing in memory and to save the new ones.
+        driver_kwargs: Keyword arguments passed to `create_chrome_driver` when there is no pool.
+    """
+
+    def __init__(self, credentials: Callable[[str], str], pool: Optional[DriverPool] = None,
+                 revalidate_after: float = DEFAULT_REVALIDATE_AFTER, store: Optional[SessionStore] = None,
+                 **driver_kwargs) -> None:
+        self._credentials = credentials
+        self._pool = pool
+        self._store = store
+        self._driver_kwargs = driver_kwargs
+        self.revalidate_after = revalidate_after
+        self._sessions: Dict[str, AccountSession] = {}
+        self._account_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        # Counters exposed through `stats`
+        self.logins = 0
+        self.reuses = 0
+        self.revalidations = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters of the manager: UI logins, cookie reuses, page revalidations and accounts."""
+        with self._lock:
+            return {"logins": self.logins, "reuses": self.reuses, "revalidations": self.revalidations,
+                    "accounts": len(self._sessions)}
+
+    def get_session(self, username: str) -> Optional[AccountSession]:
+        """
+        Get the stored session of an account, None if there is none or it expired.
+
+        Args:
+            username (str): The Spotify username.
+
+        Returns:
+            AccountSession: The validated cookie set of the account.
+        """
+        with self._lock:
+            session = self._sessions.get(username)
+        if session is None and self._store is not None:
+            # The store already rejects the expired sessions without starting a browser
+            record = self._store.load(username)
+            if record is not None:
+                session = AccountSession(username, record["cookies"], record["expires_at"], record["saved_at"],
+                                         record["local_storage"], record["session_storage"])
+                with self._lock:
+                    self._sessions[username] = session
+        if session is None or session.is_expired():
+            return None
+        return session
+
+    def store_session(self, username: str, cookies: List[dict], validated_at: Optional[float] = None,
+                      local_storage: Optional[Dict[str, str]] = None,
+                      session_storage: Optional[Dict[str, str]] = None) -> AccountSession:
+        """
+        Store the validated cookies and storage of an account.
+
+        Args:
+            username (str): The Spotify username.
+            cookies (List[dict]): The cookies of an authenticated session.
+            validated_at (float): Epoch seconds of the last validation, now by default.
+            local_storage (Dict[str, str]): The localStorage items of the session.
+            session_storage (Dict[str, str]): The sessionStorage items of the session.
+
+        Returns:
+            AccountSession: The stored session.
+        """
+        session = AccountSession(username, list(cookies), earliest_expiry(cookies),
+                                 validated_at if validated_at is not None else time.time(),
+                                 dict(local_storage or {}), dict(session_storage or {}))
+        with self._lock:
+            self._sessions[username] = session
+        if self._store is not None:
+            self._store.save(username, session.cookies, session.local_storage, session.session_storage,
+                             session.validated_at)
+        return session
+
+    def invalidate(self, username: str) -> None:
+        """
+        Drop the session of an account, the next job logs in through the UI.
+
+        Args:
+            username (str): The Spotify username.
+        """
+        with self._lock:
+            self._sessions.pop(username, None)
+        if self._store is not None:
+            self._store.remove(username)
+
+    def _account_lock(self, username: str) -> threading.Lock:
+        with self._lock:
+            return self._account_locks.setdefault(username, threading.Lock())
+
+    def authenticate(self, driver: WebDriver, username: str) -> bool:
+        """
+        Authenticate a driver as the account, reusing its stored cookies when possible.
+
+        Args:
+            driver (WebDriver): The Selenium WebDriver instance.
+            username (str): The Spotify username.
+
+        Returns:
+            bool: True if the driver is authenticated, False otherwise.
+        """
+        # Only one job at a time logs an account in, the others wait and reuse its cookies
+        with self._account_lock(username):
+            session = self.get_session(username)
+            if session is not None:
+                restored = restore_session(driver, session.cookies, BASE_URL, session.local_storage, session.session_storage)
+                if restored and time.time() - session.validated_at < self.revalidate_after:
+                    with self._lock:
+                        self.reuses += 1
+                    logger.info("Session of %s reused without revalidation.", username)
+                    return True
+                with self._lock:
+                    self.revalidations += 1
+                if restored and is_logged_in(driver):
+                    session.validated_at = time.time()
+                    with self._lock:
+                        self.reuses += 1
+                    logger.info("Session of %s revalidated and reused.", username)
+                    return True
+                logger.warning("Stored session of %s is no longer valid, logging in again.", username)
+                self.invalidate(username)
+
+            with self._lock:
+                self.logins += 1
+            if not login_with_credentials(driver, username, self._credentials(username)):
+                return False
+            # The login ends on the accounts origin, capture the cookies and storage of the origin they are restored on
+            try:
+                if not _same_origin(driver.current_url, BASE_URL):
+                    driver.get(BASE_URL)
+            except WebDriverException as e_webdriver:
+                logger.error("WebDriver error while opening %s after the login: %s", BASE_URL, e_webdriver, exc_info = True)
+                return False
+            self.store_session(username, driver.get_cookies(), **capture_storage(driver))
+            return True
+
+    @contextmanager
+    def authenticated_driver(self, username: str, timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        """
+        Context manager that yields a driver authenticated as the account and returns it when the block ends.
+
+        Args:
+            username (str): The Spotify username.
+            timeout (float): Maximum seconds to wait for a driver of the pool.
+
+        Yields:
+            WebDriver: A driver authenticated as the account.
+
+        Raises:
+            RuntimeError: If the account cannot be authenticated.
+        """
+        driver = self._pool.acquire(timeout) if self._pool else create_chrome_driver(**self._driver_kwargs)
+        try:
+            if not self.authenticate(driver, username):
+                raise RuntimeError(f"Could not authenticate the account {username}.")
+            yield driver
+        finally:
+            if self._pool:
+                self._pool.release(driver)
+            else:
+                close_driver(driver)
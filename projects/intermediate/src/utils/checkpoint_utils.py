@@ -0,0 +1,161 @@
+"""This page contains a SQLite checkpoint store to resume long scrapes after a crash."""
+
+# Import the necessary libraries for the project
+from typing import Any, Dict, Optional, Set
+import sqlite3
+import threading
+import time
+import os
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Schema of the checkpoint database
+CHECKPOINT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS targets (
+    target TEXT PRIMARY KEY,
+    last_index INTEGER NOT NULL DEFAULT 0,
+    last_key TEXT,
+    output_offset INTEGER,
+    completed INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS completed_items (
+    target TEXT NOT NULL,
+    item TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (target, item)
+);
+"""
+
+# Class to store the progress of the scrapes
+class CheckpointStore:
+    """
+    Record the progress of each scrape target (e.g., a playlist URL or an artist batch) in SQLite.
+
+    A target stores the last extracted row index or key, the byte offset of its output file at that
+    point and whether it is completed. Items of a target (e.g., artists) can be marked as done one by one.
+    Every write is committed immediately, so the store survives the process being killed.
+
+    Args:
+        path (str): Path of the SQLite database.
+    """
+
+    def __init__(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok = True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread = False, isolation_level = None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(CHECKPOINT_SCHEMA)
+        logger.info("Checkpoint store opened on: %s", path)
+
+    def get_progress(self, target: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the saved progress of a target.
+
+        Args:
+            target (str): The scrape target.
+
+        Returns:
+            dict: last_index, last_key, output_offset and completed, None if the target has no checkpoint.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT last_index, last_key, output_offset, completed FROM targets WHERE target = ?", (target,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"last_index": row[0], "last_key": row[1], "output_offset": row[2], "completed": bool(row[3])}
+
+    def save_progress(self, target: str, last_index: int, last_key: Optional[str] = None, output_offset: Optional[int] = None) -> None:
+        """
+        Save the last extracted row of a target.
+
+        Args:
+            target (str): The scrape target.
+            last_index (int): Index of the last row already saved in the output.
+            last_key (str): Key of the last row already saved in the output.
+            output_offset (int): Size in bytes of the output file when the row was saved.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO targets (target, last_index, last_key, output_offset, completed, updated_at) VALUES (?, ?, ?, ?, 0, ?) "
+                "ON CONFLICT(target) DO UPDATE SET last_index = excluded.last_index, last_key = excluded.last_key, "
+                "output_offset = excluded.output_offset, updated_at = excluded.updated_at",
+                (target, last_index, last_key, output_offset, time.time()),
+            )
+        logger.debug("Checkpoint saved for %s: last_index=%s, output_offset=%s", target, last_index, output_offset)
+
+    def mark_completed(self, target: str) -> None:
+        """
+        Mark a target as completed so a rerun skips it.
+
+        Args:
+            target (str): The scrape target.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO targets (target, completed, updated_at) VALUES (?, 1, ?) "
+                "ON CONFLICT(target) DO UPDATE SET completed = 1, updated_at = excluded.updated_at",
+                (target, time.time()),
+            )
+        logger.info("Target completed: %s", target)
+
+    def is_completed(self, target: str) -> bool:
+        """Return True if the target was marked as completed."""
+        progress = self.get_progress(target)
+        return bool(progress and progress["completed"])
+
+    def mark_item_done(self, target: str, item: str) -> None:
+        """
+        Mark an item of a target (e.g., an artist) as done.
+
+        Args:
+            target (str): The scrape target.
+            item (str): The finished item.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO completed_items (target, item, completed_at) VALUES (?, ?, ?)",
+                (target, item, time.time()),
+            )
+
+    def done_items(self, target: str) -> Set[str]:
+        """
+        Get the items of a target already done.
+
+        Args:
+            target (str): The scrape target.
+
+        Returns:
+            Set[str]: The finished items.
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT item FROM completed_items WHERE target = ?", (target,)).fetchall()
+        return {row[0] for row in rows}
+
+    def reset(self, target: str) -> None:
+        """
+        Delete the progress and the finished items of a target.
+
+        Args:
+            target (str): The scrape target.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM targets WHERE target = ?", (target,))
+            self._connection.execute("DELETE FROM completed_items WHERE target = ?", (target,))
+        logger.info("Checkpoint reset for: %s", target)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "CheckpointStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -4,15 +4,238 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.chrome import ChromeDriverManager 
+from selenium.webdriver.remote.webdriver import WebDriver
+# webdriver_manager is only needed when the driver cannot be resolved locally
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    ChromeDriverManager = None
+# Import the necessary libraries for the project
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
 import logging
 
 # Set up logging configuration
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Constants values for the driver resolution
+DRIVER_MANIFEST_PATH = os.path.join(os.path.expanduser("~"), ".cache", "spotify-testing", "chromedriver_manifest.json")
+CHROMEDRIVER_ENV_VAR = "CHROMEDRIVER_PATH"
+CHROME_BINARY_CANDIDATES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+# Constants values for the browser profiles
+DEFAULT_PROFILE = "default"
+SCRAPE_PROFILE = "scrape"
+PROFILES = (DEFAULT_PROFILE, SCRAPE_PROFILE)
+# Resources that are never needed to extract data from the DOM
+SCRAPE_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp3", "*.mp4", "*.webm", "*.m4a", "*.ogg",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*", "*hotjar.com*",
+]
+SCRAPE_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.managed_default_content_settings.notifications": 2,
+}
+SCRAPE_ARGUMENTS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--blink-settings=imagesEnabled=false",
+    "--autoplay-policy=user-gesture-required",
+]
+
+# Origins whose storage is cleared on reset besides the current one, the login lives on accounts.spotify.com
+RESET_ORIGINS = ("https://open.spotify.com", "https://accounts.spotify.com")
+
+# Cache of the resolved chromedriver path for the current process
+_resolved_driver_path: Optional[str] = None
+# True once the path is resolved, a None path (Selenium Manager) is cached too
+_resolved = False
+_resolution_stats: Dict[str, Any] = {}
+_resolution_lock = threading.Lock()
+
+# Define function to detect the installed Chrome version
+def get_chrome_version() -> Optional[str]:
+    """
+    Detect the version of the installed Chrome/Chromium browser.
+
+    Returns:
+        str: The version string (e.g., "131.0.6778.85") if found, None otherwise.
+    """
+    for binary in CHROME_BINARY_CANDIDATES:
+        binary_path = shutil.which(binary)
+        if not binary_path:
+            continue
+        try:
+            output = subprocess.run([binary_path, "--version"], capture_output = True, text = True, timeout = 5).stdout
+        except (OSError, subprocess.SubprocessError) as e_version:
+            logger.warning("Could not read the version of %s: %s", binary_path, e_version)
+            continue
+        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+        if match:
+            return match.group(1)
+    return None
+
+# Define function to read the on-disk manifest of resolved drivers
+def _read_manifest(manifest_path: str) -> Dict[str, str]:
+    try:
+        with open(manifest_path, "r", encoding = "utf-8") as file:
+            manifest = json.load(file)
+        return manifest if isinstance(manifest, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+# Define function to persist a resolved driver in the manifest
+def _write_manifest(manifest_path: str, chrome_version: str, driver_path: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(manifest_path), exist_ok = True)
+        manifest = _read_manifest(manifest_path)
+        manifest[chrome_version] = driver_path
+        temporary_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding = "utf-8") as file:
+            json.dump(manifest, file, indent = 4)
+        os.replace(temporary_path, manifest_path)
+    except OSError as e_manifest:
+        logger.warning("Could not write the driver manifest %s: %s", manifest_path, e_manifest)
+
+# Define function to resolve the chromedriver binary once per process
+def resolve_chromedriver_path(manifest_path: str = DRIVER_MANIFEST_PATH, offline: bool = False, refresh: bool = False) -> Optional[str]:
+    """
+    Resolve the chromedriver binary path once per process.
+    The lookup order is: in-process cache, on-disk manifest keyed by the Chrome version,
+    the `CHROMEDRIVER_PATH` environment variable, a `chromedriver` found in PATH and finally
+    `ChromeDriverManager` (network). When `offline` is True or nothing is found, None is returned
+    so Selenium Manager resolves the driver instead.
+
+    Args:
+        manifest_path (str): Path of the JSON manifest that stores the resolved paths.
+        offline (bool): Never use the network to download a driver if True.
+        refresh (bool): Ignore the in-process cache and the manifest if True.
+
+    Returns:
+        str: The chromedriver path, or None to let Selenium Manager resolve it.
+    """
+    global _resolved_driver_path, _resolved
+    with _resolution_lock:
+        if _resolved and not refresh:
+            _resolution_stats["cache_hits"] = _resolution_stats.get("cache_hits", 0) + 1
+            return _resolved_driver_path
+
+        start_time = time.perf_counter()
+        chrome_version = get_chrome_version() or "unknown"
+        driver_path, source = None, "selenium-manager"
+
+        manifest_path_found = None if refresh else _read_manifest(manifest_path).get(chrome_version)
+        if manifest_path_found and os.path.isfile(manifest_path_found):
+            driver_path, source = manifest_path_found, "manifest"
+        elif os.getenv(CHROMEDRIVER_ENV_VAR) and os.path.isfile(os.getenv(CHROMEDRIVER_ENV_VAR)):
+            driver_path, source = os.getenv(CHROMEDRIVER_ENV_VAR), "environment"
+        elif shutil.which("chromedriver"):
+            driver_path, source = shutil.which("chromedriver"), "path"
+        elif not offline and ChromeDriverManager is not None:
+            try:
+                driver_path, source = ChromeDriverManager().install(), "webdriver-manager"
+            except Exception as e_manager:
+                logger.warning("ChromeDriverManager could not resolve the driver, falling back to Selenium Manager: %s",
+                               e_manager)
+
+        if driver_path and source != "manifest" and chrome_version != "unknown":
+            _write_manifest(manifest_path, chrome_version, driver_path)
+
+        elapsed = time.perf_counter() - start_time
+        _resolved_driver_path, _resolved = driver_path, True
+        _resolution_stats.update({
+            "chrome_version": chrome_version,
+            "driver_path": driver_path,
+            "source": source,
+            "resolution_seconds": elapsed,
+            "cache_hits": 0,
+        })
+        logger.info("Chromedriver resolved from %s in %.3fs: %s", source, elapsed, driver_path)
+        return driver_path
+
+# Define function to report how the driver was resolved
+def get_driver_resolution_stats() -> Dict[str, Any]:
+    """
+    Report how the chromedriver was resolved in this process.
+
+    Returns:
+        dict: The Chrome version, driver path, source, resolution time in seconds and in-process cache hits.
+    """
+    with _resolution_lock:
+        return dict(_resolution_stats)
+
+# Define function to block resources through the Chrome DevTools Protocol
+def block_urls(driver: WebDriver, url_patterns: List[str]) -> bool:
+    """
+    Block every request whose URL matches one of the patterns using the CDP `Network.setBlockedURLs` command.
+
+    Args:
+        driver (WebDriver): A Chromium based WebDriver instance.
+        url_patterns (List[str]): URL patterns with `*` wildcards (e.g., "*.woff2", "*doubleclick.net*").
+
+    Returns:
+        bool: True if the patterns were applied, False otherwise.
+    """
+    logger.info("Blocking %s URL patterns through CDP...", len(url_patterns))
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(url_patterns)})
+        return True
+    except Exception as e_cdp:
+        logger.error("Error blocking URLs through CDP: %s", e_cdp, exc_info = True)
+        return False
+
+# Function to build the Chrome options of a profile
+def build_chrome_options(headless: bool = False, incognito: bool = False, maximize: bool = False,
+                         profile: str = DEFAULT_PROFILE) -> ChromeOptions:
+    """
+    Build the Chrome options of a local or remote driver.
+
+    Args:
+        headless (bool): Run in headless mode if True.
+        incognito (bool): Open in incognito mode if True.
+        maximize (bool): Maximize the window if True.
+        profile (str): "default" or "scrape", see `create_chrome_driver`.
+
+    Returns:
+        ChromeOptions: The options of the driver.
+
+    Raises:
+        ValueError: If the profile is unknown.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile '{profile}', expected one of {PROFILES}.")
+    chrome_options = ChromeOptions()
+    if headless:
+        chrome_options.add_argument("--headless")
+    if incognito:
+        chrome_options.add_argument("--incognito")
+    if maximize:
+        chrome_options.add_argument("--start-maximized")
+    if profile == SCRAPE_PROFILE:
+        chrome_options.page_load_strategy = "eager"
+        chrome_options.add_experimental_option("prefs", SCRAPE_PREFS)
+        for argument in SCRAPE_ARGUMENTS:
+            chrome_options.add_argument(argument)
+    return chrome_options
 
 # Function to create a Chrome WebDriver instance with specified options
-def create_chrome_driver(headless: bool = False, incognito: bool = False, maximize: bool = False) -> webdriver.Chrome:
+def create_chrome_driver(headless: bool = False, incognito: bool = False, maximize: bool = False,
+                         profile: str = DEFAULT_PROFILE, blocked_url_patterns: Optional[List[str]] = None) -> webdriver.Chrome:
     """
     Create a Chrome WebDriver instance with specified options.
 
@@ -20,30 +243,65 @@ def create_chrome_driver(headless: bool = False, incognito: bool = False, maximi
         headless (bool): Run in headless mode if True.
         incognito (bool): Open in incognito mode if True.
         maximize (bool): Maximize the window if True.
+        profile (str): "default" for a regular browser or "scrape" to only load the DOM: images, fonts,
+            media and trackers are blocked, the page load strategy is eager and GPU, extensions and
+            background throttling are disabled.
+        blocked_url_patterns (List[str]): Extra URL patterns to block, added to `SCRAPE_BLOCKED_URL_PATTERNS`
+            on the scrape profile.
 
     Returns:
         webdriver.Chrome: Configured Chrome WebDriver instance.
     """
     # Set up Chrome options and service
-    logger.info(f"Creating Chrome WebDriver with headless={headless}, incognito={incognito}, maximize={maximize}")
-    try:
-        chrome_options = ChromeOptions()
-        if headless:
-            chrome_options.add_argument("--headless")
-        if incognito:
-            chrome_options.add_argument("--incognito")
-        if maximize:
-            chrome_options.add_argument("--start-maximized")
-    
-        chrome_service = ChromeService(ChromeDriverManager().install())
+    logger.info("Creating Chrome WebDriver with headless=%s, incognito=%s, maximize=%s, profile=%s",
+                headless, incognito, maximize, profile)
+    chrome_options = build_chrome_options(headless, incognito, maximize, profile)
+    blocked_url_patterns = list(blocked_url_patterns or [])
+    if profile == SCRAPE_PROFILE:
+        blocked_url_patterns = SCRAPE_BLOCKED_URL_PATTERNS + [pattern for pattern in blocked_url_patterns
+                                                              if pattern not in SCRAPE_BLOCKED_URL_PATTERNS]
+    try:
+        # Resolve the driver once per process, None lets Selenium Manager find it
+        chrome_service = ChromeService(resolve_chromedriver_path())
         # Create the Chrome WebDriver instance
         driver = webdriver.Chrome(service=chrome_service, options=chrome_options)
+        if blocked_url_patterns:
+            block_urls(driver, blocked_url_patterns)
         logger.info("Chrome WebDriver created successfully.")
         return driver
     
     except Exception as e_chrome_driver:
-        logger.error(f"Error creating Chrome driver: {e_chrome_driver}")
+        logger.error("Error creating Chrome driver: %s", e_chrome_driver)
         raise e_chrome_driver
+
+# Function to create a remote Chrome session on a Selenium Grid
+def create_remote_driver(command_executor: str, headless: bool = True, incognito: bool = False, maximize: bool = False,
+                         profile: str = DEFAULT_PROFILE) -> WebDriver:
+    """
+    Create a Chrome session on a Selenium Grid (hub, standalone or node URL, e.g., "http://localhost:4444").
+    The session works with `close_driver` and every helper. The CDP URL blocking of the scrape profile is
+    not available through the Grid, only its Chrome preferences and arguments apply.
+
+    Args:
+        command_executor (str): URL of the Grid.
+        headless (bool): Run in headless mode if True.
+        incognito (bool): Open in incognito mode if True.
+        maximize (bool): Maximize the window if True.
+        profile (str): "default" or "scrape", see `create_chrome_driver`.
+
+    Returns:
+        WebDriver: The remote session.
+    """
+    logger.info("Creating remote WebDriver on %s with headless=%s, incognito=%s, maximize=%s, profile=%s",
+                command_executor, headless, incognito, maximize, profile)
+    chrome_options = build_chrome_options(headless, incognito, maximize, profile)
+    try:
+        driver = webdriver.Remote(command_executor = command_executor, options = chrome_options)
+        logger.info("Remote WebDriver created successfully, session %s.", driver.session_id)
+        return driver
+    except Exception as e_remote_driver:
+        logger.error("Error creating remote driver on %s: %s", command_executor, e_remote_driver)
+        raise e_remote_driver
     
 # Function to close the WebDriver instance
 def close_driver(driver: webdriver.Chrome) -> None:
@@ -58,5 +316,342 @@ def close_driver(driver: webdriver.Chrome) -> None:
         driver.quit()
         logger.info("WebDriver closed successfully.")
     except Exception as e_close_driver:
-        logger.error(f"Error closing the WebDriver, the driver is invalid or it is  already closed: {e_close_driver}")
-        raise e_close_driver
\ No newline at end of file
+        logger.error("Error closing the WebDriver, the driver is invalid or it is  already closed: %s", e_close_driver)
+        raise e_close_driver
+
+# Define function to check if a driver is still responsive
+def is_driver_healthy(driver: WebDriver) -> bool:
+    """
+    Check if the WebDriver session is still alive and responsive.
+
+    Args:
+        driver (WebDriver): The WebDriver instance to check.
+
+    Returns:
+        bool: True if the session answers a trivial command, False otherwise.
+    """
+    try:
+        driver.execute_script("return 1;")
+        return len(driver.window_handles) > 0
+    except Exception as e_unhealthy:
+        logger.warning("Driver health check failed: %s", e_unhealthy)
+        return False
+
+# Define function to clear the cookies and storage of the whole browser through CDP
+def _clear_browser_data(driver: WebDriver, origins: List[str]) -> bool:
+    """
+    Delete the cookies of every domain and the storage of the given origins with the CDP `Network.clearBrowserCookies`
+    and `Storage.clearDataForOrigin` commands. Only Chromium drivers support them.
+
+    Returns:
+        bool: True if the browser data was cleared, False if CDP is not available.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        return True
+    except Exception as e_cdp:
+        logger.warning("Could not clear the browser data through CDP, falling back to WebDriver: %s", e_cdp)
+        return False
+
+# Define function to reset the state of a driver so it can be reused
+def reset_driver(driver: WebDriver, origins: Optional[List[str]] = None) -> bool:
+    """
+    Reset the browser state so the driver can be reused by another job.
+    Extra tabs are closed, the cookies of every domain and the storage of the current origin and of `origins`
+    are deleted, and the remaining tab is sent to a blank page. On Chromium this is done through CDP, so the
+    host-only cookies of other domains (e.g., accounts.spotify.com) do not leak into the next job. Other
+    browsers fall back to the WebDriver calls, which only reach the current origin.
+
+    Args:
+        driver (WebDriver): The WebDriver instance to reset.
+        origins (List[str]): Origins to clear besides the current one, defaults to `RESET_ORIGINS`.
+
+    Returns:
+        bool: True if the reset was successful, False otherwise.
+    """
+    logger.info("Resetting the WebDriver state...")
+    try:
+        handles = driver.window_handles
+        # Close every tab except the first one
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        current_origin = driver.execute_script("return window.location.origin;")
+        origins = list(RESET_ORIGINS if origins is None else origins)
+        if current_origin and current_origin != "null" and current_origin not in origins:
+            origins.append(current_origin)
+        if not _clear_browser_data(driver, origins):
+            # Clear the storage of the current origin before leaving it
+            driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+        logger.info("WebDriver state reset successfully.")
+        return True
+    except Exception as e_reset:
+        logger.error("Error resetting the WebDriver state: %s", e_reset, exc_info = True)
+        return False
+
+
+@dataclass
+class _PooledDriver:
+    """Bookkeeping for a single driver living inside a DriverPool."""
+    driver: WebDriver
+    created_at: float = field(default_factory = time.monotonic)
+    last_used_at: float = field(default_factory = time.monotonic)
+    uses: int = 0
+
+
+# Class to keep a warm pool of WebDriver instances with lease/return semantics
+class DriverPool:
+    """
+    Keep N pre-launched WebDriver instances and lease them out instead of starting a new browser per job.
+
+    Drivers are handed out with `acquire()`/`release()` or the `lease()` context manager. On release the
+    browser state is reset instead of quitting the browser, and the driver is recycled once it reaches
+    `max_uses`, lives longer than `max_age`, stays idle longer than `idle_timeout` or looks unhealthy.
+
+    Args:
+        size (int): Maximum number of drivers alive at the same time.
+        max_uses (int): Number of leases after which a driver is recycled.
+        idle_timeout (float): Seconds a driver may stay idle in the pool before it is recycled.
+        max_age (float): Seconds a driver may live before it is recycled.
+        prelaunch (bool): Launch `size` drivers when the pool is created if True.
+        driver_factory (Callable): Function used to launch a driver, defaults to `create_chrome_driver`.
+        **driver_kwargs: Keyword arguments passed to `driver_factory`.
+    """
+
+    def __init__(self, size: int = 2, max_uses: int = 50, idle_timeout: float = 300.0, max_age: float = 1800.0,
+                 prelaunch: bool = True, driver_factory: Optional[Callable[..., WebDriver]] = None, **driver_kwargs) -> None:
+        if size < 1:
+            raise ValueError("The pool size must be at least 1.")
+        self.size = size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+        self._driver_factory = driver_factory or create_chrome_driver
+        self._driver_kwargs = driver_kwargs
+        self._idle: List[_PooledDriver] = []
+        self._leased: Dict[int, _PooledDriver] = {}
+        self._launching = 0
+        self._returning = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        # Counters exposed through `stats`
+        self.hits = 0
+        self.launches = 0
+        self.recycles = 0
+        logger.info("Creating DriverPool with size=%s, max_uses=%s, idle_timeout=%s, max_age=%s",
+                    size, max_uses, idle_timeout, max_age)
+        if prelaunch:
+            self.warm_up()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters of the pool: hits, launches, recycles, idle and leased drivers."""
+        with self._condition:
+            return {
+                "hits": self.hits,
+                "launches": self.launches,
+                "recycles": self.recycles,
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+            }
+
+    def warm_up(self) -> None:
+        """
+        Launch drivers until the pool holds `size` instances.
+        """
+        while True:
+            with self._condition:
+                if self._closed or self._total() >= self.size:
+                    return
+                self._launching += 1
+            try:
+                entry = self._launch()
+            except Exception:
+                with self._condition:
+                    self._launching -= 1
+                    self._condition.notify()
+                raise
+            # Move the driver from launching to idle in one step so it is always counted
+            with self._condition:
+                self._launching -= 1
+                self._idle.append(entry)
+                self._condition.notify()
+
+    def acquire(self, timeout: Optional[float] = None) -> WebDriver:
+        """
+        Lease a driver from the pool, launching a new one if there is free capacity.
+
+        Args:
+            timeout (float): Maximum seconds to wait for a free driver, None waits forever.
+
+        Returns:
+            WebDriver: A driver ready to be used.
+
+        Raises:
+            TimeoutError: If no driver becomes available within the timeout.
+            RuntimeError: If the pool is closed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        entry = None
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("The DriverPool is closed.")
+                expired = self._evict_expired()
+                if not expired:
+                    if self._idle:
+                        entry = self._idle.pop()
+                        self.hits += 1
+                        self._lease(entry)
+                        break
+                    if self._total() < self.size:
+                        # Reserve the slot and launch the driver outside of the lock
+                        self._launching += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No driver available in the pool after {timeout} seconds.")
+                    self._condition.wait(remaining)
+                    continue
+            # Quit the expired drivers outside of the lock, they stay counted until they are gone
+            for expired_entry in expired:
+                self._quit(expired_entry.driver)
+            with self._condition:
+                self._returning -= len(expired)
+                self._condition.notify(len(expired))
+        if entry is None:
+            try:
+                entry = self._launch()
+            except Exception:
+                with self._condition:
+                    self._launching -= 1
+                    self._condition.notify()
+                raise
+            # Move the driver from launching to leased in one step so it is always counted
+            with self._condition:
+                self._launching -= 1
+                self._lease(entry)
+        logger.info("Driver leased from the pool (hits=%s, launches=%s, recycles=%s).",
+                    self.hits, self.launches, self.recycles)
+        return entry.driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Return a leased driver to the pool. The driver is reset, or recycled if it reached its limits or is unhealthy.
+
+        Args:
+            driver (WebDriver): The driver previously returned by `acquire()`.
+        """
+        with self._condition:
+            entry = self._leased.pop(id(driver), None)
+            if entry is not None:
+                # Keep the driver counted while it is reset or quit outside of the lock
+                self._returning += 1
+        if entry is None:
+            logger.warning("The driver does not belong to this pool, closing it.")
+            self._quit(driver)
+            return
+        reset = False
+        try:
+            now = time.monotonic()
+            if self._closed or entry.uses >= self.max_uses or now - entry.created_at >= self.max_age:
+                self._recycle(entry)
+            elif not is_driver_healthy(driver) or not reset_driver(driver):
+                self._recycle(entry)
+            else:
+                entry.last_used_at = time.monotonic()
+                reset = True
+        finally:
+            with self._condition:
+                self._returning -= 1
+                # The pool may have been closed while the driver was reset
+                reusable = reset and not self._closed
+                if reusable:
+                    self._idle.append(entry)
+                self._condition.notify()
+        if reset and not reusable:
+            self._quit(driver)
+        logger.info("Driver returned to the pool.")
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        """
+        Context manager that acquires a driver and releases it when the block ends.
+
+        Args:
+            timeout (float): Maximum seconds to wait for a free driver, None waits forever.
+
+        Yields:
+            WebDriver: A driver ready to be used.
+        """
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """
+        Quit every idle driver and mark the pool as closed. Leased drivers are quit when they are released.
+        """
+        logger.info("Closing the DriverPool...")
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for entry in idle:
+            self._quit(entry.driver)
+        logger.info("DriverPool closed successfully.")
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _total(self) -> int:
+        return len(self._idle) + len(self._leased) + self._launching + self._returning
+
+    def _lease(self, entry: _PooledDriver) -> None:
+        # Called with the lock held, marks the driver as leased
+        entry.uses += 1
+        entry.last_used_at = time.monotonic()
+        self._leased[id(entry.driver)] = entry
+
+    def _launch(self) -> _PooledDriver:
+        driver = self._driver_factory(**self._driver_kwargs)
+        with self._condition:
+            self.launches += 1
+        return _PooledDriver(driver = driver)
+
+    def _evict_expired(self) -> List[_PooledDriver]:
+        # Called with the lock held, takes out the idle drivers that exceeded the idle timeout or the max age.
+        # They are counted as returning until the caller quits them outside of the lock
+        now = time.monotonic()
+        expired = [entry for entry in self._idle
+                   if now - entry.last_used_at >= self.idle_timeout or now - entry.created_at >= self.max_age]
+        for entry in expired:
+            self._idle.remove(entry)
+            self.recycles += 1
+        self._returning += len(expired)
+        return expired
+
+    def _recycle(self, entry: _PooledDriver) -> None:
+        logger.info("Recycling driver after %s uses.", entry.uses)
+        with self._condition:
+            self.recycles += 1
+        self._quit(entry.driver)
+
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e_quit:
+            logger.warning("Error quitting a pooled driver: %s", e_quit)
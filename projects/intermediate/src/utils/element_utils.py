@@ -3,21 +3,65 @@
 # Import all the necessary libraries from Selenium
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support.ui import WebElement
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException, WebDriverException
 # import the necessary libraries for the project
-from typing import Optional, List
+from .wait_utils import to_page_selector, wait_for_locator
+from .retry_utils import DEFAULT_POLICY, CircuitOpenError, RetryPolicy, call_with_policy, remember_locator
+from typing import Any, Dict, Optional, List, Sequence, Union
+import threading
 import logging
 
 # set up logging configuration
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 # Constants values for the project
 DEFAULT_TIMEOUT = 10
 
+# Script executed in the page: reads presence, visibility, text, attributes and rect of every locator at once
+SNAPSHOT_SCRIPT = """
+const [locators, attributes] = arguments;
+function findAll(strategy, value) {
+    if (strategy === 'css selector') return Array.from(document.querySelectorAll(value));
+    const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+}
+function isVisible(node) {
+    const style = window.getComputedStyle(node);
+    const rect = node.getBoundingClientRect();
+    return style.visibility !== 'hidden' && style.display !== 'none' && parseFloat(style.opacity || '1') > 0 && rect.width > 0 && rect.height > 0;
+}
+const result = {};
+for (const [name, locator] of Object.entries(locators)) {
+    const nodes = findAll(locator[0], locator[1]);
+    const node = nodes.length > 0 ? nodes[0] : null;
+    if (node === null) {
+        result[name] = {present: false, count: 0, visible: false, text: null, attributes: {}, rect: null};
+        continue;
+    }
+    const rect = node.getBoundingClientRect();
+    const values = {};
+    for (const attribute of attributes) values[attribute] = attribute in node && typeof node[attribute] !== 'function' && typeof node[attribute] !== 'object' ? String(node[attribute]) : node.getAttribute(attribute);
+    result[name] = {
+        present: true,
+        count: nodes.length,
+        visible: isVisible(node),
+        text: (node.innerText !== undefined ? node.innerText : node.textContent).trim(),
+        attributes: values,
+        rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+    };
+}
+return result;
+"""
+
+# Counters of the snapshot calls and of the WebDriver commands they saved
+_snapshot_stats = {"calls": 0, "commands": 0, "equivalent_commands": 0}
+_snapshot_stats_lock = threading.Lock()
+
 # Define function to find an element by its locator
-def find_element(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIMEOUT) -> Optional[WebElement]:
+def find_element(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIMEOUT, event_driven: bool = False) -> Optional[WebElement]:
     """
     Find an element on the page using the provided locator.
 
@@ -25,25 +69,32 @@ def find_element(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIMEO
         driver (WebDriver): The Selenium WebDriver instance.
         locator (tuple): A tuple containing the locator strategy and value (e.g., (By.ID, "element_id")).
         timeout (int): The maximum time to wait for the element to be found.
+        event_driven (bool): Wait with a MutationObserver instead of polling every 500 ms if True.
 
     Returns:
         WebElement: The web element if found, None otherwise.
     """
-    logger.info(f"Finding element with locator: {locator}")
+    logger.debug("Finding element with locator: %s", locator)
     try:
-        wait = WebDriverWait(driver, timeout)
-        element = wait.until(EC.presence_of_element_located(locator))
-        logger.info("Element found!")
+        if event_driven:
+            element = wait_for_locator(driver, locator, timeout)
+            if element is None:
+                raise TimeoutException(f"Element {locator} not found after {timeout} seconds.")
+        else:
+            wait = WebDriverWait(driver, timeout)
+            element = wait.until(EC.presence_of_element_located(locator))
+        remember_locator(element, locator)
+        logger.debug("Element found!")
         return element
     except (TimeoutException, NoSuchElementException) as e_not_found:
-        logger.error(f"Element not found: {e_not_found}", exc_info=True)
+        logger.error("Element not found: %s", e_not_found, exc_info=True)
         return None
     except Exception as e_unhandled:
-        logger.error(f"Unhandled exception: {e_unhandled}", exc_info=True)
+        logger.error("Unhandled exception: %s", e_unhandled, exc_info=True)
         return None
     
 # Define function to find multiple elements by their locator
-def find_elements(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIMEOUT) -> List[WebElement]:
+def find_elements(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIMEOUT, event_driven: bool = False) -> List[WebElement]:
     """
     Find multiple elements on the page using the provided locator.
 
@@ -51,83 +102,104 @@ def find_elements(driver: WebDriver, locator: tuple, timeout: int = DEFAULT_TIME
         driver (WebDriver): The Selenium WebDriver instance.
         locator (tuple): A tuple containing the locator strategy and value (e.g., (By.ID, "element_id")).
         timeout (int): The maximum time to wait for the elements to be found.
+        event_driven (bool): Wait with a MutationObserver instead of polling every 500 ms if True.
 
     Returns:
         List[WebElement]: A list of web elements if found, empty list otherwise.
     """
-    logger.info(f"Finding elements with locator: {locator}")
+    logger.debug("Finding elements with locator: %s", locator)
     try:
-        wait = WebDriverWait(driver, timeout)
-        elements = wait.until(EC.presence_of_all_elements_located(locator))
-        logger.info("Elements found!")
+        if event_driven:
+            elements = wait_for_locator(driver, locator, timeout, all = True)
+            if elements is None:
+                raise TimeoutException(f"Elements {locator} not found after {timeout} seconds.")
+        else:
+            wait = WebDriverWait(driver, timeout)
+            elements = wait.until(EC.presence_of_all_elements_located(locator))
+        for index, element in enumerate(elements):
+            remember_locator(element, locator, index)
+        logger.debug("Elements found!")
         return elements
     except (TimeoutException, NoSuchElementException) as e_not_found:
-        logger.error(f"Elements not found: {e_not_found}", exc_info=True)
+        logger.error("Elements not found: %s", e_not_found, exc_info=True)
         return []
     except Exception as e_unhandled:
-        logger.error(f"Unhandled exception: {e_unhandled}", exc_info=True)
+        logger.error("Unhandled exception: %s", e_unhandled, exc_info=True)
         return []
     
 # Define a function to make a click on an element
-def click_element(driver: WebDriver, element: WebElement, timeout: int = DEFAULT_TIMEOUT) -> bool:
+def click_element(driver: WebDriver, element: WebElement, timeout: int = DEFAULT_TIMEOUT,
+                  policy: RetryPolicy = DEFAULT_POLICY) -> bool:
     """
-    Click on a web element.
+    Click on a web element. An intercepted click or a stale element is retried as the policy declares,
+    a stale element being found again with the locator it was found with.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
         element (WebElement): The web element to click on.
         timeout (int): The maximum time to wait for the element to be clickable.
+        policy (RetryPolicy): The retry policy of the click.
 
     Returns:
         bool: True if the click was successful, False otherwise.
     """
-    logger.info("Clicking on the element...")
-    try:
+    logger.debug("Clicking on the element...")
+
+    def click(element: WebElement) -> None:
         wait = WebDriverWait(driver, timeout)
         wait.until(EC.element_to_be_clickable(element))
         element.click()
-        logger.info("Element clicked!")
+
+    try:
+        call_with_policy(driver, click, element, policy)
+        logger.debug("Element clicked!")
         return True
-    except (TimeoutException, ElementClickInterceptedException, StaleElementReferenceException) as e_click_failed:
-        logger.error(f"Click failed: {e_click_failed}", exc_info=True)
+    except (TimeoutException, ElementClickInterceptedException, StaleElementReferenceException, CircuitOpenError) as e_click_failed:
+        logger.error("Click failed: %s", e_click_failed, exc_info=True)
         return False
     except Exception as e_unhandled:
-        logger.error(f"Unhandled exception during click: {e_unhandled}", exc_info=True)
+        logger.error("Unhandled exception during click: %s", e_unhandled, exc_info=True)
         return False
     
 # Define a function to send keys to an element
-def send_keys_to_element(driver: WebDriver, element: WebElement, keys: str, clear_element: bool = True, timeout: int = DEFAULT_TIMEOUT) -> bool:
+def send_keys_to_element(driver: WebDriver, element: Union[WebElement, tuple], keys: str, clear_element: bool = True,
+                         timeout: int = DEFAULT_TIMEOUT, policy: RetryPolicy = DEFAULT_POLICY) -> bool:
     """
-    Send keys to a web element.
+    Send keys to a web element. A stale element is found again and the keys are sent again, as the policy declares.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
-        element (WebElement): The web element to send keys to.
+        element (WebElement or tuple): The web element to send keys to, or its locator.
         keys (str): The keys to send to the element.
         clear_element (bool): Whether to clear the element before sending keys.
         timeout (int): The maximum time to wait for the element to be interactable.
+        policy (RetryPolicy): The retry policy of the keys.
 
     Returns:
         bool: True if the keys were sent successfully, False otherwise.
     """
-    logger.debug(f"Sending keys {keys} to the element {element}...")
-    element_to_send_keys = find_element(driver, element, timeout)
+    logger.debug("Sending %s keys to the element %s...", len(keys), element)
+    element_to_send_keys = find_element(driver, element, timeout) if isinstance(element, tuple) else element
     if not element_to_send_keys:
         logger.error("Element not found for sending keys.")
         return False
-    try:
+
+    def send_keys(element: WebElement) -> None:
         wait = WebDriverWait(driver, timeout)
-        wait.until(EC.element_to_be_clickable(element_to_send_keys))
+        wait.until(EC.element_to_be_clickable(element))
         if clear_element:
-            element_to_send_keys.clear()
-        element_to_send_keys.send_keys(keys)
-        logger.info("Keys sent successfully!")
+            element.clear()
+        element.send_keys(keys)
+
+    try:
+        call_with_policy(driver, send_keys, element_to_send_keys, policy)
+        logger.debug("Keys sent successfully!")
         return True
-    except (TimeoutException, StaleElementReferenceException) as e_send_keys_failed:
-        logger.error(f"Sending keys failed: {e_send_keys_failed}", exc_info=True)
+    except (TimeoutException, StaleElementReferenceException, CircuitOpenError) as e_send_keys_failed:
+        logger.error("Sending keys failed: %s", e_send_keys_failed, exc_info=True)
         return False
     except Exception as e_unhandled:
-        logger.error(f"Unhandled exception during sending keys: {e_unhandled}", exc_info=True)
+        logger.error("Unhandled exception during sending keys: %s", e_unhandled, exc_info=True)
         return False
 
 # Define a function to check if an element is visible
@@ -143,38 +215,104 @@ def is_element_visible(driver: WebDriver, element: WebElement, timeout: int = DE
     Returns:
         bool: True if the element is visible, False otherwise.
     """
-    logger.info("Checking if the element is visible...")
+    logger.debug("Checking if the element is visible...")
     try:
         wait = WebDriverWait(driver, timeout)
         wait.until(EC.visibility_of(element))
-        logger.info("Element is visible!")
+        logger.debug("Element is visible!")
         return True
     except (TimeoutException, StaleElementReferenceException) as e_not_visible:
-        logger.error(f"Element not visible: {e_not_visible}", exc_info=True)
+        logger.error("Element not visible: %s", e_not_visible, exc_info=True)
         return False
     except Exception as e_unhandled:
-        logger.error(f"Unhandled exception during visibility check: {e_unhandled}", exc_info=True)
+        logger.error("Unhandled exception during visibility check: %s", e_unhandled, exc_info=True)
         return False
     
 # Define a function to extract text from an element
-def get_element_text(element: WebElement) -> Optional[str]:
+def get_element_text(element: WebElement, policy: RetryPolicy = DEFAULT_POLICY) -> Optional[str]:
     """
-    Extract text from a web element.
+    Extract text from a web element. A stale element is found again with its locator, as the policy declares.
 
     Args:
         element (WebElement): The web element to extract text from.
+        policy (RetryPolicy): The retry policy of the extraction.
 
     Returns:
         str: The extracted text if successful, None otherwise.   
     """
-    logger.info("Extracting text from the element...")
+    logger.debug("Extracting text from the element...")
     try:
-        text = element.text
-        logger.info(f"Extracted text: {text}")
+        # The element knows its driver, which is needed to find it again and for the circuit breaker
+        text = call_with_policy(getattr(element, "parent", None), lambda element: element.text, element, policy)
+        logger.debug("Extracted text: %s", text)
         return text
-    except StaleElementReferenceException as e_stale:
-        logger.error(f"Stale element reference: {e_stale}", exc_info=True)
+    except (StaleElementReferenceException, CircuitOpenError) as e_text_failed:
+        logger.error("Text extraction failed: %s", e_text_failed, exc_info=True)
         return None
     except Exception as e_unhandled:
-        logger.error(f"Unhandled exception during text extraction: {e_unhandled}", exc_info=True)
-        return None
\ No newline at end of file
+        logger.error("Unhandled exception during text extraction: %s", e_unhandled, exc_info=True)
+        return None
+
+# Define a function to read the state of several elements in a single round-trip
+def snapshot(driver: WebDriver, locators: Dict[str, tuple], attributes: Sequence[str] = ()) -> Dict[str, Dict[str, Any]]:
+    """
+    Read, for each named locator, its presence, number of matches, visibility, text, selected attributes
+    and bounding rect with a single `execute_script` call. The first match of each locator is described.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        locators (Dict[str, tuple]): Locators by name (e.g., {"search": (By.CSS_SELECTOR, "[data-testid='search-input']")}).
+        attributes (Sequence[str]): Attributes or properties to read from every element (e.g., ["placeholder", "value"]).
+
+    Returns:
+        Dict[str, dict]: For each name: present, count, visible, text, attributes and rect. Empty dict if the
+        script fails on the page.
+
+    Raises:
+        ValueError: If a locator uses a strategy the page script cannot translate (e.g., link text).
+    """
+    logger.debug("Taking a snapshot of %s locators...", len(locators))
+    page_locators = {}
+    for name, locator in locators.items():
+        page_selector = to_page_selector(locator)
+        if page_selector is None:
+            raise ValueError(f"Locator {locator} of '{name}' cannot be used in a snapshot, use CSS, XPath, ID, name, class or tag.")
+        page_locators[name] = list(page_selector)
+    try:
+        result = driver.execute_script(SNAPSHOT_SCRIPT, page_locators, list(attributes))
+    except WebDriverException as e_snapshot:
+        logger.error("Snapshot failed: %s", e_snapshot, exc_info=True)
+        return {}
+    except Exception as e_unhandled:
+        logger.error("Unhandled exception during snapshot: %s", e_unhandled, exc_info=True)
+        return {}
+    # Commands the per-helper approach needs: find_elements, and for present elements is_displayed, text, rect and each attribute
+    equivalent = sum(1 + (3 + len(attributes) if state["present"] else 0) for state in result.values())
+    with _snapshot_stats_lock:
+        _snapshot_stats["calls"] += 1
+        _snapshot_stats["commands"] += 1
+        _snapshot_stats["equivalent_commands"] += equivalent
+    logger.debug("Snapshot taken with 1 command instead of %s.", equivalent)
+    return result
+
+# Define a function to report the commands saved by the snapshots
+def get_snapshot_stats() -> Dict[str, int]:
+    """
+    Report the snapshot calls, the WebDriver commands they used and the commands the per-helper approach would have used.
+
+    Returns:
+        dict: calls, commands, equivalent_commands and commands_saved.
+    """
+    with _snapshot_stats_lock:
+        stats = dict(_snapshot_stats)
+    stats["commands_saved"] = stats["equivalent_commands"] - stats["commands"]
+    return stats
+
+# Define a function to reset the snapshot counters
+def reset_snapshot_stats() -> None:
+    """
+    Reset the snapshot counters.
+    """
+    with _snapshot_stats_lock:
+        for key in _snapshot_stats:
+            _snapshot_stats[key] = 0
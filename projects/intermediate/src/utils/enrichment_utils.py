@@ -0,0 +1,351 @@
+"""This page contains a runner that enriches artists in parallel across a process pool of browsers."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+# Import the necessary libraries for the project
+from .artist_utils import artist_info_steps, scrape_artist_info
+from .checkpoint_utils import CheckpointStore
+from .driver_utils import create_chrome_driver, close_driver, is_driver_healthy
+from .grid_utils import DEFAULT_MAX_REQUEUES, Backend, GridScheduler, NodeReport
+from .tab_utils import TabScheduler
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import util as multiprocessing_util
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import json
+import random
+import threading
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the enrichment
+DEFAULT_ARTIST_TIMEOUT = 60.0
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 2.0
+
+# Driver owned by the current worker process
+_worker_driver: Optional[WebDriver] = None
+_worker_driver_kwargs: Dict[str, Any] = {}
+
+# Class to report the result of an enrichment run
+@dataclass
+class EnrichmentReport:
+    """
+    Summary of an enrichment run.
+
+    Args:
+        workers (int): Number of worker processes.
+        results (List[dict]): Artist data in the same order as the input, None for the failed artists.
+        errors (Dict[str, str]): Last error message of each failed artist.
+        elapsed (float): Wall time of the run in seconds.
+        nodes (Dict[str, NodeReport]): Work done by each node, only for the runs on a Grid.
+    """
+    workers: int
+    results: List[Optional[dict]] = field(default_factory = list)
+    errors: Dict[str, str] = field(default_factory = dict)
+    elapsed: float = 0.0
+    nodes: Dict[str, NodeReport] = field(default_factory = dict)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(result is not None for result in self.results)
+
+    @property
+    def artists_per_minute(self) -> float:
+        return self.succeeded / self.elapsed * 60 if self.elapsed else 0.0
+
+
+# Class to hand the results of a run to the callback and the checkpoint in input order
+class _OrderedResults:
+    """
+    Collect the results of a run as they finish, in any order, and pass each successful one to `on_result`
+    and mark its artist as done in the checkpoint as soon as every previous artist is finished. An artist is
+    only marked as done after its result was handed over, so a crash never loses a result marked as done.
+    The results are emitted outside the lock by one thread at a time, which also emits the results made
+    ready by the other threads meanwhile, so a slow sink never blocks the threads adding results.
+    """
+
+    def __init__(self, artists: List[str], on_result: Optional[Callable[[dict], None]],
+                 checkpoint: Optional[CheckpointStore], target: str) -> None:
+        self._artists = artists
+        self._on_result = on_result
+        self._checkpoint = checkpoint
+        self._target = target
+        self._finished: Dict[int, Optional[dict]] = {}
+        self._next_index = 0
+        self._ready: List[Tuple[str, dict]] = []
+        self._emitting = False
+        self._lock = threading.Lock()
+
+    def add(self, index: int, result: Optional[dict]) -> None:
+        """Record the result of the artist at `index`, None if it failed, and emit the results now in order."""
+        with self._lock:
+            self._finished[index] = result
+            while self._next_index in self._finished:
+                ordered_result = self._finished.pop(self._next_index)
+                if ordered_result is not None:
+                    self._ready.append((self._artists[self._next_index], ordered_result))
+                self._next_index += 1
+            if self._emitting:
+                return
+            self._emitting = True
+        try:
+            while True:
+                with self._lock:
+                    ready, self._ready = self._ready, []
+                    if not ready:
+                        self._emitting = False
+                        return
+                for artist, ordered_result in ready:
+                    if self._on_result:
+                        self._on_result(ordered_result)
+                    if self._checkpoint:
+                        self._checkpoint.mark_item_done(self._target, artist)
+        except BaseException:
+            with self._lock:
+                self._emitting = False
+            raise
+
+    def close(self, results: List[Optional[dict]]) -> None:
+        """Emit the results that are still waiting, the artists never finished count as failed."""
+        for index, result in enumerate(results):
+            if index >= self._next_index and index not in self._finished:
+                self.add(index, result)
+
+
+# Define function to read the unique artists from the playlist JSON
+def load_artists(json_path: str) -> List[str]:
+    """
+    Read the unique artists of a playlist JSON file, in order of first appearance.
+
+    Args:
+        json_path (str): Path of the playlist JSON (the beginner "Artists" or the tracklist "artists" key).
+
+    Returns:
+        List[str]: The unique artist names.
+    """
+    with open(json_path, "r", encoding = "utf-8") as file:
+        songs = json.load(file)
+    artists = {}
+    for song in songs:
+        for artist in song.get("Artists") or song.get("artists") or []:
+            artists.setdefault(artist, None)
+    return list(artists)
+
+# Define function to initialize a worker process
+def _init_worker(driver_kwargs: Dict[str, Any]) -> None:
+    global _worker_driver_kwargs
+    _worker_driver_kwargs = driver_kwargs
+    # Quit the driver when the worker process exits
+    multiprocessing_util.Finalize(None, _close_worker_driver, exitpriority = 10)
+
+def _get_worker_driver() -> WebDriver:
+    global _worker_driver
+    if _worker_driver is None:
+        _worker_driver = create_chrome_driver(**_worker_driver_kwargs)
+    return _worker_driver
+
+def _close_worker_driver() -> None:
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            close_driver(_worker_driver)
+        except Exception as e_close:
+            logger.warning("Error closing the worker driver: %s", e_close)
+        _worker_driver = None
+
+# Define function to quit the worker driver once an attempt outlived its budget
+def _expire_attempt(driver: WebDriver, expired: threading.Event) -> None:
+    expired.set()
+    logger.warning("Artist lookup exceeded its time budget, quitting the browser.")
+    try:
+        driver.quit()
+    except Exception as e_quit:
+        logger.warning("Error quitting the expired worker driver: %s", e_quit)
+
+# Define function executed by the workers for each artist
+def _enrich_artist(index: int, artist: str, lookup: Callable[..., dict], lookup_kwargs: Dict[str, Any],
+                   timeout: float, retries: int, backoff: float) -> tuple:
+    """
+    Look up an artist in the driver of the worker, retrying with exponential backoff and jitter.
+    The page loads, scripts and waits of an attempt use `timeout`, and a watchdog quits the browser when the
+    attempt outlives it, so a hung lookup fails instead of blocking the worker.
+
+    Returns:
+        tuple: (index, artist, result or None, last error message or None, attempts).
+    """
+    last_error = None
+    for attempt in range(1, retries + 2):
+        driver = None
+        watchdog = None
+        expired = threading.Event()
+        try:
+            # A failed browser launch only fails this attempt
+            driver = _get_worker_driver()
+            watchdog = threading.Timer(timeout, _expire_attempt, args = (driver, expired))
+            watchdog.daemon = True
+            watchdog.start()
+            driver.set_page_load_timeout(timeout)
+            driver.set_script_timeout(timeout)
+            result = lookup(driver, artist, timeout = timeout, **lookup_kwargs)
+            return index, artist, result, None, attempt
+        except Exception as e_lookup:
+            last_error = f"{type(e_lookup).__name__}: {e_lookup}"
+            if expired.is_set():
+                last_error = f"TimeoutError: Lookup of {artist} took longer than {timeout}s ({last_error})."
+            logger.warning("Attempt %s failed for %s: %s", attempt, artist, last_error)
+            # A broken or expired browser is replaced before the next attempt
+            if driver is not None and (expired.is_set() or not is_driver_healthy(driver)):
+                _close_worker_driver()
+            if attempt <= retries:
+                time.sleep(backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+        finally:
+            if watchdog is not None:
+                watchdog.cancel()
+    return index, artist, None, last_error, retries + 1
+
+# Define function to enrich the artists across N worker processes
+def enrich_artists(artists: List[str], workers: int = 2, timeout: float = DEFAULT_ARTIST_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                   backoff: float = DEFAULT_BACKOFF, lookup: Callable[..., dict] = scrape_artist_info,
+                   lookup_kwargs: Optional[Dict[str, Any]] = None, driver_kwargs: Optional[Dict[str, Any]] = None,
+                   on_result: Optional[Callable[[dict], None]] = None, checkpoint: Optional[CheckpointStore] = None,
+                   target: str = "artists") -> EnrichmentReport:
+    """
+    Look up the artists across `workers` processes, each one with its own driver.
+
+    Results are merged in the input order: `on_result` (e.g., `sink.write`) receives each artist as soon as
+    every previous artist is finished, so the output has the same order with any number of workers.
+
+    Args:
+        artists (List[str]): The artist names.
+        workers (int): Number of worker processes (browsers).
+        timeout (float): Maximum seconds per artist attempt.
+        retries (int): Number of retries after a failed attempt.
+        backoff (float): Base seconds of the exponential backoff between attempts.
+        lookup (Callable): Module level function `(driver, artist, timeout, **lookup_kwargs) -> dict`.
+        lookup_kwargs (dict): Extra arguments of `lookup` (e.g., `artist_url_template`).
+        driver_kwargs (dict): Arguments of `create_chrome_driver` for the worker drivers.
+        on_result (Callable): Called with each successful result, in input order.
+        checkpoint (CheckpointStore): Skip the artists already done for `target` and mark the new ones as done.
+        target (str): Name of the enrichment target in the checkpoint store.
+
+    Returns:
+        EnrichmentReport: The ordered results, the errors and the throughput of the run.
+    """
+    if checkpoint:
+        done = checkpoint.done_items(target)
+        artists = [artist for artist in artists if artist not in done]
+        logger.info("%s artists already done for %s, skipping them.", len(done), target)
+    logger.info("Enriching %s artists with %s workers...", len(artists), workers)
+    report = EnrichmentReport(workers = workers, results = [None] * len(artists))
+    driver_kwargs = driver_kwargs if driver_kwargs is not None else {"headless": True, "profile": "scrape"}
+    start_time = time.perf_counter()
+    ordered_results = _OrderedResults(artists, on_result, checkpoint, target)
+    with ProcessPoolExecutor(max_workers = workers, initializer = _init_worker, initargs = (driver_kwargs,)) as executor:
+        futures = [
+            executor.submit(_enrich_artist, index, artist, lookup, lookup_kwargs or {}, timeout, retries, backoff)
+            for index, artist in enumerate(artists)
+        ]
+        for future in as_completed(futures):
+            index, artist, result, error, attempts = future.result()
+            report.results[index] = result
+            if error:
+                report.errors[artist] = error
+                logger.error("Artist %s failed after %s attempts: %s", artist, attempts, error)
+            ordered_results.add(index, result)
+    report.elapsed = time.perf_counter() - start_time
+    logger.info("%s/%s artists enriched in %.1fs (%.1f artists/minute, %s workers).",
+                report.succeeded, len(artists), report.elapsed, report.artists_per_minute, workers)
+    return report
+
+# Define function to enrich the artists across the tabs of a single browser
+def enrich_artists_in_tabs(driver: WebDriver, artists: List[str], tabs: int = 4, timeout: float = DEFAULT_ARTIST_TIMEOUT,
+                           lookup_kwargs: Optional[Dict[str, Any]] = None, on_result: Optional[Callable[[dict], None]] = None,
+                           checkpoint: Optional[CheckpointStore] = None, target: str = "artists") -> EnrichmentReport:
+    """
+    Look up the artists in K tabs of one browser at once, for workers that cannot afford one browser per lookup.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance, preferably created with the scrape profile.
+        artists (List[str]): The artist names.
+        tabs (int): Number of tabs working at the same time.
+        timeout (float): Maximum seconds per artist.
+        lookup_kwargs (dict): Extra arguments of `artist_info_steps` (e.g., `artist_url_template`).
+        on_result (Callable): Called with each successful result, in input order, as soon as every previous artist is finished.
+        checkpoint (CheckpointStore): Skip the artists already done for `target` and mark the new ones as done.
+        target (str): Name of the enrichment target in the checkpoint store.
+
+    Returns:
+        EnrichmentReport: The ordered results, the errors and the throughput of the run (`workers` holds the tabs).
+    """
+    if checkpoint:
+        done = checkpoint.done_items(target)
+        artists = [artist for artist in artists if artist not in done]
+    lookup_kwargs = lookup_kwargs or {}
+    # Hand over and checkpoint each artist as soon as the previous ones are finished, not at the end of the run
+    positions = {artist: index for index, artist in enumerate(artists)}
+    ordered_results = _OrderedResults(artists, on_result, checkpoint, target)
+    scheduler = TabScheduler(driver, tabs = tabs, job_timeout = timeout)
+    tab_report = scheduler.run(((artist, artist) for artist in artists),
+                               lambda tab_driver, artist: artist_info_steps(tab_driver, artist, **lookup_kwargs),
+                               on_result = lambda artist, result: ordered_results.add(positions[artist], result),
+                               on_error = lambda artist, error: ordered_results.add(positions[artist], None))
+    # Match the results back to the artists in input order
+    report = EnrichmentReport(workers = tabs, results = [tab_report.results.get(artist) for artist in artists],
+                              errors = {str(key): error for key, error in tab_report.errors.items()}, elapsed = tab_report.elapsed)
+    ordered_results.close(report.results)
+    logger.info("%s/%s artists enriched in %.1fs (%.1f artists/minute, %s tabs).",
+                report.succeeded, len(artists), report.elapsed, report.artists_per_minute, tabs)
+    return report
+
+# Define function to enrich the artists across the nodes of a Selenium Grid
+def enrich_artists_on_grid(artists: List[str], backends: Union[Backend, Sequence[Backend]], timeout: float = DEFAULT_ARTIST_TIMEOUT,
+                           lookup: Callable[..., dict] = scrape_artist_info, lookup_kwargs: Optional[Dict[str, Any]] = None,
+                           on_result: Optional[Callable[[dict], None]] = None, checkpoint: Optional[CheckpointStore] = None,
+                           target: str = "artists", max_requeues: int = DEFAULT_MAX_REQUEUES) -> EnrichmentReport:
+    """
+    Look up the artists with one session per slot of the Grid nodes (see `grid_utils.GridScheduler`).
+    An artist whose node is lost is looked up again on another node.
+
+    Args:
+        artists (List[str]): The artist names.
+        backends (Backend or Sequence[Backend]): The `GridBackend` or `LocalBackend` instances to run on.
+        timeout (float): Maximum seconds of the page loads of an artist.
+        lookup (Callable): Function `(driver, artist, timeout, **lookup_kwargs) -> dict`.
+        lookup_kwargs (dict): Extra arguments of `lookup` (e.g., `artist_url_template`).
+        on_result (Callable): Called with each successful result, in input order, as soon as every previous artist is finished.
+        checkpoint (CheckpointStore): Skip the artists already done for `target` and mark the new ones as done.
+        target (str): Name of the enrichment target in the checkpoint store.
+        max_requeues (int): Maximum times an artist is re-queued after its session was lost.
+
+    Returns:
+        EnrichmentReport: The ordered results, the errors, the throughput of the run (`workers` holds the slots)
+        and the work done by each node.
+    """
+    if checkpoint:
+        done = checkpoint.done_items(target)
+        artists = [artist for artist in artists if artist not in done]
+    lookup_kwargs = lookup_kwargs or {}
+
+    def lookup_artist(driver: WebDriver, artist: str) -> dict:
+        driver.set_page_load_timeout(timeout)
+        return lookup(driver, artist, timeout = timeout, **lookup_kwargs)
+
+    # Hand over and checkpoint each artist as soon as the previous ones are finished, not at the end of the run
+    positions = {artist: index for index, artist in enumerate(artists)}
+    ordered_results = _OrderedResults(artists, on_result, checkpoint, target)
+    grid_report = GridScheduler(backends, max_requeues = max_requeues).run(
+        ((artist, artist) for artist in artists), lookup_artist,
+        on_result = lambda artist, result: ordered_results.add(positions[artist], result),
+        on_error = lambda artist, error: ordered_results.add(positions[artist], None))
+    # Match the results back to the artists in input order
+    report = EnrichmentReport(workers = grid_report.slots, results = [grid_report.results.get(artist) for artist in artists],
+                              errors = {str(key): error for key, error in grid_report.errors.items()},
+                              elapsed = grid_report.elapsed, nodes = grid_report.nodes)
+    ordered_results.close(report.results)
+    logger.info("%s/%s artists enriched in %.1fs (%.1f artists/minute, %s slots).",
+                report.succeeded, len(artists), report.elapsed, report.artists_per_minute, grid_report.slots)
+    return report
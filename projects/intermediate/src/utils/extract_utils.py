@@ -0,0 +1,305 @@
+"""This page contains utility functions to extract data from list pages in a single WebDriver round-trip."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+# Import the necessary libraries for the project
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Locator strategies supported by the in-page extractor
+SUPPORTED_STRATEGIES = (By.XPATH, By.CSS_SELECTOR)
+
+# Class to describe how a field is read from a row
+@dataclass(frozen = True)
+class ExtractField:
+    """
+    Declarative description of a field read from each row.
+
+    Args:
+        locator (tuple): Locator relative to the row, (By.XPATH, ...) or (By.CSS_SELECTOR, ...).
+        attribute (str): Attribute to read, None reads the rendered text like `WebElement.text`.
+        split (str): Separator used to split the value into a list of stripped strings, None keeps a string.
+    """
+    locator: Tuple[str, str]
+    attribute: Optional[str] = None
+    split: Optional[str] = None
+
+# Locators and fields of the Spotify tracklist rows
+TRACKLIST_ROW_LOCATOR = (By.XPATH, "//div[@data-testid='tracklist-row']")
+TRACKLIST_FIELDS: Dict[str, ExtractField] = {
+    "position": ExtractField((By.XPATH, ".//div/div/div/span")),
+    "name": ExtractField((By.XPATH, ".//div/div/div[following-sibling::span/span/a]")),
+    "artists": ExtractField((By.XPATH, ".//div/following-sibling::span/span[a]"), split = ","),
+    "reproductions": ExtractField((By.XPATH, ".//div[3]/div")),
+    "album": ExtractField((By.XPATH, ".//div/span/a")),
+    "duration": ExtractField((By.XPATH, ".//div/div[following-sibling::button][not(*)]")),
+}
+
+# Helpers shared by the in-page scripts to locate nodes and read the declared fields of a row
+_JS_HELPERS = """
+function findAll(strategy, value, context) {
+    if (strategy === 'css selector') {
+        return Array.from(context.querySelectorAll(value));
+    }
+    const snapshot = document.evaluate(value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+}
+function findOne(strategy, value, context) {
+    if (strategy === 'css selector') {
+        return context.querySelector(value);
+    }
+    return document.evaluate(value, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function readRecord(row, fields) {
+    const record = {};
+    for (const [name, field] of Object.entries(fields)) {
+        const node = findOne(field.locator[0], field.locator[1], row);
+        let value = null;
+        if (node !== null) {
+            value = field.attribute === null ? (node.innerText !== undefined ? node.innerText : node.textContent) : node.getAttribute(field.attribute);
+            if (value !== null) value = value.trim();
+        }
+        if (value !== null && field.split !== null) {
+            value = value.split(field.split).map((part) => part.trim()).filter((part) => part.length > 0);
+        }
+        record[name] = value;
+    }
+    return record;
+}
+"""
+
+# Script executed in the page, it finds every row and reads every field in one call
+EXTRACT_ROWS_SCRIPT = _JS_HELPERS + """
+const [rowLocator, fields, start, limit] = arguments;
+const rows = findAll(rowLocator[0], rowLocator[1], document).slice(start, limit === null ? undefined : start + limit);
+return rows.map((row) => readRecord(row, fields));
+"""
+
+# Script executed in the page on every scroll step: it reads the rows after `afterIndex`,
+# measures the scrollable container and scrolls it by a fraction of its visible height
+SCROLL_EXTRACT_SCRIPT = _JS_HELPERS + """
+const [rowLocator, fields, indexAttribute, afterIndex, containerLocator, scrollRatio] = arguments;
+const rows = findAll(rowLocator[0], rowLocator[1], document);
+const items = [];
+for (const row of rows) {
+    const indexed = row.closest('[' + indexAttribute + ']');
+    const index = indexed === null ? null : parseInt(indexed.getAttribute(indexAttribute), 10);
+    if (index !== null && index <= afterIndex) continue;
+    items.push([index, readRecord(row, fields)]);
+}
+function isScrollable(node) {
+    const overflow = window.getComputedStyle(node).overflowY;
+    return (overflow === 'auto' || overflow === 'scroll') && node.scrollHeight > node.clientHeight;
+}
+let container = containerLocator === null ? null : findOne(containerLocator[0], containerLocator[1], document);
+if (container === null && rows.length > 0) {
+    for (let node = rows[0].parentElement; node !== null; node = node.parentElement) {
+        if (isScrollable(node)) { container = node; break; }
+    }
+}
+if (container === null) container = document.scrollingElement || document.documentElement;
+let rowCount = null;
+if (rows.length > 0) {
+    const grid = rows[0].closest('[aria-rowcount]');
+    if (grid !== null) rowCount = parseInt(grid.getAttribute('aria-rowcount'), 10);
+}
+const atEnd = container.scrollTop + container.clientHeight >= container.scrollHeight - 2;
+container.scrollTop = container.scrollTop + Math.max(1, Math.floor(container.clientHeight * scrollRatio));
+return {items: items, atEnd: atEnd, rowCount: rowCount, scrollTop: container.scrollTop, scrollHeight: container.scrollHeight};
+"""
+
+# Script executed in the page to jump to a row index of a virtualized list using the measured row height
+SCROLL_TO_INDEX_SCRIPT = _JS_HELPERS + """
+const [rowLocator, indexAttribute, targetIndex, containerLocator] = arguments;
+const rows = findAll(rowLocator[0], rowLocator[1], document);
+if (rows.length === 0) return null;
+function isScrollable(node) {
+    const overflow = window.getComputedStyle(node).overflowY;
+    return (overflow === 'auto' || overflow === 'scroll') && node.scrollHeight > node.clientHeight;
+}
+let container = containerLocator === null ? null : findOne(containerLocator[0], containerLocator[1], document);
+if (container === null) {
+    for (let node = rows[0].parentElement; node !== null; node = node.parentElement) {
+        if (isScrollable(node)) { container = node; break; }
+    }
+}
+if (container === null) container = document.scrollingElement || document.documentElement;
+const first = rows[0].closest('[' + indexAttribute + ']') || rows[0];
+const rowHeight = first.getBoundingClientRect().height;
+if (rowHeight <= 0) return container.scrollTop;
+container.scrollTop = Math.max(0, (targetIndex - 1) * rowHeight);
+return container.scrollTop;
+"""
+
+# Define function to extract every row of a list page with one execute_script call
+def extract_rows(driver: WebDriver, row_locator: tuple, fields: Dict[str, ExtractField], start: int = 0, limit: Optional[int] = None) -> List[dict]:
+    """
+    Extract the declared fields of every row matching the locator with a single `execute_script` call.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        row_locator (tuple): Locator of the rows, (By.XPATH, ...) or (By.CSS_SELECTOR, ...).
+        fields (Dict[str, ExtractField]): Mapping of the output keys to the field descriptions.
+        start (int): Index of the first row to extract.
+        limit (int): Maximum number of rows to extract, None extracts until the last row.
+
+    Returns:
+        List[dict]: One plain dict per row, missing fields are None. Empty list on failure.
+    """
+    for locator in [row_locator] + [field.locator for field in fields.values()]:
+        if locator[0] not in SUPPORTED_STRATEGIES:
+            raise ValueError(f"Unsupported locator strategy '{locator[0]}', expected one of {SUPPORTED_STRATEGIES}.")
+    logger.info("Extracting rows with locator: %s", row_locator)
+    try:
+        serialized_fields = {name: asdict(field) for name, field in fields.items()}
+        rows = driver.execute_script(EXTRACT_ROWS_SCRIPT, list(row_locator), serialized_fields, start, limit)
+        logger.info("Extracted %s rows.", len(rows))
+        return rows
+    except WebDriverException as e_script:
+        logger.error("Error extracting rows: %s", e_script, exc_info=True)
+        return []
+    except Exception as e_unhandled:
+        logger.error("Unhandled exception during row extraction: %s", e_unhandled, exc_info=True)
+        return []
+
+# Define function to extract the visible tracks of a playlist page
+def extract_tracklist_rows(driver: WebDriver, start: int = 0, limit: Optional[int] = None) -> List[dict]:
+    """
+    Extract position, name, artists, reproductions, album and duration of the tracklist rows in the DOM.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        start (int): Index of the first row to extract.
+        limit (int): Maximum number of rows to extract, None extracts until the last row.
+
+    Returns:
+        List[dict]: One dict per track with the keys of `TRACKLIST_FIELDS`.
+    """
+    return extract_rows(driver, TRACKLIST_ROW_LOCATOR, TRACKLIST_FIELDS, start, limit)
+
+# Define function to build a hashable key from a record when no row index is available
+def record_key(record: Dict[str, Any]) -> Hashable:
+    """
+    Build the default dedup key of a record read from a row without an index.
+    """
+    return tuple((name, tuple(value) if isinstance(value, list) else value) for name, value in record.items())
+
+# Define a generator that scrolls a virtualized list and yields only the new rows
+def iter_list_items(driver: WebDriver, row_locator: tuple, key_fn: Optional[Callable[[dict], Hashable]] = None,
+                    fields: Dict[str, ExtractField] = TRACKLIST_FIELDS, container_locator: Optional[tuple] = None,
+                    index_attribute: str = "aria-rowindex", scroll_ratio: float = 0.8, settle_time: float = 0.15,
+                    end_timeout: float = 3.0, start_index: int = 0, with_index: bool = False) -> Iterator[Any]:
+    """
+    Scroll a virtualized list by measured pixel offsets and yield each row once, as soon as it is rendered.
+
+    Rows carrying `index_attribute` (on the row or an ancestor) are filtered in the page, so only rows after
+    the last yielded index are read and the dedup state is a single integer. Rows without an index are
+    deduplicated in Python with `key_fn`. The scroll stops when the last index reaches the `aria-rowcount`
+    of the list, or when the container is at its bottom and nothing new is rendered for `end_timeout` seconds.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        row_locator (tuple): Locator of the rows, (By.XPATH, ...) or (By.CSS_SELECTOR, ...).
+        key_fn (Callable): Function returning a stable key for a record, used when the row has no index.
+        fields (Dict[str, ExtractField]): Fields to read from each row, defaults to the tracklist fields.
+        container_locator (tuple): Locator of the scrollable container, None detects it from the rows.
+        index_attribute (str): Attribute holding the row index in the list.
+        scroll_ratio (float): Fraction of the visible height scrolled on each step.
+        settle_time (float): Seconds to wait after each scroll for the list to render.
+        end_timeout (float): Seconds to wait at the bottom for lazily loaded rows before stopping.
+        start_index (int): Skip the rows with an index lower or equal to this value and scroll straight to it (e.g., to resume).
+        with_index (bool): Yield `(index, record)` tuples instead of records, index is None for rows without it.
+
+    Yields:
+        dict: One plain dict per new row, or an `(index, record)` tuple with `with_index`.
+    """
+    for locator in [row_locator] + [field.locator for field in fields.values()] + ([container_locator] if container_locator else []):
+        if locator[0] not in SUPPORTED_STRATEGIES:
+            raise ValueError(f"Unsupported locator strategy '{locator[0]}', expected one of {SUPPORTED_STRATEGIES}.")
+    logger.info("Streaming list items with locator: %s", row_locator)
+    serialized_fields = {name: asdict(field) for name, field in fields.items()}
+    container = list(container_locator) if container_locator else None
+    # Jump straight to the resume point instead of scrolling through the rows already saved
+    if start_index > 0 and scroll_to_index(driver, row_locator, start_index, container_locator, index_attribute):
+        time.sleep(settle_time)
+    last_index = start_index
+    seen_keys = set()
+    yielded = 0
+    stalled_since = None
+    while True:
+        state = driver.execute_script(SCROLL_EXTRACT_SCRIPT, list(row_locator), serialized_fields, index_attribute,
+                                      last_index, container, scroll_ratio)
+        new_items = 0
+        # A virtualized grid may reorder its nodes, read the indexed rows in list order so none is skipped
+        items = sorted(state["items"], key = lambda item: (item[0] is None, item[0] or 0))
+        for index, record in items:
+            if index is not None and key_fn is None:
+                if index <= last_index:
+                    continue
+                if yielded + new_items and index > last_index + 1:
+                    logger.warning("Rows %s to %s were not rendered before row %s, they are missing from the output.",
+                                   last_index + 1, index - 1, index)
+                last_index = index
+            else:
+                key = key_fn(record) if key_fn else record_key(record)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                if index is not None:
+                    last_index = max(last_index, index)
+            new_items += 1
+            yield (index, record) if with_index else record
+        yielded += new_items
+
+        # End of list: every row announced by the grid was read
+        if state["rowCount"] is not None and last_index >= state["rowCount"]:
+            logger.info("End of list reached at row %s of %s, %s items yielded.", last_index, state['rowCount'], yielded)
+            return
+        # End of list: the container cannot scroll further and nothing new appears
+        if state["atEnd"] and new_items == 0:
+            stalled_since = stalled_since or time.monotonic()
+            if time.monotonic() - stalled_since >= end_timeout:
+                logger.info("Bottom of the list reached with no new rows, %s items yielded.", yielded)
+                return
+        else:
+            stalled_since = None
+        time.sleep(settle_time)
+
+# Define function to jump to a row of a virtualized list without scrolling through the previous ones
+def scroll_to_index(driver: WebDriver, row_locator: tuple, index: int, container_locator: Optional[tuple] = None,
+                    index_attribute: str = "aria-rowindex") -> bool:
+    """
+    Scroll a list straight to a row index, using the height of the rendered rows to compute the offset.
+    The list must be rendered with rows of a fixed height, as the Spotify tracklist is.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        row_locator (tuple): Locator of the rows, (By.XPATH, ...) or (By.CSS_SELECTOR, ...).
+        index (int): The row index to scroll to.
+        container_locator (tuple): Locator of the scrollable container, None detects it from the rows.
+        index_attribute (str): Attribute holding the row index in the list.
+
+    Returns:
+        bool: True if the list was scrolled, False otherwise.
+    """
+    logger.info("Scrolling the list to the row index %s...", index)
+    try:
+        container = list(container_locator) if container_locator else None
+        scroll_top = driver.execute_script(SCROLL_TO_INDEX_SCRIPT, list(row_locator), index_attribute, index, container)
+        if scroll_top is None:
+            logger.error("No rows found to scroll the list.")
+            return False
+        logger.info("List scrolled to offset %spx.", scroll_top)
+        return True
+    except WebDriverException as e_script:
+        logger.error("Error scrolling the list: %s", e_script, exc_info=True)
+        return False
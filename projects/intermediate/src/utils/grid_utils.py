@@ -0,0 +1,427 @@
+"""This page contains the local and Selenium Grid driver backends and a scheduler that shards jobs across their nodes."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+# Import the necessary libraries for the project
+from .driver_utils import close_driver, create_chrome_driver, create_remote_driver, is_driver_healthy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.error import URLError
+from urllib.request import urlopen
+import json
+import os
+import threading
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the Grid backend and the scheduler
+DEFAULT_GRID_URL = "http://localhost:4444"
+DEFAULT_STATUS_TIMEOUT = 5
+DEFAULT_MAX_REQUEUES = 2
+DEFAULT_SESSION_RETRY_DELAY = 2.0
+# Failed session attempts in a row after which a worker stops, even if its backend still advertises nodes up
+DEFAULT_MAX_SESSION_ATTEMPTS = 5
+BROWSER_NAME = "chrome"
+LOCAL_NODE = "local"
+
+# Class with the capacity of a Grid node
+@dataclass
+class GridNode:
+    """
+    A node of a Selenium Grid, as advertised by the `/status` endpoint.
+
+    Args:
+        id (str): The node id.
+        uri (str): The URL of the node.
+        availability (str): "UP", "DRAINING" or "DOWN".
+        slots (int): Chrome sessions the node runs at the same time.
+        busy_slots (int): Slots running a session.
+        sessions (List[str]): Ids of the sessions running on the node.
+    """
+    id: str
+    uri: str
+    availability: str
+    slots: int
+    busy_slots: int = 0
+    sessions: List[str] = field(default_factory = list)
+
+    @property
+    def is_up(self) -> bool:
+        return self.availability == "UP"
+
+    @property
+    def free_slots(self) -> int:
+        return max(0, self.slots - self.busy_slots)
+
+
+# Define function to read the nodes of a Grid /status answer
+def parse_grid_status(status: Dict[str, Any], browser_name: str = BROWSER_NAME) -> List[GridNode]:
+    """
+    Read the nodes of the answer of the Grid `/status` endpoint.
+
+    Args:
+        status (dict): The "value" of the answer.
+        browser_name (str): Only the slots of this browser are counted.
+
+    Returns:
+        List[GridNode]: The nodes of the Grid.
+    """
+    nodes = []
+    for node in status.get("nodes", []):
+        slots = [slot for slot in node.get("slots", [])
+                 if slot.get("stereotype", {}).get("browserName", browser_name) == browser_name]
+        sessions = [slot["session"]["sessionId"] for slot in slots if slot.get("session")]
+        # The node never runs more than maxSessions sessions, whatever its slots
+        capacity = min(len(slots), node.get("maxSessions", len(slots)))
+        nodes.append(GridNode(node.get("id", ""), node.get("uri", ""), node.get("availability", "UP"),
+                              capacity, len(sessions), sessions))
+    return nodes
+
+# Class to create local Chrome drivers
+class LocalBackend:
+    """
+    Create local Chrome drivers, advertised as a single node with `slots` slots.
+
+    Args:
+        slots (int): Browsers run at the same time, half of the CPUs by default.
+        **driver_kwargs: Keyword arguments of `create_chrome_driver`.
+    """
+
+    def __init__(self, slots: Optional[int] = None, **driver_kwargs) -> None:
+        self.slots = slots or max(1, (os.cpu_count() or 2) // 2)
+        self.driver_kwargs = driver_kwargs
+        self.name = LOCAL_NODE
+
+    def nodes(self) -> List[GridNode]:
+        return [GridNode(LOCAL_NODE, LOCAL_NODE, "UP", self.slots)]
+
+    def create_driver(self) -> WebDriver:
+        return create_chrome_driver(**self.driver_kwargs)
+
+    def node_of(self, driver: WebDriver) -> str:
+        return LOCAL_NODE
+
+    def __call__(self, **driver_kwargs) -> WebDriver:
+        # Lets the backend be the `driver_factory` of a DriverPool
+        return create_chrome_driver(**{**self.driver_kwargs, **driver_kwargs})
+
+
+# Class to create remote sessions on a Selenium Grid
+class GridBackend:
+    """
+    Create Chrome sessions on a Selenium Grid 4 (hub or standalone) and read the capacity of its nodes.
+
+    Args:
+        grid_url (str): URL of the Grid, e.g., "http://localhost:4444".
+        status_timeout (float): Maximum seconds to wait for the `/status` endpoint.
+        **driver_kwargs: Keyword arguments of `create_remote_driver` (headless, profile...).
+    """
+
+    def __init__(self, grid_url: str = DEFAULT_GRID_URL, status_timeout: float = DEFAULT_STATUS_TIMEOUT,
+                 **driver_kwargs) -> None:
+        self.grid_url = grid_url.rstrip("/")
+        self.status_timeout = status_timeout
+        self.driver_kwargs = driver_kwargs
+        self.name = self.grid_url
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Read the `/status` endpoint of the Grid.
+
+        Returns:
+            dict: The "value" of the answer, empty if the Grid does not answer.
+        """
+        try:
+            with urlopen(f"{self.grid_url}/status", timeout = self.status_timeout) as response:
+                return json.load(response).get("value", {})
+        except (URLError, OSError, ValueError) as e_status:
+            logger.error("Could not read the status of the Grid %s: %s", self.grid_url, e_status)
+            return {}
+
+    def nodes(self) -> List[GridNode]:
+        """
+        List the nodes of the Grid with their Chrome slots.
+        """
+        return parse_grid_status(self.status())
+
+    def create_driver(self) -> WebDriver:
+        return create_remote_driver(self.grid_url, **self.driver_kwargs)
+
+    def node_of(self, driver: WebDriver) -> str:
+        """
+        Find the node running a session.
+
+        Returns:
+            str: The URI of the node, the Grid URL if the session is not listed.
+        """
+        for node in self.nodes():
+            if driver.session_id in node.sessions:
+                return node.uri
+        return self.grid_url
+
+    def __call__(self, **driver_kwargs) -> WebDriver:
+        # Lets the backend be the `driver_factory` of a DriverPool
+        return create_remote_driver(self.grid_url, **{**self.driver_kwargs, **driver_kwargs})
+
+
+Backend = Union[LocalBackend, GridBackend]
+
+# Class with the work done by one node during a run
+@dataclass
+class NodeReport:
+    """
+    Work done by one node during a `GridScheduler` run.
+
+    Args:
+        node (str): The node URI.
+        jobs (int): Jobs finished on the node.
+        failures (int): Jobs that failed on the node with a healthy browser.
+        lost_sessions (int): Sessions lost while running a job.
+        busy (float): Seconds spent running jobs, summed over the sessions of the node.
+    """
+    node: str
+    jobs: int = 0
+    failures: int = 0
+    lost_sessions: int = 0
+    busy: float = 0.0
+
+
+# Class with the results of a scheduler run
+@dataclass
+class GridRunReport:
+    """
+    Results of a `GridScheduler` run.
+
+    Args:
+        slots (int): Number of sessions used at the same time.
+        results (Dict[Hashable, Any]): Return value of each finished job, by key.
+        errors (Dict[Hashable, str]): Error message of each failed job, by key.
+        requeued (int): Jobs put back in the queue after their session was lost.
+        nodes (Dict[str, NodeReport]): Work done by each node.
+        elapsed (float): Wall time of the run in seconds.
+    """
+    slots: int
+    results: Dict[Hashable, Any] = field(default_factory = dict)
+    errors: Dict[Hashable, str] = field(default_factory = dict)
+    requeued: int = 0
+    nodes: Dict[str, NodeReport] = field(default_factory = dict)
+    elapsed: float = 0.0
+
+    @property
+    def items_per_minute(self) -> float:
+        return len(self.results) / self.elapsed * 60 if self.elapsed else 0.0
+
+    @property
+    def node_throughput(self) -> Dict[str, float]:
+        """Jobs per minute of each node over the run."""
+        return {node: report.jobs / self.elapsed * 60 if self.elapsed else 0.0 for node, report in self.nodes.items()}
+
+
+# Class to keep a job and the number of times it was re-queued
+@dataclass
+class _GridJob:
+    key: Hashable
+    payload: Any
+    requeues: int = 0
+
+
+# Class to spread jobs across the slots of the nodes of one or more backends
+class GridScheduler:
+    """
+    Run jobs across the nodes of one or more backends, one session per advertised slot.
+
+    Every slot gets a worker thread that opens a session, then takes jobs from a shared queue, so the nodes
+    with more slots and the faster nodes run more jobs. When a job fails and its browser no longer answers
+    (the node was lost or the browser is wedged), the session is closed, the job goes back to the queue and
+    the worker opens a new session, which the Grid places on a node that is still up. A worker stops when its
+    backend advertises no node up anymore, or when `max_session_attempts` sessions in a row could not be opened
+    (e.g., Chrome is missing or the Grid rejects the capabilities). A job that fails on a healthy browser is not retried.
+
+    Args:
+        backends (Backend or Sequence[Backend]): Where the sessions are created.
+        max_requeues (int): Maximum times a job is re-queued after its session was lost.
+        session_retry_delay (float): Seconds to wait before opening a session again after a failure.
+        max_session_attempts (int): Failed session attempts in a row after which a worker stops.
+    """
+
+    def __init__(self, backends: Union[Backend, Sequence[Backend]], max_requeues: int = DEFAULT_MAX_REQUEUES,
+                 session_retry_delay: float = DEFAULT_SESSION_RETRY_DELAY,
+                 max_session_attempts: int = DEFAULT_MAX_SESSION_ATTEMPTS) -> None:
+        self.backends = list(backends) if isinstance(backends, (list, tuple)) else [backends]
+        self.max_requeues = max_requeues
+        self.session_retry_delay = session_retry_delay
+        self.max_session_attempts = max_session_attempts
+        self._condition = threading.Condition()
+        self._pending: List[_GridJob] = []
+        self._unfinished = 0
+        self._report: Optional[GridRunReport] = None
+        self._on_result: Optional[Callable[[Hashable, Any], None]] = None
+        self._on_error: Optional[Callable[[Hashable, str], None]] = None
+
+    def slots(self) -> Dict[int, int]:
+        """
+        Slots advertised by the nodes that are up, by backend index.
+        """
+        return {index: sum(node.slots for node in backend.nodes() if node.is_up)
+                for index, backend in enumerate(self.backends)}
+
+    def run(self, items: Iterable[Tuple[Hashable, Any]], flow: Callable[[WebDriver, Any], Any],
+            on_result: Optional[Callable[[Hashable, Any], None]] = None,
+            on_error: Optional[Callable[[Hashable, str], None]] = None) -> GridRunReport:
+        """
+        Run `flow(driver, payload)` for every `(key, payload)` item.
+
+        Args:
+            items (Iterable[Tuple[Hashable, Any]]): The jobs, keys must be unique.
+            flow (Callable): Function running one job on a driver and returning its result.
+            on_result (Callable): Called with `(key, result)` as each job finishes, from the worker threads.
+            on_error (Callable): Called with `(key, error)` as each job fails for good, from the worker threads.
+
+        Returns:
+            GridRunReport: The results, the errors and the throughput of each node.
+        """
+        slots = self.slots()
+        report = GridRunReport(slots = sum(slots.values()))
+        with self._condition:
+            self._pending = [_GridJob(key, payload) for key, payload in items]
+            # Jobs are popped from the end, so they run in input order
+            self._pending.reverse()
+            self._unfinished = len(self._pending)
+            self._report = report
+            self._on_result = on_result
+            self._on_error = on_error
+        logger.info("Running %s jobs on %s slots: %s", self._unfinished, report.slots,
+                    {self.backends[index].name: count for index, count in slots.items()})
+        start_time = time.perf_counter()
+        workers = [threading.Thread(target = self._work, args = (self.backends[index], flow),
+                                    name = f"grid-{index}-{slot}", daemon = True)
+                   for index, count in slots.items() for slot in range(count)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        report.elapsed = time.perf_counter() - start_time
+        with self._condition:
+            # Jobs left when every worker stopped had no node to run on
+            left, self._pending = self._pending, []
+            for job in left:
+                report.errors[job.key] = "No node left to run the job."
+        for job in reversed(left):
+            self._notify(self._on_error, job.key, report.errors[job.key])
+        logger.info("%s/%s jobs done in %.1fs (%.1f jobs/minute, %s re-queued). Per node: %s",
+                    len(report.results), len(report.results) + len(report.errors), report.elapsed,
+                    report.items_per_minute, report.requeued,
+                    {node: round(throughput, 1) for node, throughput in report.node_throughput.items()})
+        return report
+
+    def _next_job(self) -> Optional[_GridJob]:
+        with self._condition:
+            # A job being run elsewhere may still come back to the queue
+            self._condition.wait_for(lambda: self._pending or self._unfinished == 0)
+            return self._pending.pop() if self._pending else None
+
+    def _finish(self, job: _GridJob, node: str, busy: float, result: Any = None, error: Optional[str] = None) -> None:
+        with self._condition:
+            node_report = self._report.nodes.setdefault(node, NodeReport(node))
+            node_report.busy += busy
+            if error is None:
+                node_report.jobs += 1
+                self._report.results[job.key] = result
+            else:
+                node_report.failures += 1
+                self._report.errors[job.key] = error
+            self._unfinished -= 1
+            callback, value = (self._on_result, result) if error is None else (self._on_error, error)
+            self._condition.notify_all()
+        self._notify(callback, job.key, value)
+
+    @staticmethod
+    def _notify(callback: Optional[Callable[[Hashable, Any], None]], key: Hashable, value: Any) -> None:
+        # The callbacks run without the lock so a slow sink or checkpoint does not stall the other workers
+        if callback:
+            try:
+                callback(key, value)
+            except Exception as e_callback:
+                logger.error("Result callback failed for %s: %s", key, e_callback, exc_info = True)
+
+    def _requeue(self, job: _GridJob, node: str, busy: float, error: str) -> None:
+        with self._condition:
+            node_report = self._report.nodes.setdefault(node, NodeReport(node))
+            node_report.lost_sessions += 1
+            node_report.busy += busy
+            given_up = job.requeues >= self.max_requeues
+            if given_up:
+                self._report.errors[job.key] = error
+                self._unfinished -= 1
+            else:
+                job.requeues += 1
+                self._report.requeued += 1
+                self._pending.append(job)
+            self._condition.notify_all()
+        if given_up:
+            self._notify(self._on_error, job.key, error)
+
+    def _put_back(self, job: _GridJob) -> None:
+        with self._condition:
+            self._pending.append(job)
+            self._condition.notify_all()
+
+    def _open_session(self, backend: Backend) -> Tuple[Optional[WebDriver], str]:
+        # Open a session, waiting while the backend still advertises a node up, for a bounded number of attempts
+        for attempt in range(1, self.max_session_attempts + 1):
+            try:
+                driver = backend.create_driver()
+                return driver, backend.node_of(driver)
+            except Exception as e_session:
+                logger.warning("Could not open a session on %s (attempt %s/%s): %s",
+                               backend.name, attempt, self.max_session_attempts, e_session)
+            if not any(node.is_up for node in backend.nodes()):
+                logger.error("No node up on %s anymore, stopping one of its workers.", backend.name)
+                return None, backend.name
+            if attempt < self.max_session_attempts:
+                time.sleep(self.session_retry_delay)
+        logger.error("No session could be opened on %s after %s attempts, stopping one of its workers.",
+                     backend.name, self.max_session_attempts)
+        return None, backend.name
+
+    @staticmethod
+    def _close_session(driver: WebDriver) -> None:
+        try:
+            close_driver(driver)
+        except Exception:
+            pass
+
+    def _work(self, backend: Backend, flow: Callable[[WebDriver, Any], Any]) -> None:
+        driver, node = None, backend.name
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    return
+                if driver is None:
+                    driver, node = self._open_session(backend)
+                    if driver is None:
+                        self._put_back(job)
+                        return
+                start_time = time.monotonic()
+                try:
+                    result = flow(driver, job.payload)
+                except Exception as e_job:
+                    error = f"{type(e_job).__name__}: {e_job}"
+                    busy = time.monotonic() - start_time
+                    if is_driver_healthy(driver):
+                        logger.error("Job %s failed on %s: %s", job.key, node, error)
+                        self._finish(job, node, busy, error = error)
+                    else:
+                        logger.warning("Session lost on %s while running job %s, re-queuing it: %s", node, job.key, error)
+                        self._close_session(driver)
+                        driver = None
+                        self._requeue(job, node, busy, error)
+                else:
+                    self._finish(job, node, time.monotonic() - start_time, result)
+        finally:
+            if driver is not None:
+                self._close_session(driver)
@@ -0,0 +1,369 @@
+"""This page contains a registry of the project locators with parameterized templates and fallback chains."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import WebDriverException
+# Import the necessary libraries for the project
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import re
+import threading
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the locator registry
+DEFAULT_TIMEOUT = 10
+DEFAULT_POLL_FREQUENCY = 0.1
+UNKNOWN_VERSION = "unknown"
+# Maximum chains kept by `resolve`, the least recently used one is dropped first (one per artist in templates)
+COMPILED_CACHE_SIZE = 1024
+# One step of an XPath that has a CSS equivalent: a tag (or *) with only attribute equality predicates
+_XPATH_STEP = re.compile(r"""^(\*|[A-Za-z][\w-]*)((?:\[@[\w-]+\s*=\s*(?:'[^']*'|"[^"]*")\])*)$""")
+_XPATH_PREDICATE = re.compile(r"""\[@([\w-]+)\s*=\s*(?:'([^']*)'|"([^"]*)")\]""")
+# Template placeholder, with the quotes around it when it is used as a string literal
+_PLACEHOLDER = re.compile(r"""'\{(\w+)\}'|"\{(\w+)\}"|\{(\w+)\}""")
+
+# Define function to quote a value as an XPath string literal
+def xpath_literal(value: str) -> str:
+    """
+    Quote a value as an XPath 1.0 string literal. XPath has no escape sequences, so a value with both
+    quote types is built with `concat()` (e.g., `concat('Say "Don', "'", 't"')`).
+
+    Args:
+        value (str): The raw value (e.g., "Guns N' Roses").
+
+    Returns:
+        str: The literal, quotes included.
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = [f"'{part}'" for part in value.split("'")]
+    return "concat(" + ", \"'\", ".join(parts) + ")"
+
+# Define function to quote a value as a CSS string
+def css_literal(value: str) -> str:
+    """
+    Quote a value as a CSS string, escaping the backslashes and the double quotes.
+    """
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+# Define function to translate a simple XPath to the equivalent CSS selector
+@lru_cache(maxsize = 4096)
+def xpath_to_css(xpath: str) -> Optional[str]:
+    """
+    Translate an XPath made only of descendant/child steps with attribute equality predicates
+    (e.g., ".//dialog[@aria-label='Queen']") to the equivalent CSS selector. The results are cached.
+
+    Args:
+        xpath (str): The XPath expression.
+
+    Returns:
+        str: The CSS selector, None if the XPath uses anything without a CSS equivalent (text(), axes, functions...).
+    """
+    expression = xpath[1:] if xpath.startswith(".//") else xpath
+    if not expression.startswith("//"):
+        return None
+    parts = []
+    for separator, step in re.findall(r"(//|/)([^/]+)", expression):
+        match = _XPATH_STEP.match(step.strip())
+        if not match:
+            return None
+        tag, predicates = match.groups()
+        selector = "" if tag == "*" and predicates else tag
+        for attribute, single_quoted, double_quoted in _XPATH_PREDICATE.findall(predicates):
+            value = single_quoted if single_quoted or not double_quoted else double_quoted
+            escaped_value = value.replace("\\", "\\\\").replace('"', '\\"')
+            selector += f'[{attribute}="{escaped_value}"]'
+        if parts:
+            parts.append(" " if separator == "//" else " > ")
+        parts.append(selector)
+    return "".join(parts) if parts else None
+
+# Define function to prefer CSS over an equivalent XPath
+def prefer_css(locator: tuple) -> tuple:
+    """
+    Return the CSS version of an XPath locator when both are equivalent, the same locator otherwise.
+
+    Args:
+        locator (tuple): A tuple containing the locator strategy and value.
+
+    Returns:
+        tuple: The (By.CSS_SELECTOR, selector) locator or the original one.
+    """
+    strategy, value = locator
+    if strategy == By.XPATH:
+        css_selector = xpath_to_css(value)
+        if css_selector is not None:
+            return By.CSS_SELECTOR, css_selector
+    return locator
+
+# Define function to fill the placeholders of a locator template
+def _format_template(strategy: str, value: str, params: Dict[str, Any]) -> str:
+    # Quoted placeholders become string literals of the locator language, so any value gives a valid selector
+    quote = xpath_literal if strategy == By.XPATH else css_literal
+
+    def replace(match: re.Match) -> str:
+        single_quoted, double_quoted, bare = match.groups()
+        if bare is not None:
+            return str(params[bare])
+        return quote(str(params[single_quoted or double_quoted]))
+
+    return _PLACEHOLDER.sub(replace, value)
+
+# Class to keep the named locators of the project
+class LocatorRegistry:
+    """
+    Named locators with parameterized templates and ordered fallback chains.
+
+    Each name is registered with one or more candidate locators whose values can hold `{param}` placeholders
+    (e.g., `(By.XPATH, ".//dialog[@aria-label='{artist}']")`). `resolve` formats the chain once per set of
+    parameters and caches the `compiled_cache_size` most recently used chains, quoting the values of quoted placeholders as string literals, translating each XPath to CSS when both are equivalent. `find` tries the chain
+    in order and `condition` builds a wait condition doing the same, both record which candidate matched, how
+    long each selector took, and the page versions where the primary candidate started failing.
+
+    Args:
+        prefer_css (bool): Translate XPath candidates to equivalent CSS selectors if True.
+        page_version (Callable): Function `(driver) -> str` returning the version of the page, recorded
+            when the primary candidate fails. None records the host of the current URL.
+        compiled_cache_size (int): Maximum number of resolved chains kept in the cache.
+    """
+
+    def __init__(self, prefer_css: bool = True, page_version: Optional[Callable[[WebDriver], str]] = None,
+                 compiled_cache_size: int = COMPILED_CACHE_SIZE) -> None:
+        self.prefer_css = prefer_css
+        self.page_version = page_version
+        self.compiled_cache_size = max(1, compiled_cache_size)
+        self._templates: Dict[str, Tuple[tuple, ...]] = {}
+        self._compiled: "OrderedDict[tuple, Tuple[tuple, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def register(self, name: str, *candidates: tuple) -> None:
+        """
+        Register a locator with its ordered fallback chain.
+
+        Args:
+            name (str): The name of the locator (e.g., "artist.info_button").
+            *candidates (tuple): The locators to try in order, the first one is the primary.
+        """
+        if not candidates:
+            raise ValueError(f"Locator {name} needs at least one candidate.")
+        with self._lock:
+            self._templates[name] = tuple(candidates)
+            # Drop the compiled chains of a replaced locator
+            self._compiled = OrderedDict((key, chain) for key, chain in self._compiled.items() if key[0] != name)
+
+    def names(self) -> List[str]:
+        """Return the names of the registered locators."""
+        return sorted(self._templates)
+
+    def resolve(self, name: str, **params: Any) -> Tuple[tuple, ...]:
+        """
+        Build the fallback chain of a locator for a set of parameters.
+
+        Args:
+            name (str): The name of the locator.
+            **params: The values of the template placeholders.
+
+        Returns:
+            Tuple[tuple, ...]: The candidate locators, primary first.
+
+        Raises:
+            KeyError: If the locator is not registered or a parameter is missing.
+        """
+        key = (name, tuple(sorted(params.items())))
+        with self._lock:
+            chain = self._compiled.get(key)
+            if chain is not None:
+                self._compiled.move_to_end(key)
+        if chain is None:
+            chain = tuple((strategy, _format_template(strategy, value, params)) for strategy, value in self._templates[name])
+            if self.prefer_css:
+                chain = tuple(prefer_css(locator) for locator in chain)
+            with self._lock:
+                self._compiled[key] = chain
+                # Templated locators get one chain per parameter value, keep only the most recently used ones
+                while len(self._compiled) > self.compiled_cache_size:
+                    self._compiled.popitem(last = False)
+        return chain
+
+    def locator(self, name: str, **params: Any) -> tuple:
+        """
+        Return the primary locator for a set of parameters, to use with the `element_utils` helpers or `EC` conditions.
+
+        Args:
+            name (str): The name of the locator.
+            **params: The values of the template placeholders.
+
+        Returns:
+            tuple: The primary locator.
+        """
+        return self.resolve(name, **params)[0]
+
+    def find(self, driver: Union[WebDriver, WebElement], name: str, timeout: float = DEFAULT_TIMEOUT,
+             all: bool = False, poll_frequency: float = DEFAULT_POLL_FREQUENCY,
+             **params: Any) -> Union[WebElement, List[WebElement], None]:
+        """
+        Find a locator trying its fallback chain in order until one candidate matches or the timeout expires.
+
+        Args:
+            driver (WebDriver or WebElement): The Selenium WebDriver instance, or an element to search in.
+            name (str): The name of the locator.
+            timeout (float): The maximum time to wait for any candidate.
+            all (bool): Return every element of the matching candidate instead of the first one if True.
+            poll_frequency (float): Seconds between two passes over the chain.
+            **params: The values of the template placeholders.
+
+        Returns:
+            WebElement or List[WebElement]: The element(s) found, None (or an empty list) if no candidate matched.
+        """
+        chain = self.resolve(name, **params)
+        deadline = time.monotonic() + timeout
+        while True:
+            match = self._find_once(driver, name, chain)
+            if match is not None:
+                index, elements = match
+                self._record_match(driver, name, index)
+                return elements if all else elements[0]
+            if time.monotonic() >= deadline:
+                self._record_match(driver, name, None)
+                logger.error("No candidate of locator %s matched after %s seconds.", name, timeout)
+                return [] if all else None
+            time.sleep(poll_frequency)
+
+    def condition(self, name: str, all: bool = False, **params: Any) -> Callable[[Union[WebDriver, WebElement]], Any]:
+        """
+        Build a wait condition that tries the fallback chain of a locator in order, for `WebDriverWait.until`
+        or the steps of `tab_utils.TabScheduler`. Each check is one pass over the chain, and the matching
+        candidate is recorded in the statistics as in `find`.
+
+        Args:
+            name (str): The name of the locator.
+            all (bool): Return every element of the matching candidate instead of the first one if True.
+            **params: The values of the template placeholders.
+
+        Returns:
+            Callable: Condition returning the element(s) of the first matching candidate, False while none matches.
+        """
+        chain = self.resolve(name, **params)
+
+        def condition(driver: Union[WebDriver, WebElement]) -> Any:
+            match = self._find_once(driver, name, chain)
+            if match is None:
+                return False
+            index, elements = match
+            self._record_match(driver, name, index)
+            return elements if all else elements[0]
+
+        return condition
+
+    def _find_once(self, driver: Union[WebDriver, WebElement], name: str,
+                   chain: Tuple[tuple, ...]) -> Optional[Tuple[int, List[WebElement]]]:
+        # One pass over the chain, returns the index and the elements of the first matching candidate
+        for index, locator in enumerate(chain):
+            start_time = time.perf_counter()
+            try:
+                elements = driver.find_elements(*locator)
+            except WebDriverException as e_find:
+                logger.warning("Candidate %s of %s failed: %s", locator, name, e_find)
+                elements = []
+            self._record_selector(name, locator, time.perf_counter() - start_time)
+            if elements:
+                return index, elements
+        return None
+
+    def _record_selector(self, name: str, locator: tuple, seconds: float) -> None:
+        with self._lock:
+            selector = self._stats[name]["selectors"][f"{locator[0]}={locator[1]}"]
+            selector["count"] += 1
+            selector["total_ms"] += seconds * 1000
+
+    def _record_match(self, driver: Union[WebDriver, WebElement], name: str, index: Optional[int]) -> None:
+        version = self._current_version(driver) if index != 0 else None
+        with self._lock:
+            stats = self._stats[name]
+            stats["lookups"] += 1
+            if index is None:
+                stats["misses"] += 1
+            else:
+                stats["matched"][index] += 1
+            if version is not None:
+                failure = stats["primary_failures"].setdefault(version, {"first_seen": time.time(), "count": 0})
+                failure["count"] += 1
+        if index:
+            logger.warning("Primary candidate of %s failed, fallback %s matched (page version %s).", name, index, version)
+
+    def _current_version(self, driver: Union[WebDriver, WebElement]) -> str:
+        driver = getattr(driver, "parent", driver)
+        try:
+            if self.page_version is not None:
+                return str(self.page_version(driver))
+            return driver.current_url.split("/")[2]
+        except Exception:
+            return UNKNOWN_VERSION
+
+    def reset_stats(self) -> None:
+        """
+        Delete the recorded statistics.
+        """
+        with self._lock:
+            self._stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+                "lookups": 0, "misses": 0, "matched": defaultdict(int),
+                "selectors": defaultdict(lambda: {"count": 0, "total_ms": 0.0}), "primary_failures": {},
+            })
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report the statistics of the `find` calls and the conditions.
+
+        Returns:
+            dict: For each locator name, the lookups, the misses, the matches by candidate index, the count and
+            mean resolve time of each selector, and the first time and count of primary failures by page version.
+        """
+        with self._lock:
+            return {name: {
+                "lookups": stats["lookups"],
+                "misses": stats["misses"],
+                "matched": dict(stats["matched"]),
+                "selectors": {selector: {"count": values["count"], "mean_ms": values["total_ms"] / values["count"]}
+                              for selector, values in stats["selectors"].items()},
+                "primary_failures": {version: dict(failure) for version, failure in stats["primary_failures"].items()},
+            } for name, stats in self._stats.items()}
+
+
+# Registry with the locators of the project
+REGISTRY = LocatorRegistry()
+# Login and account locators
+REGISTRY.register("login.username", (By.ID, "login-username"))
+REGISTRY.register("login.password", (By.ID, "login-password"))
+REGISTRY.register("login.button", (By.ID, "login-button"))
+REGISTRY.register("login.error", (By.CSS_SELECTOR, "[data-encore-id='banner']"))
+REGISTRY.register("account.logged_in", (By.CSS_SELECTOR, "button[data-testid='user-widget-link']"))
+REGISTRY.register("account.logged_out", (By.CSS_SELECTOR, "button[data-testid='login-button']"))
+REGISTRY.register("account.logout", (By.CSS_SELECTOR, "button[data-testid='user-widget-dropdown-logout']"))
+# Search and artist locators
+REGISTRY.register("search.input", (By.CSS_SELECTOR, "[data-testid='search-input']"),
+                  (By.CSS_SELECTOR, "input[role='searchbox']"))
+REGISTRY.register("search.artists_button", (By.XPATH, ".//a/button/span[text() = 'Artistas']"),
+                  (By.XPATH, ".//a/button/span[text() = 'Artists']"))
+REGISTRY.register("artist.top_artist", (By.XPATH, ".//p[@title = '{artist}']"),
+                  (By.XPATH, ".//a[@title = '{artist}']"))
+REGISTRY.register("artist.info_button", (By.XPATH, ".//button[@aria-label='{artist}']"))
+REGISTRY.register("artist.dialog", (By.XPATH, ".//dialog[@aria-label='{artist}']"),
+                  (By.XPATH, ".//div[@role='dialog'][@aria-label='{artist}']"))
+REGISTRY.register("artist.data_container", (By.XPATH, ".//dialog[@aria-label='{artist}']//div[count(./div) >= 7]"))
+REGISTRY.register("artist.numbers", (By.XPATH, ".//dialog[@aria-label='{artist}']//div[count(./div) >= 7]"
+                                               "//div[not(translate(., '0123456789.', ''))]"))
+REGISTRY.register("artist.cities", (By.XPATH, ".//dialog[@aria-label='{artist}']//div[count(./div) >= 7]"
+                                              "//div[not(translate(., '0123456789.', ''))]/../following-sibling::div[position() <= 5]"))
+REGISTRY.register("artist.world_number", (By.XPATH, ".//div[count(following-sibling::div) >= 7 ]/div[starts-with(.,'#')]"))
+# Playlist locators
+REGISTRY.register("playlist.rows", (By.XPATH, "//div[@data-testid='tracklist-row']"))
@@ -0,0 +1,91 @@
+"""This page contains the logging setup of the project: format, per-module levels and an optional queue handler."""
+
+# Import the necessary libraries for the project
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Union
+import atexit
+import logging
+import queue
+
+# Constants values for the logging setup
+DEFAULT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DEFAULT_LEVEL = logging.INFO
+# Package of the utils modules, e.g. "src.utils" or "utils" depending on how they are imported
+PACKAGE_NAME = __name__.rpartition(".")[0]
+
+# Listener of the queue handler, when the asynchronous logging is enabled
+_listener: Optional[QueueListener] = None
+
+# Define function to get the logger of a utils module
+def module_logger(module: str) -> logging.Logger:
+    """
+    Get the logger of a utils module by its short or full name.
+
+    Args:
+        module (str): The module name, e.g. "element_utils" or "src.utils.element_utils".
+
+    Returns:
+        logging.Logger: The logger of the module.
+    """
+    if PACKAGE_NAME and "." not in module:
+        module = f"{PACKAGE_NAME}.{module}"
+    return logging.getLogger(module)
+
+# Define function to set the level of one or more utils modules
+def set_module_levels(levels: Dict[str, Union[int, str]]) -> None:
+    """
+    Set the level of some utils modules, e.g. {"element_utils": "WARNING", "auth_utils": "DEBUG"}.
+    A module below its level does not even format its messages, since the helpers log with lazy %-style arguments.
+
+    Args:
+        levels (Dict[str, int or str]): Level by module name.
+    """
+    for module, level in levels.items():
+        module_logger(module).setLevel(level)
+
+# Define function to configure the logging of the project
+def configure_logging(level: Union[int, str] = DEFAULT_LEVEL, format: str = DEFAULT_FORMAT,
+                      module_levels: Optional[Dict[str, Union[int, str]]] = None, use_queue: bool = False,
+                      handler: Optional[logging.Handler] = None) -> None:
+    """
+    Configure the root logger. The utils modules never configure logging on import, the scripts call this
+    function once at start up instead.
+
+    Args:
+        level (int or str): Level of the root logger.
+        format (str): Format of the messages.
+        module_levels (Dict[str, int or str]): Levels of specific utils modules, see `set_module_levels`.
+        use_queue (bool): Hand the records to a background thread that formats and writes them if True,
+            so the flows never wait for the disk or the console.
+        handler (logging.Handler): Handler writing the messages, a console handler by default.
+    """
+    global _listener
+    stop_logging()
+    handler = handler or logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(format))
+    root = logging.getLogger()
+    for existing_handler in list(root.handlers):
+        root.removeHandler(existing_handler)
+    root.setLevel(level)
+    if use_queue:
+        records: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(records, handler, respect_handler_level = True)
+        _listener.start()
+        root.addHandler(QueueHandler(records))
+    else:
+        root.addHandler(handler)
+    if module_levels:
+        set_module_levels(module_levels)
+
+# Define function to flush and stop the queue handler
+def stop_logging() -> None:
+    """
+    Write the records still in the queue and stop the background thread of the queue handler, if any.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
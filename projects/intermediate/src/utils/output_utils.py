@@ -0,0 +1,345 @@
+"""This page contains streaming output sinks to save scraped records as they are produced."""
+
+# Import the necessary libraries for the project
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, TextIO, Tuple
+import csv
+import io
+import json
+import os
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the sinks
+DEFAULT_BUFFER_SIZE = 100
+DEFAULT_FSYNC_INTERVAL = 5.0
+PARTIAL_SUFFIX = ".part"
+TAIL_BLOCK_SIZE = 4096
+
+# Base class for every output sink
+class OutputSink:
+    """
+    Buffered, append-only writer of records.
+
+    Records are kept in memory until `buffer_size` records are pending, then written and flushed to the
+    file. The file is fsynced at most every `fsync_interval` seconds, so a crash loses at most one buffer.
+    The data is written to `<path>.part` and moved to `path` atomically on `close()`, so a finished file
+    is never seen half written.
+
+    Args:
+        path (str): Final path of the output file.
+        buffer_size (int): Number of records kept in memory before writing them.
+        fsync_interval (float): Minimum seconds between two fsync calls, 0 fsyncs on every flush.
+        append (bool): Keep the records of an existing file (from a previous or interrupted run) if True.
+        resume_offset (int): With `append`, truncate the partial file to this size first, dropping the
+            records written after the last checkpoint (see `offset`).
+    """
+    extension = ""
+
+    def __init__(self, path: str, buffer_size: int = DEFAULT_BUFFER_SIZE, fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+                 append: bool = False, resume_offset: Optional[int] = None) -> None:
+        self.path = path
+        self.partial_path = path + PARTIAL_SUFFIX
+        self.buffer_size = max(1, buffer_size)
+        self.fsync_interval = fsync_interval
+        self.append = append
+        self.resume_offset = resume_offset
+        self.records_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._last_fsync = time.monotonic()
+        self._closed = False
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+        logger.info("Opening %s on: %s", type(self).__name__, path)
+        self._file = self._open_stream()
+
+    def _open_stream(self) -> TextIO:
+        # Resume from the partial file of an interrupted run, or from the finished file
+        if self.append and not os.path.exists(self.partial_path) and os.path.exists(self.path):
+            os.replace(self.path, self.partial_path)
+        if (self.append and self.resume_offset is not None and os.path.exists(self.partial_path)
+                and os.path.getsize(self.partial_path) > self.resume_offset):
+            with open(self.partial_path, "r+b") as stream:
+                stream.truncate(self.resume_offset)
+        mode = "a" if self.append and os.path.exists(self.partial_path) else "w"
+        resumed = mode == "a" and os.path.getsize(self.partial_path) > 0
+        stream = open(self.partial_path, mode, newline = "", encoding = "utf-8")
+        self._start(stream, resumed)
+        return stream
+
+    def _start(self, stream: TextIO, resumed: bool) -> None:
+        """Write the header of the format, `resumed` is True when the file already has content."""
+
+    def _write_records(self, stream: TextIO, records: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def _finish(self, stream: TextIO) -> None:
+        """Write the footer of the format."""
+
+    @property
+    def offset(self) -> int:
+        """Size in bytes of the partial file, call `flush()` first to include the buffered records."""
+        return os.path.getsize(self.partial_path) if not self._closed else os.path.getsize(self.path)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Append a record to the sink.
+
+        Args:
+            record (dict): The record to write.
+        """
+        if self._closed:
+            raise ValueError(f"The sink {self.path} is closed.")
+        self._buffer.append(record)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append every record of an iterable (e.g., a generator of scraped rows) to the sink.
+
+        Args:
+            records (Iterable[dict]): The records to write.
+
+        Returns:
+            int: Number of records written.
+        """
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+        return count
+
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Write the buffered records to the file.
+
+        Args:
+            fsync (bool): Force an fsync even if `fsync_interval` did not elapse.
+        """
+        if self._buffer:
+            self._write_records(self._file, self._buffer)
+            self.records_written += len(self._buffer)
+            self._buffer = []
+        self._file.flush()
+        if fsync or time.monotonic() - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_fsync = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Write the pending records, finish the format and move the file to its final path atomically.
+        """
+        if self._closed:
+            return
+        self.flush()
+        self._finish(self._file)
+        self.flush(fsync = True)
+        self._file.close()
+        os.replace(self.partial_path, self.path)
+        self._closed = True
+        logger.info("%s records saved on: %s", self.records_written, self.path)
+
+    def abort(self) -> None:
+        """
+        Write the pending records and close the file without finalizing it, so the run can be resumed later.
+        """
+        if self._closed:
+            return
+        self.flush(fsync = True)
+        self._file.close()
+        self._closed = True
+        logger.warning("Sink aborted, partial data kept on: %s", self.partial_path)
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+# Class to write records as CSV rows
+class CsvSink(OutputSink):
+    """
+    Write records as CSV rows. List values are joined with `list_separator`.
+
+    Args:
+        path (str): Final path of the output file.
+        fieldnames (List[str]): Keys of the records to write, in column order.
+        headers (List[str]): Column names written in the header, defaults to `fieldnames`.
+        list_separator (str): Separator used to join list values.
+        **kwargs: Arguments of `OutputSink`.
+    """
+    extension = ".csv"
+
+    def __init__(self, path: str, fieldnames: List[str], headers: Optional[List[str]] = None, list_separator: str = ", ", **kwargs) -> None:
+        self.fieldnames = list(fieldnames)
+        self.headers = list(headers) if headers else self.fieldnames
+        self.list_separator = list_separator
+        super().__init__(path, **kwargs)
+
+    def _start(self, stream: TextIO, resumed: bool) -> None:
+        self._writer = csv.writer(stream)
+        if not resumed:
+            self._writer.writerow(self.headers)
+
+    def _write_records(self, stream: TextIO, records: List[Dict[str, Any]]) -> None:
+        self._writer.writerows(
+            [self.list_separator.join(map(str, value)) if isinstance(value, (list, tuple)) else value
+             for value in (record.get(name) for name in self.fieldnames)]
+            for record in records
+        )
+
+
+# Class to write records as JSON Lines
+class JsonLinesSink(OutputSink):
+    """
+    Write one JSON document per line.
+    """
+    extension = ".jsonl"
+
+    def _write_records(self, stream: TextIO, records: List[Dict[str, Any]]) -> None:
+        stream.write("".join(json.dumps(record, ensure_ascii = False) + "\n" for record in records))
+
+
+# Class to write records as a streamed JSON array
+class JsonArraySink(OutputSink):
+    """
+    Write the records as a JSON array, streamed element by element. The closing bracket is written
+    on `close()`, an interrupted file can be resumed with `append=True`.
+
+    Args:
+        path (str): Final path of the output file.
+        indent (int): Indentation of the JSON documents, None writes them on a single line.
+        **kwargs: Arguments of `OutputSink`.
+    """
+    extension = ".json"
+
+    def __init__(self, path: str, indent: Optional[int] = 4, **kwargs) -> None:
+        self.indent = indent
+        self._has_records = False
+        super().__init__(path, **kwargs)
+
+    def _open_stream(self) -> TextIO:
+        # A finished array ends with "]", drop it so new records can be appended
+        if self.append and not os.path.exists(self.partial_path) and os.path.exists(self.path):
+            os.replace(self.path, self.partial_path)
+            with open(self.partial_path, "r+b") as stream:
+                position, last = _last_byte(stream)
+                if last == b"]":
+                    stream.truncate(position)
+                    stream.truncate(_last_byte(stream)[0] + 1)
+        return super()._open_stream()
+
+    def _start(self, stream: TextIO, resumed: bool) -> None:
+        if resumed:
+            with open(self.partial_path, "rb") as reader:
+                self._has_records = _last_byte(reader)[1] not in (b"", b"[")
+        else:
+            stream.write("[")
+
+    def _write_records(self, stream: TextIO, records: List[Dict[str, Any]]) -> None:
+        chunk = io.StringIO()
+        for record in records:
+            chunk.write(",\n" if self._has_records else "\n")
+            document = json.dumps(record, indent = self.indent, ensure_ascii = False)
+            chunk.write(_indent(document, self.indent))
+            self._has_records = True
+        stream.write(chunk.getvalue())
+
+    def _finish(self, stream: TextIO) -> None:
+        stream.write("\n]\n" if self._has_records else "]\n")
+
+
+# Class to fan out the records to several sinks
+class MultiSink:
+    """
+    Write every record to several sinks (e.g., CSV and JSON at the same time).
+
+    Args:
+        sinks (List[OutputSink]): The sinks receiving the records.
+    """
+
+    def __init__(self, sinks: List[OutputSink]) -> None:
+        self.sinks = list(sinks)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        for sink in self.sinks:
+            sink.write(record)
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        count = 0
+        for record in records:
+            self.write(record)
+            count += 1
+        return count
+
+    def flush(self, fsync: bool = False) -> None:
+        for sink in self.sinks:
+            sink.flush(fsync)
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+    def abort(self) -> None:
+        for sink in self.sinks:
+            sink.abort()
+
+    def __enter__(self) -> "MultiSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+# Define function to find the last non-whitespace byte of a file
+def _last_byte(stream: BinaryIO) -> Tuple[int, bytes]:
+    """
+    Read the file backwards by blocks of `TAIL_BLOCK_SIZE` bytes, so resuming a large array does not load it.
+
+    Returns:
+        Tuple[int, bytes]: Position and value of the last non-whitespace byte, (-1, b"") for a blank file.
+    """
+    end = stream.seek(0, os.SEEK_END)
+    while end > 0:
+        start = max(0, end - TAIL_BLOCK_SIZE)
+        stream.seek(start)
+        block = stream.read(end - start).rstrip()
+        if block:
+            return start + len(block) - 1, block[-1:]
+        end = start
+    return -1, b""
+
+# Define function to indent every line of a JSON document inside the array
+def _indent(document: str, indent: Optional[int]) -> str:
+    if not indent:
+        return document
+    padding = " " * indent
+    # Split on "\n" only: json.dumps keeps U+2028, U+2029 and \x85 raw in strings, splitlines() breaks on them
+    return "\n".join(padding + line for line in document.split("\n"))
+
+# Define function to open a sink from the extension of the path
+def open_sink(path: str, **kwargs) -> OutputSink:
+    """
+    Open the sink matching the extension of the path (.csv, .jsonl or .json).
+
+    Args:
+        path (str): Final path of the output file.
+        **kwargs: Arguments of the sink class (e.g., `fieldnames` for CSV, `buffer_size`, `append`).
+
+    Returns:
+        OutputSink: The opened sink.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    for sink_class in (CsvSink, JsonLinesSink, JsonArraySink):
+        if sink_class.extension == extension:
+            return sink_class(path, **kwargs)
+    raise ValueError(f"No sink available for the extension '{extension}' of {path}.")
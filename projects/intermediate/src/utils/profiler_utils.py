@@ -0,0 +1,186 @@
+"""This page contains a profiler that counts and times the WebDriver commands sent by a driver."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+# Import the necessary libraries for the project
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+import json
+import math
+import os
+import sys
+import threading
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the profiler
+# Modules whose functions are used to tag the commands, matched against the end of the module name
+DEFAULT_TAG_MODULES = ("element_utils", "auth_utils")
+# Frames of these modules are left out of the collapsed stacks
+IGNORED_STACK_MODULES = ("selenium", "urllib3", "http", "concurrent", "threading", "contextlib", "asyncio", __name__)
+MAX_STACK_DEPTH = 32
+UNTAGGED = "<untagged>"
+
+# Define function to compute a percentile with the nearest-rank method
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+# Class to profile the commands sent by one or more drivers
+class CommandProfiler:
+    """
+    Count and time every WebDriver command (findElement, getElementText, executeScript, ...) sent by the
+    attached drivers. Each command is tagged with the calling helper of `tag_modules` (e.g.,
+    "element_utils.find_element") and the Python stack is kept to export a flamegraph.
+
+    The profiler wraps the `execute` method of the driver command executor only while it is attached,
+    so a detached profiler adds no overhead at all.
+
+    Args:
+        tag_modules (Sequence[str]): Module names (or their last part) whose functions tag the commands.
+    """
+
+    def __init__(self, tag_modules: Sequence[str] = DEFAULT_TAG_MODULES) -> None:
+        self.tag_modules = tuple(tag_modules)
+        self._lock = threading.Lock()
+        self._originals: Dict[int, Tuple[Any, Any]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Delete every recorded command.
+        """
+        with self._lock:
+            self._durations: Dict[str, List[float]] = defaultdict(list)
+            self._by_tag: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+            self._collapsed: Dict[str, float] = defaultdict(float)
+
+    def attach(self, driver: WebDriver) -> "CommandProfiler":
+        """
+        Start profiling the commands of a driver.
+
+        Args:
+            driver (WebDriver): The Selenium WebDriver instance.
+
+        Returns:
+            CommandProfiler: The profiler itself.
+        """
+        executor = driver.command_executor
+        if id(executor) in self._originals:
+            return self
+        original_execute = executor.execute
+
+        def profiled_execute(command: str, params: dict) -> Any:
+            start_time = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                self._record(command, time.perf_counter() - start_time, sys._getframe(1))
+
+        executor.execute = profiled_execute
+        self._originals[id(executor)] = (executor, original_execute)
+        logger.info("Command profiler attached to the driver.")
+        return self
+
+    def detach(self, driver: WebDriver) -> None:
+        """
+        Stop profiling the commands of a driver and restore its command executor.
+
+        Args:
+            driver (WebDriver): The Selenium WebDriver instance.
+        """
+        entry = self._originals.pop(id(driver.command_executor), None)
+        if entry is not None:
+            executor, _ = entry
+            # Removing the instance attribute restores the method of the class
+            executor.__dict__.pop("execute", None)
+            logger.info("Command profiler detached from the driver.")
+
+    @contextmanager
+    def profile(self, driver: WebDriver) -> Iterator["CommandProfiler"]:
+        """
+        Context manager that profiles the commands of a driver inside the block.
+        """
+        self.attach(driver)
+        try:
+            yield self
+        finally:
+            self.detach(driver)
+
+    def _record(self, command: str, seconds: float, frame: Any) -> None:
+        tag = UNTAGGED
+        stack: List[str] = []
+        depth = 0
+        while frame is not None and depth < MAX_STACK_DEPTH:
+            module = frame.f_globals.get("__name__", "")
+            if not module.startswith(IGNORED_STACK_MODULES):
+                name = f"{module.rsplit('.', 1)[-1]}.{frame.f_code.co_name}"
+                stack.append(name)
+                if tag == UNTAGGED and module.endswith(self.tag_modules):
+                    tag = name
+            frame = frame.f_back
+            depth += 1
+        collapsed = ";".join(reversed(stack)) + (";" if stack else "") + command
+        with self._lock:
+            self._durations[command].append(seconds)
+            self._by_tag[tag][command].append(seconds)
+            self._collapsed[collapsed] += seconds
+
+    @staticmethod
+    def _summarize(durations: List[float]) -> Dict[str, float]:
+        values = sorted(durations)
+        return {
+            "count": len(values),
+            "total_s": sum(values),
+            "p50_ms": _percentile(values, 50) * 1000,
+            "p95_ms": _percentile(values, 95) * 1000,
+            "p99_ms": _percentile(values, 99) * 1000,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded commands.
+
+        Returns:
+            dict: "commands" with count, total_s, p50_ms, p95_ms and p99_ms per command type,
+            "helpers" with the same summary per calling helper and command, and the overall "total".
+        """
+        with self._lock:
+            commands = {command: self._summarize(values) for command, values in self._durations.items()}
+            helpers = {tag: {command: self._summarize(values) for command, values in by_command.items()}
+                       for tag, by_command in self._by_tag.items()}
+            all_durations = [value for values in self._durations.values() for value in values]
+        return {"commands": commands, "helpers": helpers, "total": self._summarize(all_durations)}
+
+    def export_json(self, path: str) -> None:
+        """
+        Save the summary of `stats()` as JSON.
+
+        Args:
+            path (str): Path of the JSON file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+        with open(path, "w", encoding = "utf-8") as file:
+            json.dump(self.stats(), file, indent = 4)
+        logger.info("Profiler stats saved on: %s", path)
+
+    def export_collapsed(self, path: str) -> None:
+        """
+        Save the time per stack in the collapsed format of flamegraph.pl / speedscope,
+        one "frame;frame;command microseconds" line per stack.
+
+        Args:
+            path (str): Path of the collapsed stacks file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok = True)
+        with self._lock:
+            lines = [f"{stack} {round(seconds * 1_000_000)}" for stack, seconds in sorted(self._collapsed.items())]
+        with open(path, "w", encoding = "utf-8") as file:
+            file.write("\n".join(lines) + ("\n" if lines else ""))
+        logger.info("Profiler collapsed stacks saved on: %s", path)
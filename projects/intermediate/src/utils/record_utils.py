@@ -0,0 +1,211 @@
+"""This page contains the typed track and artist records, their numeric parsing and their columnar conversion."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+# Import the necessary libraries for the project
+from .extract_utils import TRACKLIST_ROW_LOCATOR, TRACKLIST_FIELDS, iter_list_items
+from array import array
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import re
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the records
+# Thousands separator by language of the page, e.g. "1.234.567" in Spanish and "1,234,567" in English
+GROUP_SEPARATORS = {
+    "en": ",", "es": ".", "pt": ".", "de": ".", "it": ".", "nl": ".", "id": ".", "tr": ".",
+    "fr": "\u202f", "sv": "\u00a0", "pl": "\u00a0", "ru": "\u00a0", "cs": "\u00a0", "fi": "\u00a0",
+}
+SPACE_SEPARATORS = " \u00a0\u202f"
+# A grouped integer uses the same separator between every group of three digits
+GROUPED_NUMBER_PATTERN = re.compile(r"^\d{1,3}(?:([.,' \u00a0\u202f])\d{3}(?:\1\d{3})*)?$")
+# Value stored in the integer columns for a missing number
+MISSING = -1
+ARRAY_TYPECODE = "q"
+
+# Define function to parse a locale-formatted count
+def parse_count(text: Union[str, int, None], language: Optional[str] = None) -> Optional[int]:
+    """
+    Parse a locale-formatted integer such as "1.234.567", "1,234,567", "1 234 567" or "#12".
+
+    Without a language, any separator is accepted as long as it groups every three digits the same way,
+    which is unambiguous for counts. With a language (e.g., "es" or "en-US", as in `<html lang>`), only its
+    thousands separator is accepted, so "1.234" is rejected in English instead of read as 1234.
+
+    Args:
+        text (str or int): The text of the element, an int is returned as is.
+        language (str): Language of the page, None detects the separator.
+
+    Returns:
+        int: The number, None if the text is empty or not a count (e.g., "N/A").
+    """
+    if text is None or isinstance(text, int):
+        return text
+    text = text.strip().lstrip("#").strip()
+    if text.isdecimal():
+        return int(text)
+    if language:
+        separator = GROUP_SEPARATORS.get(language.split("-")[0].lower())
+        if separator is not None:
+            # Pages grouping with spaces mix the regular, the no-break and the narrow no-break space
+            separators = SPACE_SEPARATORS if separator in SPACE_SEPARATORS else separator
+            groups = re.split("[" + re.escape(separators) + "]", text)
+            # Every group after the first one has exactly three digits, so "12.34" is not read as 1234
+            if not 1 <= len(groups[0]) <= 3 or not all(len(group) == 3 for group in groups[1:]):
+                return None
+            digits = "".join(groups)
+            return int(digits) if digits.isdecimal() else None
+    if GROUPED_NUMBER_PATTERN.match(text):
+        return int(re.sub(r"\D", "", text))
+    return None
+
+# Define function to parse a duration in seconds
+def parse_duration(text: Union[str, int, None]) -> Optional[int]:
+    """
+    Parse a duration such as "3:45" or "1:02:03" in seconds.
+
+    Args:
+        text (str or int): The text of the element, an int is returned as is.
+
+    Returns:
+        int: The duration in seconds, None if the text is not a duration.
+    """
+    if text is None or isinstance(text, int):
+        return text
+    parts = text.strip().split(":")
+    if not 2 <= len(parts) <= 3 or not all(part.isdecimal() for part in parts):
+        return None
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+# Define function to format a duration in seconds as "m:ss"
+def format_duration(seconds: Optional[int]) -> str:
+    if seconds is None:
+        return ""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes}:{seconds:02d}"
+
+# Class with the data of a track of a list
+@dataclass
+class Track:
+    """
+    A track of a playlist, with its numbers parsed. `__slots__` keeps each record small.
+
+    Args:
+        position (int): Position in the list, None if it could not be read.
+        name (str): Name of the song.
+        artists (Tuple[str, ...]): Names of the artists.
+        reproductions (int): Play count, None if it could not be read.
+        album (str): Name of the album.
+        duration (int): Duration in seconds, None if it could not be read.
+    """
+    __slots__ = ("position", "name", "artists", "reproductions", "album", "duration")
+    position: Optional[int]
+    name: str
+    artists: Tuple[str, ...]
+    reproductions: Optional[int]
+    album: str
+    duration: Optional[int]
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], language: Optional[str] = None) -> "Track":
+        """
+        Build a track from a record of `extract_utils.iter_list_items` with the `TRACKLIST_FIELDS` keys.
+        """
+        artists = record.get("artists") or ()
+        if isinstance(artists, str):
+            artists = [artist.strip() for artist in artists.split(",")]
+        return cls(parse_count(record.get("position"), language), record.get("name") or "", tuple(artists),
+                   parse_count(record.get("reproductions"), language), record.get("album") or "",
+                   parse_duration(record.get("duration")))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the track to a record with the `TRACKLIST_FIELDS` keys, for the output sinks.
+        """
+        return {"position": self.position, "name": self.name, "artists": list(self.artists),
+                "reproductions": self.reproductions, "album": self.album, "duration": format_duration(self.duration)}
+
+
+# Class with the data of the info dialog of an artist
+@dataclass
+class Artist:
+    """
+    An artist with the numbers of its info dialog parsed. `__slots__` keeps each record small.
+
+    Args:
+        name (str): The artist name.
+        ranking (int): Position in the world ranking, None if the artist has none.
+        followers (int): Number of followers, None if it could not be read.
+        monthly_listeners (int): Number of monthly listeners, None if it could not be read.
+        top_cities (Tuple[str, ...]): The top cities of the listeners.
+    """
+    __slots__ = ("name", "ranking", "followers", "monthly_listeners", "top_cities")
+    name: str
+    ranking: Optional[int]
+    followers: Optional[int]
+    monthly_listeners: Optional[int]
+    top_cities: Tuple[str, ...]
+
+    @classmethod
+    def from_info(cls, info: Dict[str, Any], language: Optional[str] = None) -> "Artist":
+        """
+        Build an artist from the dict of `artist_utils.scrape_artist_info`.
+        """
+        return cls(info.get("Artist") or "", parse_count(info.get("Ranking"), language),
+                   parse_count(info.get("Followers"), language), parse_count(info.get("MonthlyListeners"), language),
+                   tuple(info.get("TopCities") or ()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the artist to the dict of `artist_utils.scrape_artist_info`, for the output sinks.
+        """
+        return {"Artist": self.name, "Ranking": self.ranking, "Followers": self.followers,
+                "MonthlyListeners": self.monthly_listeners, "TopCities": list(self.top_cities)}
+
+
+# Define generator to read the tracks of the list shown in the driver
+def iter_tracks(driver: WebDriver, language: Optional[str] = None, **kwargs) -> Iterator[Track]:
+    """
+    Scroll the tracklist shown in the driver and yield each row once as a `Track`.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance, already on the list page.
+        language (str): Language of the page, None detects the thousands separator.
+        **kwargs: Arguments of `extract_utils.iter_list_items`.
+
+    Yields:
+        Track: The tracks, in list order.
+    """
+    for record in iter_list_items(driver, TRACKLIST_ROW_LOCATOR, fields = TRACKLIST_FIELDS, **kwargs):
+        yield Track.from_record(record, language)
+
+# Define function to convert records to columns
+def to_columns(records: Sequence[Union[Track, Artist]]) -> Dict[str, Union[array, List[Any]]]:
+    """
+    Convert records to one column per field. Integer fields become `array("q")` columns with `MISSING` for
+    the numbers that could not be read, so aggregations work on machine integers without parsing strings
+    again (e.g., `sum(value for value in columns["reproductions"] if value != MISSING)`). The other fields
+    become lists.
+
+    Args:
+        records (Sequence[Track or Artist]): Records of the same class.
+
+    Returns:
+        Dict[str, array or list]: The columns by field name, empty if there are no records.
+    """
+    if not records:
+        return {}
+    columns: Dict[str, Union[array, List[Any]]] = {}
+    for record_field in fields(type(records[0])):
+        values = [getattr(record, record_field.name) for record in records]
+        if record_field.type in (int, Optional[int]):
+            columns[record_field.name] = array(ARRAY_TYPECODE, [MISSING if value is None else value for value in values])
+        else:
+            columns[record_field.name] = values
+    return columns
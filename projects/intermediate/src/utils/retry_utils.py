@@ -0,0 +1,360 @@
+"""This page contains the retry policies of the helpers and the per-driver circuit breaker that recycles a wedged browser."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import (ElementClickInterceptedException, ElementNotInteractableException,
+                                        InvalidSelectorException, NoSuchElementException,
+                                        StaleElementReferenceException, WebDriverException)
+# Import the necessary libraries for the project
+from .driver_utils import close_driver, is_driver_healthy
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+import random
+import threading
+import time
+import weakref
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the retries and the circuit breaker
+RETRYABLE_EXCEPTIONS = (StaleElementReferenceException, ElementClickInterceptedException)
+# Failures caused by the page, not by the browser, they never count against the circuit breaker
+ELEMENT_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException, ElementClickInterceptedException,
+                      ElementNotInteractableException, InvalidSelectorException)
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Counters of the retries and of the circuit breakers
+_retry_stats = {"calls": 0, "retries": 0, "relocations": 0, "give_ups": 0, "trips": 0, "rejected": 0}
+_retry_stats_lock = threading.Lock()
+
+# Define function to increase a retry counter
+def _count(key: str) -> None:
+    with _retry_stats_lock:
+        _retry_stats[key] += 1
+
+# Class to declare how an operation is retried
+@dataclass(frozen = True)
+class RetryPolicy:
+    """
+    Declare how an operation is retried. The delay before the retry `n` is
+    `min(max_backoff, backoff * multiplier ** (n - 1))`, reduced by a random fraction up to `jitter`
+    so parallel workers hitting the same page do not retry in lockstep.
+
+    Args:
+        attempts (int): Maximum number of attempts, 1 disables the retries.
+        backoff (float): Seconds before the first retry.
+        multiplier (float): Growth of the delay after each retry.
+        max_backoff (float): Maximum seconds between two attempts.
+        jitter (float): Maximum fraction of the delay removed at random, between 0 and 1.
+        retry_on (tuple): Exceptions that trigger a retry, any other exception is raised at once.
+        relocate_stale (bool): Find a stale element again with its original locator before retrying if True.
+    """
+    attempts: int = 3
+    backoff: float = 0.2
+    multiplier: float = 2.0
+    max_backoff: float = 2.0
+    jitter: float = 0.5
+    retry_on: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS
+    relocate_stale: bool = True
+
+    def __post_init__(self) -> None:
+        if self.attempts < 1:
+            raise ValueError("A retry policy needs at least 1 attempt.")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("The jitter of a retry policy must be between 0 and 1.")
+
+    def delay(self, retry: int) -> float:
+        """
+        Seconds to wait before the retry number `retry` (1 for the first retry).
+        """
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** (retry - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+DEFAULT_POLICY = RetryPolicy()
+NO_RETRY = RetryPolicy(attempts = 1)
+
+# Locators of the elements found by the helpers, to find them again once they go stale
+_element_locators: "weakref.WeakKeyDictionary[WebElement, Tuple[tuple, int]]" = weakref.WeakKeyDictionary()
+_element_locators_lock = threading.Lock()
+
+# Define function to remember the locator an element was found with
+def remember_locator(element: WebElement, locator: tuple, index: int = 0) -> None:
+    """
+    Remember the locator (and the position among its matches) an element was found with, so a retry can
+    find it again when it goes stale. The entry goes away with the element.
+
+    Args:
+        element (WebElement): The element found.
+        locator (tuple): The locator used to find it.
+        index (int): Position of the element among the matches of the locator.
+    """
+    try:
+        with _element_locators_lock:
+            _element_locators[element] = (locator, index)
+    except TypeError:
+        # Objects without weak references (e.g., some test doubles) are simply not remembered
+        pass
+
+# Define function to find a stale element again
+def relocate(driver: Optional[WebDriver], element: WebElement) -> Optional[WebElement]:
+    """
+    Find a stale element again with the locator it was originally found with.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        element (WebElement): The stale element.
+
+    Returns:
+        WebElement: The fresh element, None if its locator is unknown or it is no longer on the page.
+    """
+    try:
+        with _element_locators_lock:
+            entry = _element_locators.get(element)
+    except TypeError:
+        entry = None
+    if driver is None or entry is None:
+        return None
+    locator, index = entry
+    elements = driver.find_elements(*locator)
+    if index >= len(elements):
+        return None
+    remember_locator(elements[index], locator, index)
+    _count("relocations")
+    logger.debug("Stale element found again with locator %s[%s].", locator, index)
+    return elements[index]
+
+# Define function to close a wedged driver without raising
+def _quit_driver(driver: WebDriver) -> None:
+    try:
+        close_driver(driver)
+    except Exception:
+        pass
+
+# Class of the error raised while the circuit breaker of a driver is open
+class CircuitOpenError(WebDriverException):
+    """Raised instead of sending a command to a driver whose circuit breaker is open."""
+
+
+# Class to stop sending commands to a wedged browser
+class CircuitBreaker:
+    """
+    Count the consecutive failures of the helpers on one driver. Once `failure_threshold` is reached the
+    browser is health checked: if it does not answer, the breaker opens, `recycle` is called with the driver
+    (by default it quits the browser, so a `DriverPool` replaces it on release) and every later call fails
+    at once with `CircuitOpenError` instead of waiting for its own timeout. After `reset_timeout` seconds
+    one trial call is let through, and its success closes the breaker again.
+
+    Args:
+        driver (WebDriver): The driver watched by the breaker.
+        failure_threshold (int): Consecutive failures before the browser is health checked.
+        reset_timeout (float): Seconds the breaker stays open before a trial call.
+        recycle (Callable): Called with the driver when the breaker opens, None to only fail fast.
+    """
+
+    def __init__(self, driver: WebDriver, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                 recycle: Optional[Callable[[WebDriver], Any]] = _quit_driver) -> None:
+        self._driver = weakref.ref(driver)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.recycle = recycle
+        self.failures = 0
+        self.trips = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return BREAKER_CLOSED
+        if now - self._opened_at >= self.reset_timeout:
+            return BREAKER_HALF_OPEN
+        return BREAKER_OPEN
+
+    def before_call(self) -> None:
+        """
+        Let a call through, or reject it while the breaker is open.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half open with its trial call still running.
+        """
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == BREAKER_CLOSED:
+                return
+            if state == BREAKER_HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return
+        _count("rejected")
+        raise CircuitOpenError("The circuit breaker of the driver is open, the browser stopped answering.")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit breaker closed, the driver answers again.")
+            self.failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self, exception: BaseException) -> None:
+        """
+        Record a failed call. Failures caused by the page (see `ELEMENT_EXCEPTIONS`) are ignored.
+        """
+        if isinstance(exception, ELEMENT_EXCEPTIONS):
+            # The browser answered, which is all a trial call has to show
+            self.record_success()
+            return
+        with self._lock:
+            if self._trial_running:
+                # The trial call failed, the breaker opens again without recycling the browser twice
+                self._opened_at = time.monotonic()
+                self._trial_running = False
+                return
+            self.failures += 1
+            if self.failures < self.failure_threshold:
+                return
+            self.failures = 0
+        driver = self._driver()
+        # A page that keeps timing out is not a wedged browser, only open when the browser stops answering
+        if driver is None or is_driver_healthy(driver):
+            return
+        with self._lock:
+            self._opened_at = time.monotonic()
+            self.trips += 1
+        _count("trips")
+        logger.error("Circuit breaker opened after %s consecutive failures, last one: %s",
+                     self.failure_threshold, exception)
+        if self.recycle is not None:
+            self.recycle(driver)
+
+
+# Circuit breakers by driver, they go away with their driver
+_breakers: "weakref.WeakKeyDictionary[WebDriver, CircuitBreaker]" = weakref.WeakKeyDictionary()
+_breakers_lock = threading.Lock()
+_breaker_defaults: Dict[str, Any] = {}
+
+# Define function to set the parameters of the circuit breakers created from now on
+def configure_breakers(failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+                       recycle: Optional[Callable[[WebDriver], Any]] = _quit_driver) -> None:
+    """
+    Set the parameters of the circuit breakers created from now on, see `CircuitBreaker`.
+    """
+    with _breakers_lock:
+        _breaker_defaults.update(failure_threshold = failure_threshold, reset_timeout = reset_timeout, recycle = recycle)
+
+# Define function to get the circuit breaker of a driver
+def breaker_for(driver: WebDriver) -> Optional[CircuitBreaker]:
+    """
+    Get the circuit breaker of a driver, creating it on first use.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+
+    Returns:
+        CircuitBreaker: The breaker of the driver, None if the driver cannot be watched (e.g., None).
+    """
+    if driver is None:
+        return None
+    try:
+        with _breakers_lock:
+            breaker = _breakers.get(driver)
+            if breaker is None:
+                breaker = _breakers[driver] = CircuitBreaker(driver, **_breaker_defaults)
+            return breaker
+    except TypeError:
+        return None
+
+# Define function to run an operation under a retry policy and the circuit breaker of its driver
+def call_with_policy(driver: Optional[WebDriver], operation: Callable[..., Any], element: Optional[WebElement] = None,
+                     policy: RetryPolicy = DEFAULT_POLICY) -> Any:
+    """
+    Run an operation, retrying it as the policy declares. When `element` is given the operation is called with it,
+    and a stale element is found again with its original locator (see `remember_locator`) before the retry.
+    The result of each call is recorded by the circuit breaker of the driver.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance, None skips the circuit breaker and the relocation.
+        operation (Callable): The operation, called as `operation(element)` or `operation()`.
+        element (WebElement): The element the operation works on, if any.
+        policy (RetryPolicy): The retry policy.
+
+    Returns:
+        Any: The result of the operation.
+
+    Raises:
+        CircuitOpenError: If the circuit breaker of the driver is open.
+        Exception: The last exception of the operation, once it is not retryable or the attempts are spent.
+    """
+    breaker = breaker_for(driver)
+    if breaker is not None:
+        breaker.before_call()
+    _count("calls")
+    attempt = 1
+    while True:
+        try:
+            result = operation(element) if element is not None else operation()
+        except policy.retry_on as e_retryable:
+            fresh_element = element
+            if isinstance(e_retryable, StaleElementReferenceException) and element is not None:
+                try:
+                    fresh_element = relocate(driver, element) if policy.relocate_stale else None
+                except Exception as e_relocate:
+                    # A dead session fails the relocation too, the breaker must still see it
+                    _count("give_ups")
+                    if breaker is not None:
+                        breaker.record_failure(e_relocate)
+                    raise
+            if attempt >= policy.attempts or fresh_element is None and element is not None:
+                _count("give_ups")
+                if breaker is not None:
+                    breaker.record_failure(e_retryable)
+                raise
+            element = fresh_element
+            delay = policy.delay(attempt)
+            logger.debug("Attempt %s/%s failed (%s), retrying in %.2fs.",
+                         attempt, policy.attempts, type(e_retryable).__name__, delay)
+            _count("retries")
+            time.sleep(delay)
+            attempt += 1
+        except Exception as e_failed:
+            if breaker is not None:
+                breaker.record_failure(e_failed)
+            raise
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+# Define a function to report the retries and the circuit breaker trips
+def get_retry_stats() -> Dict[str, int]:
+    """
+    Report the calls run under a policy, the retries, the stale elements found again, the calls that gave up,
+    the circuit breaker trips and the calls rejected by an open breaker.
+
+    Returns:
+        dict: calls, retries, relocations, give_ups, trips and rejected.
+    """
+    with _retry_stats_lock:
+        return dict(_retry_stats)
+
+# Define a function to reset the retry counters
+def reset_retry_stats() -> None:
+    """
+    Reset the retry counters.
+    """
+    with _retry_stats_lock:
+        for key in _retry_stats:
+            _retry_stats[key] = 0
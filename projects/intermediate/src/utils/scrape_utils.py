@@ -0,0 +1,170 @@
+"""This page contains the scraping flows that stream list rows to an output sink with checkpoints."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+# Import the necessary libraries for the project
+from .checkpoint_utils import CheckpointStore
+from .extract_utils import ExtractField, TRACKLIST_ROW_LOCATOR, TRACKLIST_FIELDS, iter_list_items, record_key
+from .grid_utils import DEFAULT_MAX_REQUEUES, Backend, GridRunReport, GridScheduler
+from .output_utils import OutputSink, open_sink
+from typing import Callable, Dict, Hashable, Optional, Sequence, Union
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the tracklist outputs, same columns as the beginner playlist files
+TRACKLIST_CSV_FIELDS = ["position", "name", "artists", "reproductions", "album", "duration"]
+TRACKLIST_CSV_HEADERS = ["Ranking", "Song", "Artists", "Reproductions", "Album", "Duration"]
+DEFAULT_CHECKPOINT_EVERY = 50
+
+# Define function to open a sink that continues where the checkpoint of a target stopped
+def open_resumable_sink(path: str, target: str, checkpoint: Optional[CheckpointStore] = None, **kwargs) -> OutputSink:
+    """
+    Open the sink of a target, truncated to the offset saved in its checkpoint when there is one.
+
+    Args:
+        path (str): Final path of the output file.
+        target (str): The scrape target.
+        checkpoint (CheckpointStore): The checkpoint store, None always starts a new file.
+        **kwargs: Arguments of the sink class.
+
+    Returns:
+        OutputSink: The opened sink.
+    """
+    progress = checkpoint.get_progress(target) if checkpoint else None
+    if progress and progress["output_offset"] is not None:
+        logger.info("Resuming %s from offset %s (row %s).", path, progress['output_offset'], progress['last_index'])
+        return open_sink(path, append = True, resume_offset = progress["output_offset"], **kwargs)
+    return open_sink(path, **kwargs)
+
+# Define function to stream the rows of the current list page to a sink
+def scrape_list(driver: WebDriver, sink: OutputSink, target: str, checkpoint: Optional[CheckpointStore] = None,
+                row_locator: tuple = TRACKLIST_ROW_LOCATOR, fields: Dict[str, ExtractField] = TRACKLIST_FIELDS,
+                key_fn: Optional[Callable[[dict], Hashable]] = None, checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+                index_attribute: str = "aria-rowindex", **scroll_kwargs) -> int:
+    """
+    Stream the rows of the list shown in the driver to a sink, saving a checkpoint every `checkpoint_every` rows.
+
+    The checkpoint is saved right after the sink is flushed and fsynced, together with the size of the
+    output file, so a resumed run truncates the output to that point, jumps to the saved row and produces
+    the same file as an uninterrupted run. Rows without an index cannot be jumped to, so the key of the last
+    saved row is stored instead and a resumed run skips every row up to it. Completed targets are skipped.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance, already on the list page.
+        sink (OutputSink): Where the rows are written, open it with `open_resumable_sink` to resume.
+        target (str): Name of the scrape target in the checkpoint store (e.g., the playlist URL).
+        checkpoint (CheckpointStore): The checkpoint store, None disables checkpoints.
+        row_locator (tuple): Locator of the rows.
+        fields (Dict[str, ExtractField]): Fields to read from each row.
+        key_fn (Callable): Stable key of a record, used when the rows have no index.
+        checkpoint_every (int): Number of rows between two checkpoints.
+        index_attribute (str): Attribute holding the row index in the list.
+        **scroll_kwargs: Extra arguments of `iter_list_items`.
+
+    Returns:
+        int: Number of rows written by this run.
+
+    Raises:
+        RuntimeError: If the last saved row of a list without indexes is no longer in the list.
+    """
+    progress = checkpoint.get_progress(target) if checkpoint else None
+    if progress and progress["completed"]:
+        logger.info("Target already completed, skipping: %s", target)
+        return 0
+    # Rows without an index resume after the key of the last saved row, indexed rows jump to the saved index
+    resume_key = progress["last_key"] if progress else None
+    start_index = progress["last_index"] if progress and resume_key is None else 0
+    if start_index or resume_key is not None:
+        logger.info("Resuming %s after row %s...", target, progress["last_index"])
+
+    last_index = progress["last_index"] if progress else 0
+    last_key = resume_key
+    written = 0
+    for index, record in iter_list_items(driver, row_locator, key_fn, fields = fields, index_attribute = index_attribute,
+                                         start_index = start_index, with_index = True, **scroll_kwargs):
+        if index is None:
+            key = repr(key_fn(record) if key_fn else record_key(record))
+            if resume_key is not None:
+                # Skip the rows already saved by the interrupted run
+                if key == resume_key:
+                    resume_key = None
+                continue
+            # Rows without an index are counted in the order they are yielded
+            last_index, last_key = last_index + 1, key
+        else:
+            last_index, last_key = index, None
+        sink.write(record)
+        written += 1
+        if checkpoint and written % checkpoint_every == 0:
+            sink.flush(fsync = True)
+            checkpoint.save_progress(target, last_index, last_key, output_offset = sink.offset)
+
+    if resume_key is not None:
+        raise RuntimeError(f"The last saved row of {target} was not found in the list, it cannot be resumed. "
+                           f"Reset its checkpoint to scrape it again.")
+    if checkpoint:
+        sink.flush(fsync = True)
+        checkpoint.save_progress(target, last_index, last_key, output_offset = sink.offset)
+    logger.info("%s rows written for %s.", written, target)
+    return written
+
+# Define function to scrape the list shown in the driver to a file, resuming from its checkpoint
+def scrape_list_to_file(driver: WebDriver, path: str, target: str, checkpoint: Optional[CheckpointStore] = None,
+                        sink_kwargs: Optional[dict] = None, **scrape_kwargs) -> int:
+    """
+    Scrape the list shown in the driver to a CSV, JSON Lines or JSON file. With a checkpoint store, an interrupted
+    run is resumed from the last checkpoint and the target is marked as completed once the file is finalized.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance, already on the list page.
+        path (str): Final path of the output file, the extension selects the format.
+        target (str): Name of the scrape target in the checkpoint store (e.g., the playlist URL).
+        checkpoint (CheckpointStore): The checkpoint store, None disables checkpoints.
+        sink_kwargs (dict): Arguments of the sink (e.g., `fieldnames` for CSV).
+        **scrape_kwargs: Arguments of `scrape_list`.
+
+    Returns:
+        int: Number of rows written by this run.
+    """
+    if checkpoint and checkpoint.is_completed(target):
+        logger.info("Target already completed, skipping: %s", target)
+        return 0
+    sink = open_resumable_sink(path, target, checkpoint, **(sink_kwargs or {}))
+    try:
+        written = scrape_list(driver, sink, target, checkpoint, **scrape_kwargs)
+    except Exception:
+        sink.abort()
+        raise
+    sink.close()
+    if checkpoint:
+        checkpoint.mark_completed(target)
+    return written
+
+# Define function to scrape several playlists across the nodes of a Selenium Grid
+def scrape_playlists_on_grid(playlists: Dict[str, str], backends: Union[Backend, Sequence[Backend]],
+                             checkpoint: Optional[CheckpointStore] = None, sink_kwargs: Optional[dict] = None,
+                             max_requeues: int = DEFAULT_MAX_REQUEUES, **scrape_kwargs) -> GridRunReport:
+    """
+    Scrape each playlist to its file with one session per slot of the Grid nodes (see `grid_utils.GridScheduler`).
+    With a checkpoint store, a playlist whose node is lost resumes from its last checkpoint on another node.
+
+    Args:
+        playlists (Dict[str, str]): Output path by playlist URL, the URL is also the checkpoint target.
+        backends (Backend or Sequence[Backend]): The `GridBackend` or `LocalBackend` instances to run on.
+        checkpoint (CheckpointStore): The checkpoint store, None disables checkpoints.
+        sink_kwargs (dict): Arguments of the sinks (e.g., `fieldnames` for CSV).
+        max_requeues (int): Maximum times a playlist is re-queued after its session was lost.
+        **scrape_kwargs: Arguments of `scrape_list`.
+
+    Returns:
+        GridRunReport: The rows written by playlist URL, the errors and the throughput of each node.
+    """
+    def scrape_playlist(driver: WebDriver, playlist: tuple) -> int:
+        url, path = playlist
+        driver.get(url)
+        return scrape_list_to_file(driver, path, url, checkpoint, sink_kwargs, **scrape_kwargs)
+
+    scheduler = GridScheduler(backends, max_requeues = max_requeues)
+    return scheduler.run(((url, (url, path)) for url, path in playlists.items()), scrape_playlist)
@@ -0,0 +1,195 @@
+"""This page contains a screenshot service that decodes, deduplicates and writes the captures in the background."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+# Import the necessary libraries for the project
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+import base64
+import hashlib
+import os
+import re
+import threading
+import weakref
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the screenshots
+LEVEL_OFF = "off"
+LEVEL_ON_ERROR = "on_error"
+LEVEL_EVERY_STEP = "every_step"
+LEVELS = (LEVEL_OFF, LEVEL_ON_ERROR, LEVEL_EVERY_STEP)
+DEFAULT_DIRECTORY = "screenshots"
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_QUEUE = 32
+
+# Define function to turn a screenshot name into a safe file name
+def _file_name(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") + ".png"
+
+# Class to keep the order and the last hash of the captures of one driver
+class _Stream:
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.submitted = 0
+        self.processed = 0
+        self.last_hash: Optional[str] = None
+
+
+# Class to take screenshots without blocking the flows
+class ScreenshotService:
+    """
+    Take screenshots without blocking the flows. The calling thread only grabs the base64 PNG from the driver;
+    decoding, hashing and writing happen in a thread pool. A step frame identical to the previous capture of the
+    same driver is skipped, error frames are always written. The queue is bounded: when it is full, step frames are dropped while error frames wait.
+
+    Levels:
+        "off": no screenshots.
+        "on_error": only the captures taken with `error()` or inside a failing `on_error()` block.
+        "every_step": every capture.
+
+    Args:
+        directory (str): Directory where the PNG files are written.
+        level (str): The sampling level.
+        workers (int): Threads decoding and writing the frames.
+        max_queue (int): Maximum frames waiting to be written.
+        deduplicate (bool): Skip step frames identical to the previous capture of the same driver if True.
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, level: str = LEVEL_EVERY_STEP, workers: int = DEFAULT_WORKERS,
+                 max_queue: int = DEFAULT_MAX_QUEUE, deduplicate: bool = True) -> None:
+        if level not in LEVELS:
+            raise ValueError(f"Unknown screenshot level {level}, use one of {LEVELS}.")
+        self.directory = directory
+        self.level = level
+        self.deduplicate = deduplicate
+        self._executor = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = "screenshot")
+        self._slots = threading.BoundedSemaphore(max_queue)
+        # Keyed by the driver itself, so the stream of a quit driver goes away with it
+        self._streams: "weakref.WeakKeyDictionary[WebDriver, _Stream]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats = {"captured": 0, "written": 0, "duplicates": 0, "dropped": 0, "skipped": 0, "failed": 0, "bytes": 0}
+        os.makedirs(directory, exist_ok = True)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters of the service: captured, written, duplicates, dropped, skipped (by level), failed and bytes written."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def capture(self, driver: WebDriver, name: str, error: bool = False) -> bool:
+        """
+        Capture the current page if the level allows it and queue it to be written as `<directory>/<name>.png`.
+
+        Args:
+            driver (WebDriver): The Selenium WebDriver instance.
+            name (str): The name of the screenshot (e.g., "artist_page_Queen").
+            error (bool): True if the capture documents an error.
+
+        Returns:
+            bool: True if the frame was queued.
+        """
+        if self.level == LEVEL_OFF or (self.level == LEVEL_ON_ERROR and not error):
+            self._count("skipped")
+            return False
+        if not self._slots.acquire(blocking = error):
+            self._count("dropped")
+            logger.warning("Screenshot queue full, frame %s dropped.", name)
+            return False
+        try:
+            data = driver.get_screenshot_as_base64()
+        except WebDriverException as e_screenshot:
+            self._slots.release()
+            self._count("failed")
+            logger.error("Could not capture the screenshot %s: %s", name, e_screenshot)
+            return False
+        with self._lock:
+            try:
+                stream = self._streams.setdefault(driver, _Stream())
+            except TypeError:
+                # Drivers that cannot be weakly referenced are not deduplicated
+                stream = _Stream()
+            sequence = stream.submitted
+            stream.submitted += 1
+            self._stats["captured"] += 1
+            # Submitted under the lock so the pool receives the frames of a driver in sequence order
+            self._executor.submit(self._process, stream, sequence, name, data, error)
+        return True
+
+    def step(self, driver: WebDriver, name: str) -> bool:
+        """
+        Capture a step of a flow, only at the "every_step" level.
+        """
+        return self.capture(driver, name)
+
+    def error(self, driver: WebDriver, name: str) -> bool:
+        """
+        Capture an error, at the "on_error" and "every_step" levels.
+        """
+        return self.capture(driver, name, error = True)
+
+    @contextmanager
+    def on_error(self, driver: WebDriver, name: str) -> Iterator[None]:
+        """
+        Context manager that captures the page when the block raises, then re-raises the exception.
+        """
+        try:
+            yield
+        except Exception:
+            self.error(driver, name)
+            raise
+
+    def _process(self, stream: _Stream, sequence: int, name: str, data: str, error: bool = False) -> None:
+        png, digest = None, None
+        try:
+            png = base64.b64decode(data)
+            digest = hashlib.blake2b(png, digest_size = 16).hexdigest() if self.deduplicate else None
+        except Exception as e_decode:
+            logger.error("Could not decode the screenshot %s: %s", name, e_decode, exc_info = True)
+        # Frames of the same driver are compared in capture order, even with several workers,
+        # so every frame has to pass here to let the next one through
+        with stream.condition:
+            stream.condition.wait_for(lambda: stream.processed == sequence)
+            # An error frame documents a failure under its own name, even when the page did not change
+            duplicate = not error and digest is not None and digest == stream.last_hash
+            stream.last_hash = digest
+            stream.processed += 1
+            stream.condition.notify_all()
+        try:
+            if png is None:
+                self._count("failed")
+            elif duplicate:
+                self._count("duplicates")
+                logger.debug("Screenshot %s identical to the previous one, skipped.", name)
+            else:
+                path = os.path.join(self.directory, _file_name(name))
+                with open(path, "wb") as file:
+                    file.write(png)
+                self._count("written")
+                self._count("bytes", len(png))
+        except OSError as e_write:
+            self._count("failed")
+            logger.error("Could not write the screenshot %s: %s", name, e_write, exc_info = True)
+        finally:
+            self._slots.release()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop the service, writing the queued frames first if `wait` is True.
+        """
+        self._executor.shutdown(wait = wait)
+        logger.info("Screenshot service closed: %s", self.stats)
+
+    def __enter__(self) -> "ScreenshotService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,217 @@
+"""This page contains a time-bounded scroll-until-found primitive with bottom detection."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException
+# Import the necessary libraries for the project
+from .wait_utils import to_page_selector
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the scrolls
+DEFAULT_TIMEOUT = 10
+DEFAULT_SCROLL_RATIO = 0.8
+DEFAULT_SETTLE_TIME = 0.15
+# Seconds the scrollable area must stay at its bottom without growing before giving up
+DEFAULT_END_TIMEOUT = 1.5
+
+# Script executed in the page: returns the element if it is there, otherwise scrolls the container one step
+SCROLL_STEP_SCRIPT = """
+const [strategy, value, container, ratio, visibleOnly] = arguments;
+function findOne() {
+    if (strategy === null) return null;
+    if (strategy === 'css selector') return document.querySelector(value);
+    return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function isVisible(node) {
+    const style = window.getComputedStyle(node);
+    return style.visibility !== 'hidden' && style.display !== 'none' && node.getClientRects().length > 0;
+}
+const scroller = container || document.scrollingElement || document.documentElement;
+const node = findOne();
+if (node !== null && (!visibleOnly || isVisible(node))) {
+    node.scrollIntoView({block: 'center'});
+    return {element: node, atBottom: false, height: scroller.scrollHeight};
+}
+const atBottom = Math.ceil(scroller.scrollTop + scroller.clientHeight) >= scroller.scrollHeight - 1;
+if (!atBottom) scroller.scrollTop = scroller.scrollTop + Math.max(1, scroller.clientHeight * ratio);
+return {element: null, atBottom: atBottom, height: scroller.scrollHeight};
+"""
+
+# Class with the result and telemetry of a scroll
+@dataclass
+class ScrollResult:
+    """
+    Result of `scroll_until`.
+
+    Args:
+        element (WebElement): The element found, None otherwise.
+        steps (int): Number of scroll steps used.
+        elapsed (float): Seconds spent.
+        reached_bottom (bool): True if the scroll stopped because the bottom of the scrollable area was reached.
+    """
+    element: Optional[WebElement]
+    steps: int
+    elapsed: float
+    reached_bottom: bool = False
+
+    @property
+    def found(self) -> bool:
+        return self.element is not None
+
+
+# Class to track the steps, the time bound and the bottom of a scroll
+class ScrollTracker:
+    """
+    Keep the telemetry of a scroll and decide when it has to stop: when the total time is spent,
+    or when the scrollable area stayed at its bottom without growing for `end_timeout` seconds.
+
+    Args:
+        timeout (float): Maximum seconds of the whole scroll.
+        end_timeout (float): Seconds at the bottom without new content before giving up.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, end_timeout: float = DEFAULT_END_TIMEOUT) -> None:
+        self.timeout = timeout
+        self.end_timeout = end_timeout
+        self.start_time = time.monotonic()
+        self.steps = 0
+        self.reached_bottom = False
+        self._bottom_since: Optional[float] = None
+        self._height: Optional[int] = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    def update(self, step: Dict[str, Any]) -> bool:
+        """
+        Record the result of a `scroll_step` that did not find the element.
+
+        Returns:
+            bool: True if the scroll has to stop.
+        """
+        now = time.monotonic()
+        if step["atBottom"]:
+            # Lazy lists grow when the bottom is reached, only give up when the height stays the same
+            if self._bottom_since is None or step["height"] != self._height:
+                self._bottom_since = now
+            elif now - self._bottom_since >= self.end_timeout:
+                self.reached_bottom = True
+                return True
+        else:
+            self._bottom_since = None
+            self.steps += 1
+        self._height = step["height"]
+        return now - self.start_time >= self.timeout
+
+    def result(self, element: Optional[WebElement] = None) -> ScrollResult:
+        return ScrollResult(element, self.steps, self.elapsed, self.reached_bottom)
+
+
+# Define function to resolve the scroll container
+def _resolve_container(driver: WebDriver, container: Union[WebElement, tuple, None]) -> Optional[WebElement]:
+    if isinstance(container, tuple):
+        elements = driver.find_elements(*container)
+        return elements[0] if elements else None
+    return container
+
+# Define function to run one step of a scroll
+def scroll_step(driver: WebDriver, locator: tuple, container: Union[WebElement, tuple, None] = None,
+                scroll_ratio: float = DEFAULT_SCROLL_RATIO, visible: bool = True) -> Dict[str, Any]:
+    """
+    Check for the element without waiting and, if it is not there, scroll the container one step.
+    Both happen in a single WebDriver command.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        locator (tuple): The locator of the element.
+        container (WebElement or tuple): The scrollable element or its locator, None scrolls the page.
+        scroll_ratio (float): Fraction of the container height scrolled per step.
+        visible (bool): Only accept a visible element if True.
+
+    Returns:
+        dict: "element" (the element scrolled into view, or None), "atBottom" and "height" of the container.
+    """
+    page_selector = to_page_selector(locator)
+    if page_selector is None:
+        # Locators the page cannot query (e.g., link text) are checked from Python
+        elements = driver.find_elements(*locator)
+        if elements and (not visible or elements[0].is_displayed()):
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", elements[0])
+            return {"element": elements[0], "atBottom": False, "height": None}
+        page_selector = (None, None)
+    return driver.execute_script(SCROLL_STEP_SCRIPT, page_selector[0], page_selector[1],
+                                 _resolve_container(driver, container), scroll_ratio, visible)
+
+# Define function to scroll until an element is found
+def scroll_until(driver: WebDriver, locator: tuple, container: Union[WebElement, tuple, None] = None,
+                 timeout: float = DEFAULT_TIMEOUT, scroll_ratio: float = DEFAULT_SCROLL_RATIO,
+                 settle_time: float = DEFAULT_SETTLE_TIME, end_timeout: float = DEFAULT_END_TIMEOUT,
+                 visible: bool = True) -> ScrollResult:
+    """
+    Scroll the page or a container until an element is found, the bottom is reached or the time is spent.
+    Each step checks for the element without waiting, so a missing element costs at most `timeout` in total
+    instead of a full wait per scroll.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        locator (tuple): The locator of the element.
+        container (WebElement or tuple): The scrollable element or its locator, None scrolls the page.
+        timeout (float): Maximum seconds of the whole scroll.
+        scroll_ratio (float): Fraction of the container height scrolled per step.
+        settle_time (float): Seconds to let lazy content render after each step.
+        end_timeout (float): Seconds at the bottom without new content before giving up.
+        visible (bool): Only accept a visible element if True.
+
+    Returns:
+        ScrollResult: The element (None if not found), the scroll steps used and the time spent.
+    """
+    tracker = ScrollTracker(timeout, end_timeout)
+    container_element = _resolve_container(driver, container)
+    while True:
+        step = scroll_step(driver, locator, container_element, scroll_ratio, visible)
+        if step["element"] is not None:
+            result = tracker.result(step["element"])
+            logger.info("Element %s found after %s scroll steps in %.2fs", locator, result.steps, result.elapsed)
+            return result
+        if tracker.update(step):
+            result = tracker.result()
+            reason = "the bottom was reached" if result.reached_bottom else f"{timeout}s"
+            logger.error("Element %s not found after %s scroll steps: %s.", locator, result.steps, reason)
+            return result
+        time.sleep(settle_time)
+
+# Define function to build a wait condition that scrolls until an element is found
+def scroll_condition(locator: tuple, container: Union[WebElement, tuple, None] = None,
+                     timeout: float = DEFAULT_TIMEOUT, scroll_ratio: float = DEFAULT_SCROLL_RATIO,
+                     end_timeout: float = DEFAULT_END_TIMEOUT, visible: bool = True) -> Callable[[WebDriver], Any]:
+    """
+    Build a wait condition that runs one scroll step per check, for `WebDriverWait.until` or the tab scheduler.
+
+    Returns:
+        Callable: Condition returning the element once found, False otherwise.
+
+    Raises:
+        TimeoutException: From the condition, when the bottom is reached or the time is spent.
+    """
+    trackers = []
+
+    def condition(driver: WebDriver) -> Any:
+        if not trackers:
+            # The time bound starts with the first check, not when the condition is built
+            trackers.append(ScrollTracker(timeout, end_timeout))
+        step = scroll_step(driver, locator, container, scroll_ratio, visible)
+        if step["element"] is not None:
+            return step["element"]
+        if trackers[0].update(step):
+            raise TimeoutException(f"Element {locator} not found after {trackers[0].steps} scroll steps.")
+        return False
+
+    return condition
@@ -0,0 +1,257 @@
+"""This page contains a versioned, expiry-aware session store shared by the workers of several accounts."""
+
+# Import the necessary libraries for the project
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import os
+import pickle
+import threading
+import time
+import logging
+
+try:
+    import fcntl
+except ImportError:
+    # Windows has no fcntl, msvcrt locks the first byte of the lock file instead
+    fcntl = None
+    import msvcrt
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the session store
+SCHEMA_VERSION = 1
+DEFAULT_STORE_PATH = os.path.join("cookies", "sessions.json")
+# Seconds before the earliest cookie expiry at which a session is rejected
+DEFAULT_EXPIRY_MARGIN = 60
+# Cookie keys dropped from the store when they hold the WebDriver default value
+COOKIE_DEFAULTS = {"path": "/", "secure": False, "httpOnly": False}
+
+# Define function to drop the default values of a cookie
+def _compact_cookie(cookie: dict) -> dict:
+    return {key: value for key, value in cookie.items()
+            if value is not None and COOKIE_DEFAULTS.get(key, not value) != value}
+
+# Define function to get the earliest expiry of a list of cookies
+def earliest_expiry(cookies: List[dict]) -> Optional[float]:
+    """
+    Get the earliest expiry of the persistent cookies.
+
+    Args:
+        cookies (List[dict]): The cookies, as returned by `driver.get_cookies()`.
+
+    Returns:
+        float: Epoch seconds of the earliest expiry, None if every cookie is a session cookie.
+    """
+    expiries = [cookie["expiry"] for cookie in cookies if cookie.get("expiry")]
+    return float(min(expiries)) if expiries else None
+
+# Class to keep the sessions of many accounts in one JSON file
+class SessionStore:
+    """
+    Keep the cookies and storage of many accounts in one compact JSON file:
+
+        {"version": 1, "accounts": {"<username>": {"saved_at": ..., "expires_at": ..., "cookies": [...],
+                                                   "local_storage": {...}, "session_storage": {...}}}}
+
+    `expires_at` is the earliest expiry of the persistent cookies, so a dead session is rejected by `load`
+    without starting a browser. Every write replaces the file atomically under an exclusive lock of a
+    `<path>.lock` file, and reads take a shared lock, so parallel workers can share the same store.
+
+    Args:
+        path (str): Path of the JSON file.
+        expiry_margin (float): Seconds before the expiry at which a session is rejected.
+
+    Raises:
+        ValueError: If the file was written with a newer schema version.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, expiry_margin: float = DEFAULT_EXPIRY_MARGIN) -> None:
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.expiry_margin = expiry_margin
+        self._thread_lock = threading.Lock()
+        # Parsed content of the file, reused while its modification time and size do not change
+        self._cache_key: Optional[tuple] = None
+        self._cache: Dict[str, Any] = {}
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok = True)
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        with self._thread_lock, open(self.lock_path, "a+") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            file_stat = os.stat(self.path)
+        except FileNotFoundError:
+            return {}
+        cache_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        if cache_key == self._cache_key:
+            return self._cache
+        try:
+            with open(self.path, "r", encoding = "utf-8") as file:
+                content = json.load(file)
+        except json.JSONDecodeError as e_json:
+            logger.error("Session store %s is corrupted, ignoring it: %s", self.path, e_json)
+            return {}
+        version = content.get("version", 0)
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"Session store {self.path} has schema version {version}, "
+                             f"this version only reads up to {SCHEMA_VERSION}.")
+        self._cache_key, self._cache = cache_key, content.get("accounts", {})
+        return self._cache
+
+    def _write(self, accounts: Dict[str, Any]) -> None:
+        temporary_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "w", encoding = "utf-8") as file:
+            json.dump({"version": SCHEMA_VERSION, "accounts": accounts}, file, separators = (",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.path)
+        self._cache_key = None
+
+    def save(self, username: str, cookies: List[dict], local_storage: Optional[Dict[str, str]] = None,
+             session_storage: Optional[Dict[str, str]] = None, saved_at: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Save the session of an account, replacing the previous one.
+
+        Args:
+            username (str): The Spotify username.
+            cookies (List[dict]): The cookies, as returned by `driver.get_cookies()`.
+            local_storage (Dict[str, str]): The localStorage items of the session.
+            session_storage (Dict[str, str]): The sessionStorage items of the session.
+            saved_at (float): Epoch seconds the session was validated, now by default.
+
+        Returns:
+            dict: The stored record.
+        """
+        record = {
+            "saved_at": saved_at if saved_at is not None else time.time(),
+            "expires_at": earliest_expiry(cookies),
+            "cookies": [_compact_cookie(cookie) for cookie in cookies],
+            "local_storage": dict(local_storage or {}),
+            "session_storage": dict(session_storage or {}),
+        }
+        with self._locked(exclusive = True):
+            accounts = dict(self._read())
+            accounts[username] = record
+            self._write(accounts)
+        logger.info("Session of %s saved on: %s", username, self.path)
+        return record
+
+    def is_expired(self, record: Dict[str, Any], now: Optional[float] = None) -> bool:
+        """
+        Check if a stored session expired.
+
+        Args:
+            record (dict): A record returned by `load` or `save`.
+            now (float): Epoch seconds to compare with, now by default.
+
+        Returns:
+            bool: True if the earliest cookie expiry (minus the margin) has passed.
+        """
+        now = time.time() if now is None else now
+        expires_at = record.get("expires_at")
+        return expires_at is not None and now >= expires_at - self.expiry_margin
+
+    def load(self, username: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the session of an account.
+
+        Args:
+            username (str): The Spotify username.
+
+        Returns:
+            dict: The saved_at, expires_at, cookies, local_storage and session_storage of the session,
+            None if there is no session or it expired.
+        """
+        with self._locked(exclusive = False):
+            record = self._read().get(username)
+        if record is None:
+            return None
+        if self.is_expired(record):
+            logger.info("Stored session of %s expired, it will not be restored.", username)
+            return None
+        cookies = [{**COOKIE_DEFAULTS, **cookie} for cookie in record["cookies"]]
+        return {**record, "cookies": cookies}
+
+    def remove(self, username: str) -> bool:
+        """
+        Remove the session of an account.
+
+        Args:
+            username (str): The Spotify username.
+
+        Returns:
+            bool: True if a session was removed.
+        """
+        with self._locked(exclusive = True):
+            accounts = dict(self._read())
+            if accounts.pop(username, None) is None:
+                return False
+            self._write(accounts)
+        return True
+
+    def accounts(self, include_expired: bool = False) -> List[str]:
+        """
+        List the accounts with a stored session.
+
+        Args:
+            include_expired (bool): Also list the accounts whose session expired if True.
+
+        Returns:
+            List[str]: The usernames.
+        """
+        with self._locked(exclusive = False):
+            accounts = self._read()
+        return [username for username, record in accounts.items() if include_expired or not self.is_expired(record)]
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired session.
+
+        Returns:
+            int: The number of removed sessions.
+        """
+        with self._locked(exclusive = True):
+            accounts = self._read()
+            alive = {username: record for username, record in accounts.items() if not self.is_expired(record)}
+            removed = len(accounts) - len(alive)
+            if removed:
+                self._write(alive)
+        logger.info("%s expired sessions removed from: %s", removed, self.path)
+        return removed
+
+    def import_pickle(self, username: str, filename_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Import the cookies saved by `auth_utils.save_cookies` (e.g., `cookies/cookies.pkl`) as the session of an account.
+
+        Args:
+            username (str): The Spotify username.
+            filename_path (str): The path of the pickle file.
+
+        Returns:
+            dict: The stored record, None if the file could not be read.
+        """
+        try:
+            with open(filename_path, "rb") as file:
+                cookies = pickle.load(file)
+        except (OSError, pickle.UnpicklingError) as e_file:
+            logger.error("Could not read the cookies file %s: %s", filename_path, e_file, exc_info = True)
+            return None
+        return self.save(username, cookies, saved_at = os.path.getmtime(filename_path))
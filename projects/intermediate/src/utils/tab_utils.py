@@ -0,0 +1,201 @@
+"""This page contains a scheduler that interleaves several flows across the tabs of a single browser."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, WebDriverException
+# Import the necessary libraries for the project
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generator, Hashable, Iterable, List, Optional, Tuple
+import time
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the scheduler
+DEFAULT_TABS = 4
+DEFAULT_JOB_TIMEOUT = 60.0
+DEFAULT_POLL_INTERVAL = 0.05
+# Exceptions that mean "not ready yet" while checking a condition, as in WebDriverWait
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Class to keep the state of the flow running in a tab
+@dataclass
+class _TabJob:
+    key: Hashable
+    steps: Generator
+    condition: Optional[Callable[[WebDriver], Any]] = None
+    deadline: float = 0.0
+
+
+# Class with the results of a scheduler run
+@dataclass
+class TabRunReport:
+    """
+    Results of a `TabScheduler` run.
+
+    Args:
+        tabs (int): Number of tabs used.
+        results (Dict[Hashable, Any]): Return value of each finished flow, by key.
+        errors (Dict[Hashable, str]): Error message of each failed flow, by key.
+        elapsed (float): Wall time of the run in seconds.
+    """
+    tabs: int
+    results: Dict[Hashable, Any] = field(default_factory = dict)
+    errors: Dict[Hashable, str] = field(default_factory = dict)
+    elapsed: float = 0.0
+
+    @property
+    def items_per_minute(self) -> float:
+        return len(self.results) / self.elapsed * 60 if self.elapsed else 0.0
+
+
+# Class to run several step flows at once in the tabs of one browser
+class TabScheduler:
+    """
+    Run several flows at once in K tabs of the same browser.
+
+    A flow is a generator (see `artist_utils.artist_info_steps`) that yields a wait condition each time it
+    has to wait. The scheduler starts up to `tabs` flows, then round-robins between the tab handles: it
+    switches to a tab, checks its pending condition once without waiting and, if it is met, resumes the
+    flow until its next wait. While a page loads in one tab, the others keep working. Drivers with the
+    eager or none page load strategy (e.g., the scrape profile) overlap best.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        tabs (int): Number of flows running at the same time.
+        job_timeout (float): Maximum seconds per flow.
+        poll_interval (float): Seconds to sleep when no tab made progress in a round.
+    """
+
+    def __init__(self, driver: WebDriver, tabs: int = DEFAULT_TABS, job_timeout: float = DEFAULT_JOB_TIMEOUT,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        if tabs < 1:
+            raise ValueError("The scheduler needs at least 1 tab.")
+        self.driver = driver
+        self.tabs = tabs
+        self.job_timeout = job_timeout
+        self.poll_interval = poll_interval
+        self._on_result: Optional[Callable[[Hashable, Any], None]] = None
+        self._on_error: Optional[Callable[[Hashable, str], None]] = None
+
+    def run(self, items: Iterable[Tuple[Hashable, Any]], flow: Callable[[WebDriver, Any], Generator],
+            on_result: Optional[Callable[[Hashable, Any], None]] = None,
+            on_error: Optional[Callable[[Hashable, str], None]] = None) -> TabRunReport:
+        """
+        Run a flow for each item, interleaved across the tabs. The results are matched back to the item keys.
+
+        Args:
+            items (Iterable[Tuple[Hashable, Any]]): Pairs of (key, item), e.g. `(artist, artist)`.
+            flow (Callable): Function `(driver, item) -> generator` creating the steps of an item.
+            on_result (Callable): Called with `(key, result)` as each flow finishes.
+            on_error (Callable): Called with `(key, error)` as each flow fails or times out.
+
+        Returns:
+            TabRunReport: Results and errors by key, and the throughput of the run.
+        """
+        report = TabRunReport(tabs = self.tabs)
+        pending = deque(items)
+        active: Dict[str, _TabJob] = {}
+        origin_handle = self.driver.current_window_handle
+        self._on_result = on_result
+        self._on_error = on_error
+        logger.info("Running %s flows across %s tabs...", len(pending), self.tabs)
+        start_time = time.perf_counter()
+
+        try:
+            # Open the tabs and start the first flows
+            while pending and len(active) < self.tabs:
+                self.driver.switch_to.new_window("tab")
+                handle = self.driver.current_window_handle
+                self._start_next(handle, pending, active, report, flow)
+
+            while active:
+                progressed = False
+                for handle in list(active):
+                    job = active[handle]
+                    self.driver.switch_to.window(handle)
+                    if time.monotonic() > job.deadline:
+                        report.errors[job.key] = f"Flow timed out after {self.job_timeout}s."
+                        logger.error("Flow %s timed out.", job.key)
+                        self._notify(self._on_error, job.key, report.errors[job.key])
+                        job.steps.close()
+                        self._start_next(handle, pending, active, report, flow)
+                        continue
+                    try:
+                        value = job.condition(self.driver)
+                    except IGNORED_EXCEPTIONS:
+                        value = False
+                    except Exception as e_condition:
+                        self._fail(job, e_condition, report)
+                        self._start_next(handle, pending, active, report, flow)
+                        continue
+                    if value:
+                        progressed = True
+                        if self._advance(job, value, report):
+                            self._start_next(handle, pending, active, report, flow)
+                if not progressed:
+                    time.sleep(self.poll_interval)
+        finally:
+            # Close every tab opened by the scheduler and go back to the original one
+            for handle, job in list(active.items()):
+                job.steps.close()
+                self._close_tab(handle)
+            # A dead driver must not hide the exception that stopped the run
+            try:
+                self.driver.switch_to.window(origin_handle)
+            except WebDriverException as e_switch:
+                logger.warning("Could not switch back to the original tab: %s", e_switch)
+
+        report.elapsed = time.perf_counter() - start_time
+        logger.info("%s flows finished, %s failed in %.1fs (%.1f items/minute, %s tabs).",
+                    len(report.results), len(report.errors), report.elapsed, report.items_per_minute, self.tabs)
+        return report
+
+    def _start_next(self, handle: str, pending: deque, active: Dict[str, _TabJob], report: TabRunReport,
+                    flow: Callable[[WebDriver, Any], Generator]) -> None:
+        # Reuse the tab for the next pending item, or close it when there is nothing left
+        active.pop(handle, None)
+        while pending:
+            key, item = pending.popleft()
+            job = _TabJob(key = key, steps = flow(self.driver, item), deadline = time.monotonic() + self.job_timeout)
+            if not self._advance(job, None, report):
+                active[handle] = job
+                return
+        self._close_tab(handle)
+
+    def _advance(self, job: _TabJob, value: Any, report: TabRunReport) -> bool:
+        # Resume the flow until its next wait, returns True when the flow is finished
+        try:
+            job.condition = job.steps.send(value)
+            return False
+        except StopIteration as e_finished:
+            report.results[job.key] = e_finished.value
+            logger.info("Flow %s finished.", job.key)
+            self._notify(self._on_result, job.key, e_finished.value)
+        except Exception as e_flow:
+            self._fail(job, e_flow, report)
+        return True
+
+    def _fail(self, job: _TabJob, error: Exception, report: TabRunReport) -> None:
+        report.errors[job.key] = f"{type(error).__name__}: {error}"
+        logger.error("Flow %s failed: %s", job.key, error)
+        job.steps.close()
+        self._notify(self._on_error, job.key, report.errors[job.key])
+
+    @staticmethod
+    def _notify(callback: Optional[Callable[[Hashable, Any], None]], key: Hashable, value: Any) -> None:
+        # A failing sink or checkpoint must not stop the flows of the other tabs
+        if callback:
+            try:
+                callback(key, value)
+            except Exception as e_callback:
+                logger.error("Result callback failed for %s: %s", key, e_callback, exc_info = True)
+
+    def _close_tab(self, handle: str) -> None:
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except Exception as e_close:
+            logger.warning("Error closing the tab %s: %s", handle, e_close)
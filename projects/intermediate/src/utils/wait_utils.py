@@ -0,0 +1,166 @@
+"""This page contains an event-driven wait engine that uses a MutationObserver instead of polling."""
+
+# Import all the necessary libraries from Selenium
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+# Import the necessary libraries for the project
+from typing import List, Optional, Tuple, Union
+import time
+import weakref
+import logging
+
+# Set up logging configuration
+logger = logging.getLogger(__name__)
+
+# Constants values for the waits
+DEFAULT_TIMEOUT = 10
+# Extra seconds given to the async script on top of the wait timeout
+SCRIPT_TIMEOUT_MARGIN = 2
+# Milliseconds between two checks that no mutation triggers (e.g., a stylesheet or layout change making a node visible)
+RECHECK_INTERVAL_MS = 500
+
+# Script timeout known for each driver, so it is only read once and only raised when a wait needs it
+_script_timeouts: "weakref.WeakKeyDictionary[WebDriver, float]" = weakref.WeakKeyDictionary()
+
+# Script executed in the page: resolves as soon as the locator matches, checking again on every DOM mutation
+WAIT_FOR_LOCATOR_SCRIPT = """
+const [strategy, value, timeoutMs, visible, all, recheckMs] = arguments;
+const done = arguments[arguments.length - 1];
+function isVisible(node) {
+    if (!node.isConnected) return false;
+    const style = window.getComputedStyle(node);
+    return style.visibility !== 'hidden' && style.display !== 'none' && node.getClientRects().length > 0;
+}
+function query() {
+    let nodes;
+    if (strategy === 'css selector') {
+        nodes = all ? Array.from(document.querySelectorAll(value)) : [document.querySelector(value)].filter((node) => node !== null);
+    } else {
+        const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        nodes = [];
+        for (let i = 0; i < snapshot.snapshotLength && (all || nodes.length === 0); i++) nodes.push(snapshot.snapshotItem(i));
+    }
+    if (visible) nodes = nodes.filter(isVisible);
+    if (nodes.length === 0) return null;
+    return all ? nodes : nodes[0];
+}
+let finished = false;
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(recheck);
+    done(result);
+}
+function check() {
+    const result = query();
+    if (result !== null) finish(result);
+}
+// Attribute and text edits can make a locator match too (e.g., [aria-expanded='true'] or text() = '...')
+const observer = new MutationObserver(check);
+const timer = setTimeout(() => finish(null), timeoutMs);
+const recheck = setInterval(check, recheckMs);
+const initial = query();
+if (initial !== null) {
+    finish(initial);
+} else {
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+"""
+
+# Define function to translate a locator to the CSS or XPath understood by the in-page script
+def to_page_selector(locator: tuple) -> Optional[Tuple[str, str]]:
+    """
+    Translate a Selenium locator to a (strategy, value) pair the in-page script understands.
+
+    Args:
+        locator (tuple): A tuple containing the locator strategy and value (e.g., (By.ID, "element_id")).
+
+    Returns:
+        tuple: (By.CSS_SELECTOR or By.XPATH, value), None if the strategy cannot be translated (e.g., link text).
+    """
+    strategy, value = locator
+    if strategy in (By.CSS_SELECTOR, By.XPATH):
+        return strategy, value
+    if strategy == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if strategy == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if strategy == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    if strategy == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    return None
+
+# Define function to wait for a locator with polling, used as fallback
+def poll_for_locator(driver: WebDriver, locator: tuple, timeout: float = DEFAULT_TIMEOUT, visible: bool = False,
+                     all: bool = False, poll_frequency: float = 0.5) -> Union[WebElement, List[WebElement], None]:
+    """
+    Wait for a locator by polling with `WebDriverWait`.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        locator (tuple): A tuple containing the locator strategy and value.
+        timeout (float): The maximum time to wait.
+        visible (bool): Wait for visibility instead of presence if True.
+        all (bool): Return every matching element instead of the first one if True.
+        poll_frequency (float): Seconds between two checks.
+
+    Returns:
+        WebElement or List[WebElement]: The element(s) found, None on timeout.
+    """
+    if all:
+        condition = EC.visibility_of_all_elements_located(locator) if visible else EC.presence_of_all_elements_located(locator)
+    else:
+        condition = EC.visibility_of_element_located(locator) if visible else EC.presence_of_element_located(locator)
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency = poll_frequency).until(condition)
+    except TimeoutException:
+        return None
+
+# Define function to wait for a locator with a MutationObserver
+def wait_for_locator(driver: WebDriver, locator: tuple, timeout: float = DEFAULT_TIMEOUT, visible: bool = False,
+                     all: bool = False) -> Union[WebElement, List[WebElement], None]:
+    """
+    Wait for a locator with a MutationObserver installed in the page: the call blocks once in an async script
+    and returns as soon as a DOM mutation makes the locator match, instead of up to one polling interval later.
+    Falls back to polling when the locator cannot be translated or the async script fails.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        locator (tuple): A tuple containing the locator strategy and value.
+        timeout (float): The maximum time to wait.
+        visible (bool): Wait for visibility instead of presence if True.
+        all (bool): Return every matching element instead of the first one if True.
+
+    Returns:
+        WebElement or List[WebElement]: The element(s) found, None on timeout.
+    """
+    page_selector = to_page_selector(locator)
+    if page_selector is None:
+        logger.debug("Locator %s not supported by the event-driven wait, polling instead.", locator)
+        return poll_for_locator(driver, locator, timeout, visible, all)
+    deadline = time.monotonic() + timeout
+    try:
+        _ensure_script_timeout(driver, timeout + SCRIPT_TIMEOUT_MARGIN)
+        return driver.execute_async_script(WAIT_FOR_LOCATOR_SCRIPT, page_selector[0], page_selector[1],
+                                           int(timeout * 1000), visible, all, RECHECK_INTERVAL_MS)
+    except WebDriverException as e_script:
+        # The page navigated or the script was not allowed, poll for the rest of the timeout
+        logger.warning("Event-driven wait failed, polling instead: %s", e_script)
+        return poll_for_locator(driver, locator, max(0.0, deadline - time.monotonic()), visible, all)
+
+# Define function to make sure the async script timeout is long enough for a wait
+def _ensure_script_timeout(driver: WebDriver, seconds: float) -> None:
+    current = _script_timeouts.get(driver)
+    if current is None:
+        current = driver.timeouts.script
+    if current < seconds:
+        driver.set_script_timeout(seconds)
+        current = seconds
+    _script_timeouts[driver] = current